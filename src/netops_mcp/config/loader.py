@@ -30,12 +30,33 @@ def load_config(config_path: Optional[str] = None) -> Config:
     if config_path and os.path.exists(config_path):
         try:
             with open(config_path) as f:
-                config_data = json.load(f)
-                return Config(**config_data)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in config file: {e}")
-        except Exception as e:
+                text = f.read()
+        except OSError as e:
             raise ValueError(f"Failed to load config: {e}")
+        return load_config_from_str(text)
 
     # Otherwise, use default configuration
     return Config()
+
+
+def load_config_from_str(text: str) -> Config:
+    """Load and validate configuration from a JSON document.
+
+    Args:
+        text: JSON configuration text
+
+    Returns:
+        Config object containing validated configuration
+
+    Raises:
+        ValueError: If configuration is invalid or missing required fields
+    """
+    try:
+        config_data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in config file: {e}")
+
+    try:
+        return Config(**config_data)
+    except Exception as e:
+        raise ValueError(f"Failed to load config: {e}")
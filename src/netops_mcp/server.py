@@ -19,7 +19,8 @@ import json
 import os
 import sys
 import signal
-from typing import Optional, List, Annotated
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional, List, Annotated
 
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.tools import Tool
@@ -33,7 +34,7 @@ from .tools.network.connectivity_tools import ConnectivityTools
 from .tools.network.dns_tools import DNSTools
 from .tools.network.discovery_tools import DiscoveryTools
 from .tools.system.network_tools import NetworkTools
-from .tools.system.monitoring_tools import MonitoringTools
+from .tools.system.monitoring_tools import MonitoringTools, METRICS_REFRESH_INTERVAL
 from .tools.security.scanning_tools import ScanningTools
 from .utils.system_check import check_required_tools as check_tools_status, get_system_info
 
@@ -62,14 +63,26 @@ class NetOpsMCPServer:
         self.dns_tools = DNSTools()
         self.discovery_tools = DiscoveryTools()
         self.network_tools = NetworkTools()
-        self.monitoring_tools = MonitoringTools()
+        self.monitoring_tools = MonitoringTools(refresh_interval=METRICS_REFRESH_INTERVAL)
         self.scanning_tools = ScanningTools()
         
         # Initialize MCP server
-        self.mcp = FastMCP("NetOpsMCP")
+        self.mcp = FastMCP("NetOpsMCP", lifespan=self._lifespan)
         self._tests_passed: Optional[bool] = None
         self._setup_tools()
 
+    @asynccontextmanager
+    async def _lifespan(self, app: Any) -> AsyncIterator[None]:
+        """Release tool resources when the MCP server shuts down.
+
+        Args:
+            app: The FastMCP server instance
+        """
+        try:
+            yield
+        finally:
+            await self.http_tools.close()
+
     def _test_system_requirements(self) -> None:
         """Test system requirements and required tools."""
         try:
@@ -77,7 +90,7 @@ class NetOpsMCPServer:
             
             # Check required tools
             tool_status = check_tools_status()
-            missing_tools = [tool for tool, available in tool_status.items() if not available]
+            missing_tools = tool_status['missing_tools']
             
             if missing_tools:
                 self.logger.warning(f"Missing tools: {', '.join(missing_tools)}")
@@ -104,9 +117,10 @@ class NetOpsMCPServer:
             method: Annotated[str, Field(description="HTTP method", default="GET")] = "GET",
             headers: Annotated[Optional[dict], Field(description="HTTP headers")] = None,
             data: Annotated[Optional[str], Field(description="Request body")] = None,
-            timeout: Annotated[int, Field(description="Timeout in seconds", default=30)] = 30
+            timeout: Annotated[int, Field(description="Timeout in seconds", default=30)] = 30,
+            max_body: Annotated[int, Field(description="Maximum response body characters returned", default=1048576)] = 1048576
         ):
-            return self.http_tools.curl_request(url, method, headers, data, timeout)
+            return self.http_tools.curl_request(url, method, headers, data, timeout, max_body)
 
         @self.mcp.tool(description="Execute HTTP request using httpie")
         def httpie_request(
@@ -124,91 +138,118 @@ class NetOpsMCPServer:
             method: Annotated[str, Field(description="HTTP method", default="GET")] = "GET",
             expected_status: Annotated[int, Field(description="Expected HTTP status", default=200)] = 200,
             headers: Annotated[Optional[dict], Field(description="HTTP headers")] = None,
+            timeout: Annotated[int, Field(description="Timeout in seconds", default=30)] = 30,
+            max_body: Annotated[int, Field(description="Maximum response body characters returned", default=1048576)] = 1048576
+        ):
+            return self.http_tools.api_test(url, method, expected_status, headers, timeout, max_body)
+
+        @self.mcp.tool(description="Test many API endpoints with a single parallel curl run")
+        def api_test_bulk(
+            cases: Annotated[List[dict], Field(description="Test cases with url and optional method, expected_status and headers")],
+            timeout: Annotated[int, Field(description="Timeout in seconds per request", default=30)] = 30
+        ):
+            return self.http_tools.api_test_bulk(cases, timeout)
+
+        @self.mcp.tool(description="Execute HTTP requests against many URLs concurrently")
+        async def bulk_request(
+            urls: Annotated[List[str], Field(description="Target URLs")],
+            method: Annotated[str, Field(description="HTTP method", default="GET")] = "GET",
+            headers: Annotated[Optional[dict], Field(description="HTTP headers")] = None,
             timeout: Annotated[int, Field(description="Timeout in seconds", default=30)] = 30
         ):
-            return self.http_tools.api_test(url, method, expected_status, headers, timeout)
+            return await self.http_tools.bulk_request(urls, method, headers, timeout)
 
         # Network Connectivity Tools
         @self.mcp.tool(description="Ping a host to test connectivity")
-        def ping_host(
+        async def ping_host(
             host: Annotated[str, Field(description="Target host")],
             count: Annotated[int, Field(description="Number of ping packets", default=4)] = 4,
             timeout: Annotated[int, Field(description="Timeout in seconds", default=10)] = 10
         ):
-            return self.connectivity_tools.ping_host(host, count, timeout)
+            return await self.connectivity_tools.ping_host(host, count, timeout)
+
+        @self.mcp.tool(description="Ping several hosts in one batch")
+        async def ping_hosts(
+            hosts: Annotated[List[str], Field(description="Target hosts")],
+            count: Annotated[int, Field(description="Number of ping packets per host", default=4)] = 4,
+            timeout: Annotated[int, Field(description="Timeout in seconds per packet", default=10)] = 10
+        ):
+            return await self.connectivity_tools.ping_hosts(hosts, count, timeout)
 
         @self.mcp.tool(description="Perform traceroute to a target")
-        def traceroute_path(
+        async def traceroute_path(
             target: Annotated[str, Field(description="Target host")],
             max_hops: Annotated[int, Field(description="Maximum number of hops", default=30)] = 30,
             timeout: Annotated[int, Field(description="Timeout in seconds", default=30)] = 30
         ):
-            return self.connectivity_tools.traceroute_path(target, max_hops, timeout)
+            return await self.connectivity_tools.traceroute_path(target, max_hops, timeout)
 
         @self.mcp.tool(description="Monitor network path using mtr")
-        def mtr_monitor(
+        async def mtr_monitor(
             target: Annotated[str, Field(description="Target host")],
             count: Annotated[int, Field(description="Number of probes", default=10)] = 10,
             timeout: Annotated[int, Field(description="Timeout in seconds", default=30)] = 30
         ):
-            return self.connectivity_tools.mtr_monitor(target, count, timeout)
+            return await self.connectivity_tools.mtr_monitor(target, count, timeout)
 
         @self.mcp.tool(description="Test port connectivity using telnet")
-        def telnet_connect(
+        async def telnet_connect(
             host: Annotated[str, Field(description="Target host")],
             port: Annotated[int, Field(description="Target port")],
             timeout: Annotated[int, Field(description="Timeout in seconds", default=10)] = 10
         ):
-            return self.connectivity_tools.telnet_connect(host, port, timeout)
+            return await self.connectivity_tools.telnet_connect(host, port, timeout)
 
         @self.mcp.tool(description="Test port connectivity using netcat")
-        def netcat_test(
+        async def netcat_test(
             host: Annotated[str, Field(description="Target host")],
             port: Annotated[int, Field(description="Target port")],
             timeout: Annotated[int, Field(description="Timeout in seconds", default=10)] = 10
         ):
-            return self.connectivity_tools.netcat_test(host, port, timeout)
+            return await self.connectivity_tools.netcat_test(host, port, timeout)
 
         # DNS Tools
         @self.mcp.tool(description="Perform DNS lookup using nslookup")
-        def nslookup_query(
+        async def nslookup_query(
             domain: Annotated[str, Field(description="Domain to lookup")],
             record_type: Annotated[str, Field(description="DNS record type", default="A")] = "A",
             server: Annotated[Optional[str], Field(description="DNS server")] = None
         ):
-            return self.dns_tools.nslookup_query(domain, record_type, server)
+            return await self.dns_tools.nslookup_query(domain, record_type, server)
 
         @self.mcp.tool(description="Perform DNS lookup using dig")
-        def dig_query(
+        async def dig_query(
             domain: Annotated[str, Field(description="Domain to lookup")],
             record_type: Annotated[str, Field(description="DNS record type", default="A")] = "A",
             server: Annotated[Optional[str], Field(description="DNS server")] = None
         ):
-            return self.dns_tools.dig_query(domain, record_type, server)
+            return await self.dns_tools.dig_query(domain, record_type, server)
 
         @self.mcp.tool(description="Perform DNS lookup using host")
-        def host_lookup(
+        async def host_lookup(
             domain: Annotated[str, Field(description="Domain to lookup")],
             record_type: Annotated[str, Field(description="DNS record type", default="A")] = "A"
         ):
-            return self.dns_tools.host_lookup(domain, record_type)
+            return await self.dns_tools.host_lookup(domain, record_type)
 
         # Network Discovery Tools
         @self.mcp.tool(description="Scan network using nmap")
-        def nmap_scan(
+        async def nmap_scan(
             target: Annotated[str, Field(description="Target host or network")],
             ports: Annotated[Optional[str], Field(description="Port range (e.g., '22,80,443')")] = None,
             scan_type: Annotated[str, Field(description="Scan type", default="basic")] = "basic",
-            timeout: Annotated[int, Field(description="Timeout in seconds", default=300)] = 300
+            timeout: Annotated[int, Field(description="Timeout in seconds", default=300)] = 300,
+            force: Annotated[bool, Field(description="Bypass cached scan results", default=False)] = False
         ):
-            return self.discovery_tools.nmap_scan(target, ports, scan_type, timeout)
+            return await self.discovery_tools.nmap_scan(target, ports, scan_type, timeout, force)
 
         @self.mcp.tool(description="Discover network services")
-        def service_discovery(
+        async def service_discovery(
             target: Annotated[str, Field(description="Target host")],
-            ports: Annotated[Optional[str], Field(description="Port range")] = None
+            ports: Annotated[Optional[str], Field(description="Port range")] = None,
+            force: Annotated[bool, Field(description="Bypass cached scan results", default=False)] = False
         ):
-            return self.discovery_tools.service_discovery(target, ports)
+            return await self.discovery_tools.service_discovery(target, ports, force)
 
         # System Network Tools
         @self.mcp.tool(description="Show network connections using ss")
@@ -250,8 +291,10 @@ class NetOpsMCPServer:
             return self.monitoring_tools.memory_usage()
 
         @self.mcp.tool(description="Get disk usage information")
-        def disk_usage():
-            return self.monitoring_tools.disk_usage()
+        def disk_usage(
+            local_only: Annotated[bool, Field(description="Skip network and other non-local filesystems", default=True)] = True
+        ):
+            return self.monitoring_tools.disk_usage(local_only)
 
         @self.mcp.tool(description="List running processes")
         def process_list(
@@ -264,16 +307,30 @@ class NetOpsMCPServer:
         def port_scan(
             target: Annotated[str, Field(description="Target host")],
             ports: Annotated[str, Field(description="Port range (e.g., '1-1000')")],
-            timeout: Annotated[int, Field(description="Timeout in seconds", default=60)] = 60
+            timeout: Annotated[int, Field(description="Timeout in seconds", default=60)] = 60,
+            backend: Annotated[str, Field(description="Scanner backend (auto, nmap, masscan)", default="auto")] = "auto",
+            rate: Annotated[int, Field(description="masscan packets per second (1-100000)", default=10000)] = 10000
+        ):
+            return self.scanning_tools.port_scan(target, ports, timeout, backend, rate)
+
+        @self.mcp.tool(description="Scan ports on several targets concurrently")
+        async def parallel_scan(
+            targets: Annotated[List[str], Field(description="Target hosts")],
+            ports: Annotated[str, Field(description="Port range (e.g., '1-1000' or '22,80,443')")],
+            timeout: Annotated[int, Field(description="Timeout in seconds per target", default=60)] = 60
         ):
-            return self.scanning_tools.port_scan(target, ports, timeout)
+            return await self.scanning_tools.parallel_scan(targets, ports, timeout)
 
         @self.mcp.tool(description="Enumerate services on a target")
         def service_enumeration(
             target: Annotated[str, Field(description="Target host")],
-            ports: Annotated[Optional[str], Field(description="Port range")] = None
+            ports: Annotated[Optional[str], Field(description="Port range")] = None,
+            scripts: Annotated[Optional[str], Field(description="NSE script names or the default, safe, discovery and version categories")] = None,
+            version_intensity: Annotated[int, Field(description="Version detection intensity (0-9)", default=2)] = 2,
+            cache_ttl: Annotated[int, Field(description="Maximum age in seconds of a cached result", default=300)] = 300,
+            force: Annotated[bool, Field(description="Bypass cached scan results", default=False)] = False
         ):
-            return self.scanning_tools.service_enumeration(target, ports)
+            return self.scanning_tools.service_enumeration(target, ports, scripts, version_intensity, cache_ttl, force)
 
         # System Tools
         @self.mcp.tool(description="Check required system tools")
@@ -284,7 +341,7 @@ class NetOpsMCPServer:
             response_data = {
                 "tools": tools,
                 "system_info": system_info,
-                "missing_tools": [tool for tool, available in tools.items() if not available]
+                "missing_tools": tools['missing_tools']
             }
             
             return [Content(type="text", text=json.dumps(response_data, indent=2))]
@@ -353,11 +410,12 @@ def main():
         print(f"Memory: {system_info['memory_total']}")
         
         print("\nRequired tools:")
-        for tool, available in tools.items():
-            status = "✅" if available else "❌"
-            print(f"  {status} {tool}")
+        for tool in tools['available_tools']:
+            print(f"  ✅ {tool}")
+        for tool in tools['missing_tools']:
+            print(f"  ❌ {tool}")
         
-        missing = [tool for tool, available in tools.items() if not available]
+        missing = tools['missing_tools']
         if missing:
             print(f"\nMissing tools: {', '.join(missing)}")
             sys.exit(1)
@@ -11,7 +11,8 @@ import os
 import sys
 import signal
 import time
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List, Optional
 
 try:
     from fastmcp import FastMCP
@@ -30,9 +31,9 @@ from .tools.network.connectivity_tools import ConnectivityTools
 from .tools.network.dns_tools import DNSTools
 from .tools.network.discovery_tools import DiscoveryTools
 from .tools.system.network_tools import NetworkTools
-from .tools.system.monitoring_tools import MonitoringTools
+from .tools.system.monitoring_tools import MonitoringTools, METRICS_REFRESH_INTERVAL
 from .tools.security.scanning_tools import ScanningTools
-from .utils.system_check import check_required_tools, get_system_info
+from .utils.system_check import check_required_tools as check_tools_status, get_system_info
 from .middleware.auth import AuthenticationMiddleware
 from .middleware.rate_limiter import RateLimitMiddleware
 from .middleware.metrics import MetricsMiddleware, create_metrics_endpoint
@@ -81,11 +82,11 @@ class NetOpsMCPHTTPServer:
         self.dns_tools = DNSTools()
         self.discovery_tools = DiscoveryTools()
         self.network_tools = NetworkTools()
-        self.monitoring_tools = MonitoringTools()
+        self.monitoring_tools = MonitoringTools(refresh_interval=METRICS_REFRESH_INTERVAL)
         self.scanning_tools = ScanningTools()
         
         # Initialize FastMCP
-        self.mcp = FastMCP("NetOpsMCP-HTTP")
+        self.mcp = FastMCP("NetOpsMCP-HTTP", lifespan=self._lifespan)
         
         # Add health check endpoint
         self._setup_health_check()
@@ -93,14 +94,26 @@ class NetOpsMCPHTTPServer:
         # Setup tools
         self._setup_tools()
 
+    @asynccontextmanager
+    async def _lifespan(self, app: Any) -> AsyncIterator[None]:
+        """Release tool resources when the MCP server shuts down.
+
+        Args:
+            app: The FastMCP server instance
+        """
+        try:
+            yield
+        finally:
+            await self.http_tools.close()
+
     def _setup_tools(self) -> None:
         """Register MCP tools with the server."""
         
         # HTTP/API Testing Tools
         @self.mcp.tool(description="Execute HTTP request using curl")
         def curl_request(url: str, method: str = "GET", headers: Optional[dict] = None, 
-                        data: Optional[str] = None, timeout: int = 30):
-            return self.http_tools.curl_request(url, method, headers, data, timeout)
+                        data: Optional[str] = None, timeout: int = 30, max_body: int = 1048576):
+            return self.http_tools.curl_request(url, method, headers, data, timeout, max_body)
 
         @self.mcp.tool(description="Execute HTTP request using httpie")
         def httpie_request(url: str, method: str = "GET", headers: Optional[dict] = None,
@@ -109,51 +122,65 @@ class NetOpsMCPHTTPServer:
 
         @self.mcp.tool(description="Test API endpoint with validation")
         def api_test(url: str, method: str = "GET", expected_status: int = 200,
-                    headers: Optional[dict] = None, timeout: int = 30):
-            return self.http_tools.api_test(url, method, expected_status, headers, timeout)
+                    headers: Optional[dict] = None, timeout: int = 30, max_body: int = 1048576):
+            return self.http_tools.api_test(url, method, expected_status, headers, timeout, max_body)
+
+        @self.mcp.tool(description="Test many API endpoints with a single parallel curl run")
+        def api_test_bulk(cases: List[dict], timeout: int = 30):
+            return self.http_tools.api_test_bulk(cases, timeout)
+
+        @self.mcp.tool(description="Execute HTTP requests against many URLs concurrently")
+        async def bulk_request(urls: List[str], method: str = "GET", headers: Optional[dict] = None,
+                               timeout: int = 30):
+            return await self.http_tools.bulk_request(urls, method, headers, timeout)
 
         # Network Connectivity Tools
         @self.mcp.tool(description="Ping a host to test connectivity")
-        def ping_host(host: str, count: int = 4, timeout: int = 10):
-            return self.connectivity_tools.ping_host(host, count, timeout)
+        async def ping_host(host: str, count: int = 4, timeout: int = 10):
+            return await self.connectivity_tools.ping_host(host, count, timeout)
+
+        @self.mcp.tool(description="Ping several hosts in one batch")
+        async def ping_hosts(hosts: List[str], count: int = 4, timeout: int = 10):
+            return await self.connectivity_tools.ping_hosts(hosts, count, timeout)
 
         @self.mcp.tool(description="Perform traceroute to a target")
-        def traceroute_path(target: str, max_hops: int = 30, timeout: int = 30):
-            return self.connectivity_tools.traceroute_path(target, max_hops, timeout)
+        async def traceroute_path(target: str, max_hops: int = 30, timeout: int = 30):
+            return await self.connectivity_tools.traceroute_path(target, max_hops, timeout)
 
         @self.mcp.tool(description="Monitor network path using mtr")
-        def mtr_monitor(target: str, count: int = 10, timeout: int = 30):
-            return self.connectivity_tools.mtr_monitor(target, count, timeout)
+        async def mtr_monitor(target: str, count: int = 10, timeout: int = 30):
+            return await self.connectivity_tools.mtr_monitor(target, count, timeout)
 
         @self.mcp.tool(description="Test port connectivity using telnet")
-        def telnet_connect(host: str, port: int, timeout: int = 10):
-            return self.connectivity_tools.telnet_connect(host, port, timeout)
+        async def telnet_connect(host: str, port: int, timeout: int = 10):
+            return await self.connectivity_tools.telnet_connect(host, port, timeout)
 
         @self.mcp.tool(description="Test port connectivity using netcat")
-        def netcat_test(host: str, port: int, timeout: int = 10):
-            return self.connectivity_tools.netcat_test(host, port, timeout)
+        async def netcat_test(host: str, port: int, timeout: int = 10):
+            return await self.connectivity_tools.netcat_test(host, port, timeout)
 
         # DNS Tools
         @self.mcp.tool(description="Perform DNS lookup using nslookup")
-        def nslookup_query(domain: str, record_type: str = "A", server: Optional[str] = None):
-            return self.dns_tools.nslookup_query(domain, record_type, server)
+        async def nslookup_query(domain: str, record_type: str = "A", server: Optional[str] = None):
+            return await self.dns_tools.nslookup_query(domain, record_type, server)
 
         @self.mcp.tool(description="Perform DNS lookup using dig")
-        def dig_query(domain: str, record_type: str = "A", server: Optional[str] = None):
-            return self.dns_tools.dig_query(domain, record_type, server)
+        async def dig_query(domain: str, record_type: str = "A", server: Optional[str] = None):
+            return await self.dns_tools.dig_query(domain, record_type, server)
 
         @self.mcp.tool(description="Perform DNS lookup using host")
-        def host_lookup(domain: str, record_type: str = "A"):
-            return self.dns_tools.host_lookup(domain, record_type)
+        async def host_lookup(domain: str, record_type: str = "A"):
+            return await self.dns_tools.host_lookup(domain, record_type)
 
         # Network Discovery Tools
         @self.mcp.tool(description="Scan network using nmap")
-        def nmap_scan(target: str, ports: Optional[str] = None, scan_type: str = "basic", timeout: int = 300):
-            return self.discovery_tools.nmap_scan(target, ports, scan_type, timeout)
+        async def nmap_scan(target: str, ports: Optional[str] = None, scan_type: str = "basic", timeout: int = 300,
+                            force: bool = False):
+            return await self.discovery_tools.nmap_scan(target, ports, scan_type, timeout, force)
 
         @self.mcp.tool(description="Discover network services")
-        def service_discovery(target: str, ports: Optional[str] = None):
-            return self.discovery_tools.service_discovery(target, ports)
+        async def service_discovery(target: str, ports: Optional[str] = None, force: bool = False):
+            return await self.discovery_tools.service_discovery(target, ports, force)
 
         # System Network Tools
         @self.mcp.tool(description="Show network connections using ss")
@@ -186,8 +213,8 @@ class NetOpsMCPHTTPServer:
             return self.monitoring_tools.memory_usage()
 
         @self.mcp.tool(description="Get disk usage information")
-        def disk_usage():
-            return self.monitoring_tools.disk_usage()
+        def disk_usage(local_only: bool = True):
+            return self.monitoring_tools.disk_usage(local_only)
 
         @self.mcp.tool(description="List running processes")
         def process_list(limit: int = 20):
@@ -195,24 +222,31 @@ class NetOpsMCPHTTPServer:
 
         # Security Tools
         @self.mcp.tool(description="Scan ports on a target")
-        def port_scan(target: str, ports: str, timeout: int = 60):
-            return self.scanning_tools.port_scan(target, ports, timeout)
+        def port_scan(target: str, ports: str, timeout: int = 60, backend: str = "auto",
+                      rate: int = 10000):
+            return self.scanning_tools.port_scan(target, ports, timeout, backend, rate)
+
+        @self.mcp.tool(description="Scan ports on several targets concurrently")
+        async def parallel_scan(targets: List[str], ports: str, timeout: int = 60):
+            return await self.scanning_tools.parallel_scan(targets, ports, timeout)
 
         @self.mcp.tool(description="Enumerate services on a target")
-        def service_enumeration(target: str, ports: Optional[str] = None):
-            return self.scanning_tools.service_enumeration(target, ports)
+        def service_enumeration(target: str, ports: Optional[str] = None, scripts: Optional[str] = None,
+                                version_intensity: int = 2, cache_ttl: int = 300, force: bool = False):
+            return self.scanning_tools.service_enumeration(target, ports, scripts, version_intensity,
+                                                           cache_ttl, force)
 
         # System Tools
         @self.mcp.tool(description="Check required system tools")
         def check_required_tools():
             try:
-                tools = check_required_tools()
+                tools = check_tools_status()
                 system_info = get_system_info()
                 
                 response_data = {
                     "tools": tools,
                     "system_info": system_info,
-                    "missing_tools": [tool for tool, available in tools.items() if not available]
+                    "missing_tools": tools['missing_tools']
                 }
                 
                 return [{"type": "text", "text": json.dumps(response_data, indent=2)}]
@@ -221,12 +255,12 @@ class NetOpsMCPHTTPServer:
 
         @self.mcp.tool(description="Health check endpoint")
         def health():
-            # Count MCP tools (26 total)
+            # Count MCP tools (30 total)
             mcp_tools = [
-                # HTTP/API Testing Tools (3)
-                "curl_request", "httpie_request", "api_test",
-                # Network Connectivity Tools (5)
-                "ping_host", "traceroute_path", "mtr_monitor", "telnet_connect", "netcat_test",
+                # HTTP/API Testing Tools (5)
+                "curl_request", "httpie_request", "api_test", "api_test_bulk", "bulk_request",
+                # Network Connectivity Tools (6)
+                "ping_host", "ping_hosts", "traceroute_path", "mtr_monitor", "telnet_connect", "netcat_test",
                 # DNS Tools (3)
                 "nslookup_query", "dig_query", "host_lookup",
                 # Network Discovery Tools (2)
@@ -235,14 +269,14 @@ class NetOpsMCPHTTPServer:
                 "ss_connections", "netstat_connections", "arp_table", "arping_host",
                 # System Monitoring Tools (5)
                 "system_status", "cpu_usage", "memory_usage", "disk_usage", "process_list",
-                # Security Tools (2)
-                "port_scan", "service_enumeration",
+                # Security Tools (3)
+                "port_scan", "parallel_scan", "service_enumeration",
                 # System Tools (2)
                 "check_required_tools", "health"
             ]
             
             # Count system tools
-            system_tools = check_required_tools()
+            system_tools = check_tools_status()
             available_system_tools = len(system_tools['available_tools'])
             total_system_tools = len(system_tools['available_tools']) + len(system_tools['missing_tools'])
             
@@ -267,12 +301,12 @@ class NetOpsMCPHTTPServer:
         # Create a simple health check function
         def update_health_status():
             try:
-                # Count MCP tools (26 total)
+                # Count MCP tools (30 total)
                 mcp_tools = [
-                    # HTTP/API Testing Tools (3)
-                    "curl_request", "httpie_request", "api_test",
-                    # Network Connectivity Tools (5)
-                    "ping_host", "traceroute_path", "mtr_monitor", "telnet_connect", "netcat_test",
+                    # HTTP/API Testing Tools (5)
+                    "curl_request", "httpie_request", "api_test", "api_test_bulk", "bulk_request",
+                    # Network Connectivity Tools (6)
+                    "ping_host", "ping_hosts", "traceroute_path", "mtr_monitor", "telnet_connect", "netcat_test",
                     # DNS Tools (3)
                     "nslookup_query", "dig_query", "host_lookup",
                     # Network Discovery Tools (2)
@@ -281,14 +315,14 @@ class NetOpsMCPHTTPServer:
                     "ss_connections", "netstat_connections", "arp_table", "arping_host",
                     # System Monitoring Tools (5)
                     "system_status", "cpu_usage", "memory_usage", "disk_usage", "process_list",
-                    # Security Tools (2)
-                    "port_scan", "service_enumeration",
+                    # Security Tools (3)
+                    "port_scan", "parallel_scan", "service_enumeration",
                     # System Tools (2)
                     "check_required_tools", "health"
                 ]
                 
                 # Count system tools
-                system_tools = check_required_tools()
+                system_tools = check_tools_status()
                 available_system_tools = len(system_tools['available_tools'])
                 total_system_tools = len(system_tools['available_tools']) + len(system_tools['missing_tools'])
                 
@@ -350,7 +384,7 @@ class NetOpsMCPHTTPServer:
                 async def health_endpoint(request):
                     try:
                         # System tools kontrolü
-                        system_tools = check_required_tools()
+                        system_tools = check_tools_status()
                         available_tools = len(system_tools['available_tools'])
                         total_tools = len(system_tools['available_tools']) + len(system_tools['missing_tools'])
                         
@@ -8,10 +8,74 @@ This module provides the foundation for all NetOps MCP tools, including:
 - Logging setup
 """
 
+import asyncio
 import logging
+import os
+import re
+import shutil
+import socket
 import subprocess
+import threading
+import time
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 from mcp.types import TextContent as Content
+from ..utils import serialization
+from ..utils.cache import TTLCache
+
+# IP address pattern
+IP_PATTERN = re.compile(r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$')
+# Domain pattern
+DOMAIN_PATTERN = re.compile(r'^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)*[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?$')
+# Payload size in characters above which async tools serialize off the event loop
+SERIALIZE_OFFLOAD_THRESHOLD = 64 * 1024
+# Most child processes a command batch keeps running at once
+MAX_CONCURRENT_COMMANDS = os.cpu_count() or 4
+# Seconds a host's resolved addresses are reused by in-process TCP probes
+ADDRINFO_CACHE_TTL = 900
+# Bytes read from a child's stdout at a time when its output is capped
+OUTPUT_CHUNK_SIZE = 64 * 1024
+
+
+@lru_cache(maxsize=4096)
+def _validate_host_cached(host: str) -> bool:
+    """Validate a host string.
+
+    Validation is a pure function of the input, so results are memoized;
+    chained tool calls against the same target skip the regex work.
+
+    Args:
+        host: Host to validate
+
+    Returns:
+        True if host is valid
+    """
+    host = host.strip()
+    if len(host) == 0:
+        return False
+    
+    # Check for invalid patterns
+    if '..' in host or ' ' in host:
+        return False
+    
+    # Basic domain/IP validation
+    return bool(IP_PATTERN.match(host) or DOMAIN_PATTERN.match(host))
+
+
+@lru_cache(maxsize=256)
+def _resolve_executable(name: str) -> str:
+    """Resolve a command name to an absolute path once per process.
+
+    CPython only launches children through posix_spawn when the executable
+    path contains a directory; bare names fall back to fork/exec.
+
+    Args:
+        name: Command name or path
+
+    Returns:
+        Absolute path of the executable, or name unchanged if not on PATH
+    """
+    return shutil.which(name) or name
 
 
 class NetOpsTool:
@@ -21,12 +85,13 @@ class NetOpsTool:
     - Standardized logging
     - Response formatting
     - Error handling
-    - Subprocess execution
+    - Subprocess execution (blocking and asyncio-based)
     """
 
     def __init__(self):
         """Initialize the tool."""
         self.logger = logging.getLogger(f"netops-mcp.{self.__class__.__name__.lower()}")
+        self._addrinfo_cache = TTLCache(maxsize=1024, ttl=ADDRINFO_CACHE_TTL)
 
     def _format_response(self, data: Any, tool_name: Optional[str] = None) -> List[Content]:
         """Format response data into MCP content.
@@ -38,23 +103,68 @@ class NetOpsTool:
         Returns:
             List of Content objects
         """
-        import json
-        
         if isinstance(data, dict):
-            formatted = json.dumps(data, indent=2, default=str)
+            formatted = serialization.dumps(data, indent=True)
         elif isinstance(data, list):
-            formatted = json.dumps(data, indent=2, default=str)
+            formatted = serialization.dumps(data, indent=True)
         else:
             formatted = str(data)
 
         return [Content(type="text", text=formatted)]
 
-    def _execute_command(self, command: List[str], timeout: int = 30) -> Dict[str, Any]:
+    async def _format_response_async(self, data: Any, tool_name: Optional[str] = None,
+                                     size_hint: int = 0) -> List[Content]:
+        """Format response data into MCP content from a coroutine.
+
+        Large payloads are serialized in a worker thread so the event loop
+        keeps servicing other requests meanwhile; small ones are formatted
+        inline, where a thread hop would cost more than the encoding.
+
+        Args:
+            data: Raw data to format
+            tool_name: Name of the tool for context
+            size_hint: Approximate payload size in characters (e.g. raw output length)
+
+        Returns:
+            List of Content objects
+        """
+        if size_hint < SERIALIZE_OFFLOAD_THRESHOLD:
+            return self._format_response(data, tool_name)
+        return await asyncio.to_thread(self._format_response, data, tool_name)
+
+    @staticmethod
+    def _command_failure(command: List[str], stderr: str, stdout: str = "",
+                         return_code: int = -1) -> Dict[str, Any]:
+        """Build the result dictionary for a command that did not succeed.
+
+        Args:
+            command: Command that was executed
+            stderr: Error output or description
+            stdout: Output captured before the failure
+            return_code: Process exit code, or -1 if it never completed
+
+        Returns:
+            Dictionary in the shape returned by _execute_command
+        """
+        return {
+            "success": False,
+            "stdout": stdout,
+            "stderr": stderr,
+            "return_code": return_code,
+            "command": ' '.join(command)
+        }
+
+    def _execute_command(self, command: List[str], timeout: int = 30,
+                         input_data: Optional[str] = None,
+                         max_stdout: Optional[int] = None) -> Dict[str, Any]:
         """Execute a system command safely.
 
         Args:
             command: Command to execute as list
             timeout: Command timeout in seconds
+            input_data: Optional text written to the command's stdin
+            max_stdout: Keep at most this many bytes of stdout; the rest is
+                discarded as it is read and "stdout_truncated" is set
 
         Returns:
             Dictionary containing command results
@@ -62,11 +172,20 @@ class NetOpsTool:
         try:
             self.logger.debug(f"Executing command: {' '.join(command)}")
             
+            if max_stdout is not None:
+                return self._execute_command_capped(command, timeout, input_data, max_stdout)
+            
+            # Inherited descriptors are non-inheritable by default (PEP 446),
+            # so close_fds=False is safe and keeps the posix_spawn fast path
             result = subprocess.run(
                 command,
+                executable=_resolve_executable(command[0]),
                 capture_output=True,
                 text=True,
-                timeout=timeout
+                errors="replace",
+                input=input_data,
+                timeout=timeout,
+                close_fds=False
             )
             
             return {
@@ -79,39 +198,233 @@ class NetOpsTool:
             
         except subprocess.TimeoutExpired:
             self.logger.error(f"Command timed out: {' '.join(command)}")
-            return {
-                "success": False,
-                "stdout": "",
-                "stderr": "Command timed out",
-                "return_code": -1,
-                "command": ' '.join(command)
-            }
+            return self._command_failure(command, "Command timed out")
         except subprocess.CalledProcessError as e:
             self.logger.error(f"Command failed: {' '.join(command)} - {e}")
+            return self._command_failure(command, e.stderr or str(e), stdout=e.stdout or "",
+                                         return_code=e.returncode)
+        except FileNotFoundError:
+            self.logger.error(f"Command not found: {command[0]}")
+            return self._command_failure(command, f"Command not found: {command[0]}")
+        except Exception as e:
+            self.logger.error(f"Unexpected error executing command: {e}")
+            return self._command_failure(command, str(e))
+
+    def _execute_command_capped(self, command: List[str], timeout: int, input_data: Optional[str],
+                                max_stdout: int) -> Dict[str, Any]:
+        """Run a command holding at most max_stdout bytes of its stdout in memory.
+
+        Output past the limit is still read, so the command is not blocked
+        on a full pipe, but it is dropped instead of buffered.
+
+        Args:
+            command: Command to execute as list
+            timeout: Command timeout in seconds
+            input_data: Optional text written to the command's stdin
+            max_stdout: Maximum number of stdout bytes kept
+
+        Returns:
+            Dictionary containing command results
+
+        Raises:
+            subprocess.TimeoutExpired: If the command runs longer than timeout
+        """
+        process = subprocess.Popen(
+            command,
+            executable=_resolve_executable(command[0]),
+            stdin=subprocess.PIPE if input_data is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            close_fds=False
+        )
+        timed_out = threading.Event()
+
+        def expire() -> None:
+            timed_out.set()
+            process.kill()
+
+        def feed_stdin() -> None:
+            try:
+                with process.stdin:
+                    process.stdin.write(input_data.encode())
+            except BrokenPipeError:
+                pass
+
+        # stdin and stderr are serviced on their own threads so neither pipe can fill and stall the child
+        stderr_chunks: List[bytes] = []
+        helpers = [threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True)]
+        if input_data is not None:
+            helpers.append(threading.Thread(target=feed_stdin, daemon=True))
+        timer = threading.Timer(timeout, expire)
+        timer.daemon = True
+        
+        stdout = bytearray()
+        truncated = False
+        with process:
+            timer.start()
+            for helper in helpers:
+                helper.start()
+            try:
+                for chunk in iter(lambda: process.stdout.read1(OUTPUT_CHUNK_SIZE), b''):
+                    room = max_stdout - len(stdout)
+                    if len(chunk) > room:
+                        truncated = True
+                    if room > 0:
+                        stdout += chunk[:room]
+                process.wait()
+                for helper in helpers:
+                    helper.join()
+            finally:
+                timer.cancel()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(command, timeout)
+        
+        return {
+            "success": process.returncode == 0,
+            "stdout": stdout.decode(errors="replace"),
+            "stderr": b''.join(stderr_chunks).decode(errors="replace"),
+            "return_code": process.returncode,
+            "command": ' '.join(command),
+            "stdout_truncated": truncated
+        }
+
+    async def _execute_command_async(self, command: List[str], timeout: int = 30) -> Dict[str, Any]:
+        """Execute a system command without blocking the event loop.
+
+        Returns the same dictionary shape as _execute_command, so callers can
+        switch between the two transparently.
+
+        Args:
+            command: Command to execute as list
+            timeout: Command timeout in seconds
+
+        Returns:
+            Dictionary containing command results
+        """
+        process = None
+        try:
+            self.logger.debug(f"Executing command: {' '.join(command)}")
+            
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                executable=_resolve_executable(command[0]),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                close_fds=False
+            )
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+            
             return {
-                "success": False,
-                "stdout": e.stdout or "",
-                "stderr": e.stderr or str(e),
-                "return_code": e.returncode,
+                "success": process.returncode == 0,
+                "stdout": stdout.decode(errors="replace"),
+                "stderr": stderr.decode(errors="replace"),
+                "return_code": process.returncode,
                 "command": ' '.join(command)
             }
+            
+        except asyncio.TimeoutError:
+            self.logger.error(f"Command timed out: {' '.join(command)}")
+            if process is not None and process.returncode is None:
+                process.kill()
+                await process.wait()
+            return self._command_failure(command, "Command timed out")
         except FileNotFoundError:
             self.logger.error(f"Command not found: {command[0]}")
+            return self._command_failure(command, f"Command not found: {command[0]}")
+        except Exception as e:
+            self.logger.error(f"Unexpected error executing command: {e}")
+            return self._command_failure(command, str(e))
+
+    async def _execute_many(self, commands: List[List[str]], timeout: int = 30) -> List[Dict[str, Any]]:
+        """Execute several commands concurrently without blocking the event loop.
+
+        At most MAX_CONCURRENT_COMMANDS of them run at a time, so a large
+        batch does not start every child process at once.
+
+        Args:
+            commands: Commands to execute, each as a list
+            timeout: Timeout in seconds for each command
+
+        Returns:
+            One result dictionary per command, in the order given
+        """
+        limit = asyncio.Semaphore(MAX_CONCURRENT_COMMANDS)
+
+        async def run(command: List[str]) -> Dict[str, Any]:
+            async with limit:
+                return await self._execute_command_async(command, timeout)
+
+        return list(await asyncio.gather(*(run(command) for command in commands)))
+
+    async def _tcp_probe(self, host: str, port: int, timeout: float = 10) -> Dict[str, Any]:
+        """Test TCP connectivity to host:port in-process.
+
+        Drives a non-blocking socket directly through the running event loop
+        (one resolver call plus one connect per address), so no helper
+        process or stream objects are created per probe. Resolved addresses
+        are reused for ADDRINFO_CACHE_TTL seconds, so repeat probes of a
+        host skip DNS.
+
+        Args:
+            host: Target host
+            port: Target port
+            timeout: Overall timeout in seconds, including name resolution
+
+        Returns:
+            Dictionary in the same shape as _execute_command_async results
+        """
+        command = f"tcp-connect {host} {port}"
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+
+        async def connect() -> str:
+            infos = self._addrinfo_cache.get((host, port))
+            if infos is None:
+                infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+                self._addrinfo_cache.set((host, port), infos)
+            last_error: Optional[OSError] = None
+            for family, sock_type, proto, _, sockaddr in infos:
+                sock = socket.socket(family, sock_type, proto)
+                sock.setblocking(False)
+                try:
+                    await loop.sock_connect(sock, sockaddr)
+                    return sockaddr[0]
+                except OSError as e:
+                    last_error = e
+                finally:
+                    sock.close()
+            # None of the addresses answered; resolve afresh next time
+            self._addrinfo_cache.delete((host, port))
+            raise last_error or OSError(f"No addresses found for {host}")
+
+        try:
+            address = await asyncio.wait_for(connect(), timeout)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            return {
+                "success": True,
+                "stdout": f"Connected to {host} ({address}) port {port} in {elapsed_ms:.2f} ms",
+                "stderr": "",
+                "return_code": 0,
+                "command": command
+            }
+        except asyncio.TimeoutError:
+            # A stale address often blackholes rather than refuses; resolve afresh next time
+            self._addrinfo_cache.delete((host, port))
             return {
                 "success": False,
                 "stdout": "",
-                "stderr": f"Command not found: {command[0]}",
-                "return_code": -1,
-                "command": ' '.join(command)
+                "stderr": f"Connection to {host} port {port} timed out",
+                "return_code": 1,
+                "command": command
             }
-        except Exception as e:
-            self.logger.error(f"Unexpected error executing command: {e}")
+        except OSError as e:
             return {
                 "success": False,
                 "stdout": "",
-                "stderr": str(e),
-                "return_code": -1,
-                "command": ' '.join(command)
+                "stderr": f"Connection to {host} port {port} failed: {e}",
+                "return_code": 1,
+                "command": command
             }
 
     def _handle_error(self, operation: str, error: Exception) -> List[Content]:
@@ -136,6 +449,11 @@ class NetOpsTool:
 
         return self._format_response(error_response)
 
+    @classmethod
+    def clear_host_cache(cls) -> None:
+        """Clear memoized host validation results."""
+        _validate_host_cached.cache_clear()
+
     def _validate_host(self, host: str) -> bool:
         """Validate host parameter.
 
@@ -148,22 +466,7 @@ class NetOpsTool:
         if not host or not isinstance(host, str):
             return False
         
-        host = host.strip()
-        if len(host) == 0:
-            return False
-        
-        # Check for invalid patterns
-        if '..' in host or ' ' in host:
-            return False
-        
-        # Basic domain/IP validation
-        import re
-        # IP address pattern
-        ip_pattern = re.compile(r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$')
-        # Domain pattern
-        domain_pattern = re.compile(r'^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)*[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?$')
-        
-        return bool(ip_pattern.match(host) or domain_pattern.match(host))
+        return _validate_host_cached(host)
 
     def _validate_port(self, port: Union[int, str]) -> bool:
         """Validate port parameter.
@@ -3,15 +3,36 @@ Network connectivity testing tools for NetOps MCP.
 """
 
 import re
-from typing import Dict, List, Optional
+import shutil
+from typing import Any, Dict, List, Optional
 from mcp.types import TextContent as Content
 from ..base import NetOpsTool
 
+# Ping summary patterns, matched against the whole output buffer
+PING_PACKETS_PATTERN = re.compile(r'(\d+) packets transmitted, (\d+) received')
+PING_RTT_PATTERN = re.compile(
+    r'rtt min/avg/max/mdev[^\n]*?(\d+\.?\d*)/(\d+\.?\d*)/(\d+\.?\d*)/(\d+\.?\d*)'
+)
+
+# Per-host summary line printed by 'fping -c': "host : xmt/rcv/%loss = 4/4/0%, min/avg/max = 1.2/1.5/1.9"
+FPING_SUMMARY_PATTERN = re.compile(
+    r'^(\S+)\s+: xmt/rcv/%loss = (\d+)/(\d+)/(\d+)%'
+    r'(?:, min/avg/max = (\d+\.?\d*)/(\d+\.?\d*)/(\d+\.?\d*))?',
+    re.MULTILINE
+)
+
+# One mtr --report hop line: "  1.|-- host  0.0%  3  1.2  1.1  0.9  1.3  0.2"
+MTR_HOP_PATTERN = re.compile(
+    r'^\s*(\d+)\.\|--\s+(\S+)\s+(\d+\.?\d*)%\s+(\d+)'
+    r'\s+(\d+\.?\d*)\s+(\d+\.?\d*)\s+(\d+\.?\d*)\s+(\d+\.?\d*)',
+    re.MULTILINE
+)
+
 
 class ConnectivityTools(NetOpsTool):
     """Tools for network connectivity testing."""
 
-    def ping_host(self, host: str, count: int = 4, timeout: int = 10) -> List[Content]:
+    async def ping_host(self, host: str, count: int = 4, timeout: int = 10) -> List[Content]:
         """Ping a host to test connectivity.
 
         Args:
@@ -27,7 +48,7 @@ class ConnectivityTools(NetOpsTool):
                 raise ValueError("Invalid host provided")
 
             command = ['ping', '-c', str(count), '-W', str(timeout), host]
-            result = self._execute_command(command, timeout + 5)
+            result = await self._execute_command_async(command, timeout + 5)
             
             if result["success"]:
                 # Parse ping output
@@ -51,7 +72,101 @@ class ConnectivityTools(NetOpsTool):
         except Exception as e:
             return self._handle_error("ping host", e)
 
-    def traceroute_path(self, target: str, max_hops: int = 30, timeout: int = 30) -> List[Content]:
+    async def ping_hosts(self, hosts: List[str], count: int = 4, timeout: int = 10) -> List[Content]:
+        """Ping several hosts with a single batch.
+
+        Uses one fping run for the whole list when fping is installed;
+        otherwise the hosts are pinged concurrently with ping.
+
+        Args:
+            hosts: Target hosts
+            count: Number of ping packets per host
+            timeout: Timeout in seconds per packet
+
+        Returns:
+            List of Content objects with one ping result per host
+        """
+        try:
+            if not hosts or not isinstance(hosts, list):
+                raise ValueError("At least one host must be provided")
+
+            valid_hosts = [host for host in hosts if self._validate_host(host)]
+            if not valid_hosts:
+                stats = {}
+            elif shutil.which('fping') is not None:
+                stats = await self._fping(valid_hosts, count, timeout)
+            else:
+                results = await self._execute_many(
+                    [['ping', '-c', str(count), '-W', str(timeout), host] for host in valid_hosts],
+                    count + timeout + 5
+                )
+                stats = {
+                    host: self._parse_ping_output(result["stdout"])
+                    for host, result in zip(valid_hosts, results)
+                }
+
+            results = []
+            for host in hosts:
+                if not self._validate_host(host):
+                    results.append({"host": host, "success": False, "error": "Invalid host provided"})
+                elif stats.get(host, {}).get("packets_received"):
+                    results.append({"host": host, "success": True, "stats": stats[host]})
+                else:
+                    results.append({"host": host, "success": False, "error": "No reply",
+                                    "stats": stats.get(host)})
+
+            response_data = {
+                "total": len(results),
+                "succeeded": sum(1 for r in results if r["success"]),
+                "results": results
+            }
+
+            return self._format_response(response_data, "ping_hosts")
+
+        except Exception as e:
+            return self._handle_error("ping hosts", e)
+
+    async def _fping(self, hosts: List[str], count: int, timeout: int) -> Dict[str, Dict[str, Any]]:
+        """Ping hosts with one fping run and parse its per-host summaries.
+
+        Args:
+            hosts: Validated target hosts
+            count: Number of ping packets per host
+            timeout: Timeout in seconds per packet
+
+        Returns:
+            Ping statistics keyed by host, for hosts fping reported on
+        """
+        command = ['fping', '-q', '-c', str(count), '-t', str(timeout * 1000), *hosts]
+        result = await self._execute_command_async(command, count + timeout + 5)
+        # fping exits non-zero when any host is unreachable; the summaries
+        # (written to stderr) are still complete, so parse them regardless
+        return self._parse_fping_output(result["stderr"] + result["stdout"])
+
+    def _parse_fping_output(self, output: str) -> Dict[str, Dict[str, Any]]:
+        """Parse the per-host summary lines of 'fping -c' output.
+
+        Args:
+            output: Raw fping output
+
+        Returns:
+            Ping statistics keyed by host, in the shape of _parse_ping_output;
+            fping reports no deviation, so mdev_rtt is None (unknown)
+        """
+        stats = {}
+        for match in FPING_SUMMARY_PATTERN.finditer(output):
+            stats[match[1]] = {
+                "packets_transmitted": int(match[2]),
+                "packets_received": int(match[3]),
+                "packet_loss_percent": int(match[4]),
+                "min_rtt": float(match[5] or 0),
+                "avg_rtt": float(match[6] or 0),
+                "max_rtt": float(match[7] or 0),
+                "mdev_rtt": None
+            }
+        return stats
+
+    async def traceroute_path(self, target: str, max_hops: int = 30, timeout: int = 30) -> List[Content]:
         """Perform traceroute to a target.
 
         Args:
@@ -67,7 +182,7 @@ class ConnectivityTools(NetOpsTool):
                 raise ValueError("Invalid target provided")
 
             command = ['traceroute', '-m', str(max_hops), '-w', str(timeout), target]
-            result = self._execute_command(command, timeout + 10)
+            result = await self._execute_command_async(command, timeout + 10)
             
             if result["success"]:
                 # Parse traceroute output
@@ -91,7 +206,7 @@ class ConnectivityTools(NetOpsTool):
         except Exception as e:
             return self._handle_error("traceroute path", e)
 
-    def mtr_monitor(self, target: str, count: int = 10, timeout: int = 30) -> List[Content]:
+    async def mtr_monitor(self, target: str, count: int = 10, timeout: int = 30) -> List[Content]:
         """Monitor network path using mtr.
 
         Args:
@@ -107,7 +222,7 @@ class ConnectivityTools(NetOpsTool):
                 raise ValueError("Invalid target provided")
 
             command = ['mtr', '-c', str(count), '-w', str(timeout), '--report', target]
-            result = self._execute_command(command, timeout + 10)
+            result = await self._execute_command_async(command, timeout + 10)
             
             if result["success"]:
                 # Parse mtr output
@@ -131,8 +246,11 @@ class ConnectivityTools(NetOpsTool):
         except Exception as e:
             return self._handle_error("mtr monitor", e)
 
-    def telnet_connect(self, host: str, port: int, timeout: int = 10) -> List[Content]:
-        """Test port connectivity using telnet.
+    async def telnet_connect(self, host: str, port: int, timeout: int = 10) -> List[Content]:
+        """Test port connectivity the way telnet would, by opening a TCP connection.
+
+        The connect runs in-process on the event loop; no telnet process
+        is started.
 
         Args:
             host: Target host
@@ -148,8 +266,7 @@ class ConnectivityTools(NetOpsTool):
             if not self._validate_port(port):
                 raise ValueError("Invalid port provided")
 
-            command = ['timeout', str(timeout), 'telnet', host, str(port)]
-            result = self._execute_command(command, timeout + 5)
+            result = await self._tcp_probe(host, int(port), timeout)
             
             response_data = {
                 "host": host,
@@ -165,8 +282,11 @@ class ConnectivityTools(NetOpsTool):
         except Exception as e:
             return self._handle_error("telnet connect", e)
 
-    def netcat_test(self, host: str, port: int, timeout: int = 10) -> List[Content]:
-        """Test port connectivity using netcat.
+    async def netcat_test(self, host: str, port: int, timeout: int = 10) -> List[Content]:
+        """Test port connectivity like netcat's zero-I/O mode (nc -z).
+
+        The connect runs in-process on the event loop; no nc process is
+        started.
 
         Args:
             host: Target host
@@ -182,8 +302,7 @@ class ConnectivityTools(NetOpsTool):
             if not self._validate_port(port):
                 raise ValueError("Invalid port provided")
 
-            command = ['nc', '-z', '-w', str(timeout), host, str(port)]
-            result = self._execute_command(command, timeout + 5)
+            result = await self._tcp_probe(host, int(port), timeout)
             
             response_data = {
                 "host": host,
@@ -218,23 +337,19 @@ class ConnectivityTools(NetOpsTool):
             "mdev_rtt": 0
         }
         
-        # Parse ping statistics
-        lines = output.split('\n')
-        for line in lines:
-            if 'packets transmitted' in line:
-                match = re.search(r'(\d+) packets transmitted, (\d+) received', line)
-                if match:
-                    stats["packets_transmitted"] = int(match.group(1))
-                    stats["packets_received"] = int(match.group(2))
-                    stats["packet_loss_percent"] = 100 - (stats["packets_received"] / stats["packets_transmitted"] * 100)
-            
-            elif 'rtt min/avg/max/mdev' in line:
-                match = re.search(r'(\d+\.?\d*)/(\d+\.?\d*)/(\d+\.?\d*)/(\d+\.?\d*)', line)
-                if match:
-                    stats["min_rtt"] = float(match.group(1))
-                    stats["avg_rtt"] = float(match.group(2))
-                    stats["max_rtt"] = float(match.group(3))
-                    stats["mdev_rtt"] = float(match.group(4))
+        # Search the whole buffer instead of splitting it into lines
+        match = PING_PACKETS_PATTERN.search(output)
+        if match:
+            stats["packets_transmitted"] = int(match.group(1))
+            stats["packets_received"] = int(match.group(2))
+            stats["packet_loss_percent"] = 100 - (stats["packets_received"] / stats["packets_transmitted"] * 100)
+        
+        match = PING_RTT_PATTERN.search(output)
+        if match:
+            stats["min_rtt"] = float(match.group(1))
+            stats["avg_rtt"] = float(match.group(2))
+            stats["max_rtt"] = float(match.group(3))
+            stats["mdev_rtt"] = float(match.group(4))
         
         return stats
 
@@ -283,35 +398,20 @@ class ConnectivityTools(NetOpsTool):
         Returns:
             Dictionary with mtr statistics
         """
-        stats = {
+        # Header, blank and malformed lines simply do not match
+        return {
             "target": "",
-            "hops": []
+            "hops": [
+                {
+                    "hop": int(match[1]),
+                    "host": match[2],
+                    "loss_percent": float(match[3]),
+                    "snt": int(match[4]),
+                    "last": float(match[5]),
+                    "avg": float(match[6]),
+                    "best": float(match[7]),
+                    "worst": float(match[8])
+                }
+                for match in MTR_HOP_PATTERN.finditer(output)
+            ]
         }
-        
-        lines = output.split('\n')
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('Start') or line.startswith('HOST:'):
-                continue
-                
-            parts = line.split()
-            if len(parts) >= 8:
-                try:
-                    # Skip header lines and non-numeric entries
-                    hop_num = int(parts[0])
-                    hop_info = {
-                        "hop": hop_num,
-                        "host": parts[1],
-                        "loss_percent": float(parts[2].rstrip('%')),
-                        "snt": int(parts[3]),
-                        "last": float(parts[4]),
-                        "avg": float(parts[5]),
-                        "best": float(parts[6]),
-                        "worst": float(parts[7])
-                    }
-                    stats["hops"].append(hop_info)
-                except (ValueError, IndexError):
-                    # Skip malformed lines
-                    continue
-        
-        return stats
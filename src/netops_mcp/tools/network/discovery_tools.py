@@ -2,15 +2,69 @@
 Network discovery tools for NetOps MCP.
 """
 
+import asyncio
+import ipaddress
 import re
-from typing import Dict, List, Optional
+import socket
+from typing import Any, Dict, List, Optional
 from mcp.types import TextContent as Content
 from ..base import NetOpsTool
+from ...utils.cache import TTLCache
+
+# Seconds a completed scan is replayed for identical requests
+SCAN_CACHE_TTL = 60
+
+# Scan types accepted by nmap_scan
+SCAN_TYPES = frozenset({'basic', 'quick', 'full'})
+
+# nmap's 100 most common TCP ports (nmap --top-ports 100), swept in-process by quick scans
+TOP_100_PORTS = (
+    7, 9, 13, 21, 22, 23, 25, 26, 37, 53, 79, 80, 81, 88,
+    106, 110, 111, 113, 119, 135, 139, 143, 144, 179, 199, 389, 427, 443,
+    444, 445, 465, 513, 514, 515, 543, 544, 548, 554, 587, 631, 646, 873,
+    990, 993, 995, 1025, 1026, 1027, 1028, 1029, 1110, 1433, 1720, 1723, 1755, 1900,
+    2000, 2001, 2049, 2121, 2717, 3000, 3128, 3306, 3389, 3986, 4899, 5000, 5009, 5051,
+    5060, 5101, 5190, 5357, 5432, 5631, 5666, 5800, 5900, 6000, 6001, 6646, 7070, 8000,
+    8008, 8009, 8080, 8081, 8443, 8888, 9100, 9999, 10000, 32768, 49152, 49153, 49154, 49155,
+    49156, 49157
+)
+
+# TCP connects a quick scan keeps in flight at once
+QUICK_SCAN_CONCURRENCY = 64
+
+# Seconds each quick-scan connect may take before the port counts as filtered
+QUICK_SCAN_CONNECT_TIMEOUT = 1.0
+
+
+def _is_single_host(target: str) -> bool:
+    """Check whether a scan target names exactly one host.
+
+    IP literals and host names qualify; nmap target syntax such as
+    octet ranges (10.0.0.1-5) does not. A name whose last label has no
+    letter cannot be a host name, since top-level domains are alphabetic.
+
+    Args:
+        target: Scan target
+
+    Returns:
+        True if the target is a single IP literal or a host name
+    """
+    try:
+        ipaddress.ip_address(target)
+        return True
+    except ValueError:
+        pass
+    return any(char.isalpha() for char in target.rsplit('.', 1)[-1])
 
 
 class DiscoveryTools(NetOpsTool):
     """Tools for network discovery and scanning."""
 
+    def __init__(self):
+        """Initialize the tool."""
+        super().__init__()
+        self._scan_cache = TTLCache(maxsize=256, ttl=SCAN_CACHE_TTL)
+
     def _validate_scan_type(self, scan_type: str) -> bool:
         """Validate scan type.
 
@@ -23,17 +77,21 @@ class DiscoveryTools(NetOpsTool):
         if not scan_type or not isinstance(scan_type, str):
             return False
         
-        valid_scan_types = ['basic', 'quick', 'full']
-        return scan_type.lower() in valid_scan_types
+        return scan_type.lower() in SCAN_TYPES
 
-    def nmap_scan(self, target: str, ports: Optional[str] = None, scan_type: str = "basic", timeout: int = 300) -> List[Content]:
+    async def nmap_scan(self, target: str, ports: Optional[str] = None, scan_type: str = "basic",
+                        timeout: int = 300, force: bool = False) -> List[Content]:
         """Scan network using nmap.
 
+        Successful scans are cached for SCAN_CACHE_TTL seconds and replayed
+        for identical (target, ports, scan_type) requests.
+
         Args:
             target: Target host or network
             ports: Port range (e.g., '22,80,443' or '1-1000')
             scan_type: Scan type (basic, quick, full)
             timeout: Timeout in seconds
+            force: Bypass the result cache and always run a new scan
 
         Returns:
             List of Content objects with nmap results
@@ -45,24 +103,38 @@ class DiscoveryTools(NetOpsTool):
             if not self._validate_scan_type(scan_type):
                 raise ValueError("Invalid scan type provided")
 
-            # Build nmap command based on scan type
-            if scan_type == "basic":
-                command = ['nmap', '-sT', '-T4']
-            elif scan_type == "quick":
-                command = ['nmap', '-sS', '-T4', '--top-ports', '100']
-            elif scan_type == "full":
-                command = ['nmap', '-sS', '-sV', '-O', '-T4']
-            else:
-                command = ['nmap', '-sT', '-T4']
-            
-            # Add port specification
-            if ports:
-                command.extend(['-p', ports])
-            
-            # Add target
-            command.append(target)
+            cache_key = ("nmap_scan", target, ports, scan_type)
+            if not force:
+                cached = self._scan_cache.get(cache_key)
+                if cached is not None:
+                    return await self._format_response_async(
+                        dict(cached, cached=True), "nmap_scan", len(cached["stdout"])
+                    )
+
+            result = None
+            if scan_type == "quick" and not ports:
+                # Top-100 connect sweep runs in-process; no nmap start-up
+                result = await self._quick_scan(target, timeout)
             
-            result = self._execute_command(command, timeout)
+            if result is None:
+                # Build nmap command based on scan type
+                if scan_type == "basic":
+                    command = ['nmap', '-sT', '-T4']
+                elif scan_type == "quick":
+                    command = ['nmap', '-sS', '-T4', '--top-ports', '100']
+                elif scan_type == "full":
+                    command = ['nmap', '-sS', '-sV', '-O', '-T4']
+                else:
+                    command = ['nmap', '-sT', '-T4']
+                
+                # Add port specification
+                if ports:
+                    command.extend(['-p', ports])
+                
+                # Add target
+                command.append(target)
+                
+                result = await self._execute_command_async(command, timeout)
             
             response_data = {
                 "target": target,
@@ -74,17 +146,122 @@ class DiscoveryTools(NetOpsTool):
                 "return_code": result["return_code"]
             }
             
-            return self._format_response(response_data, "nmap_scan")
+            if result["success"]:
+                self._scan_cache.set(cache_key, response_data)
+            
+            return await self._format_response_async(
+                response_data, "nmap_scan", len(result["stdout"])
+            )
             
         except Exception as e:
             return self._handle_error("nmap scan", e)
 
-    def service_discovery(self, target: str, ports: Optional[str] = None) -> List[Content]:
+    async def _quick_scan(self, target: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """TCP connect scan of TOP_100_PORTS on a single host, in-process.
+
+        The target is resolved once and every address it resolves to is
+        probed, at most QUICK_SCAN_CONCURRENCY connects at a time, with
+        timeout as the deadline for the whole scan. Targets that are not a
+        single IP literal or host name (nmap ranges such as 10.0.0.1-5) are
+        left to nmap.
+
+        Args:
+            target: Target host
+            timeout: Seconds the scan may take, including name resolution
+
+        Returns:
+            Dictionary in the same shape as _execute_command_async results,
+            with nmap-style port table output, or None if the target has to
+            be scanned by nmap. Resolution failures and hosts where no port
+            answered are reported as unsuccessful.
+        """
+        if not _is_single_host(target):
+            return None
+        
+        command = [f"tcp-connect-scan --top-ports {len(TOP_100_PORTS)} {target}"]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        try:
+            infos = await asyncio.wait_for(loop.getaddrinfo(target, None, type=socket.SOCK_STREAM), timeout)
+        except (OSError, asyncio.TimeoutError) as e:
+            return self._command_failure(command, f"Failed to resolve {target}: {str(e) or 'timed out'}",
+                                         return_code=1)
+        # One socket address per distinct IP; the port is filled in per probe
+        addresses: Dict[str, tuple] = {}
+        for info in infos:
+            addresses.setdefault(info[4][0], info)
+        
+        limit = asyncio.Semaphore(QUICK_SCAN_CONCURRENCY)
+
+        async def probe(info: tuple, port: int) -> str:
+            family, sock_type, proto, _, sockaddr = info
+            async with limit:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return "filtered"
+                sock = socket.socket(family, sock_type, proto)
+                sock.setblocking(False)
+                try:
+                    await asyncio.wait_for(loop.sock_connect(sock, (sockaddr[0], port, *sockaddr[2:])),
+                                           min(QUICK_SCAN_CONNECT_TIMEOUT, remaining))
+                    return "open"
+                except ConnectionRefusedError:
+                    return "closed"
+                except (OSError, asyncio.TimeoutError):
+                    return "filtered"
+                finally:
+                    sock.close()
+
+        states = await asyncio.gather(
+            *(probe(info, port) for info in addresses.values() for port in TOP_100_PORTS)
+        )
+        
+        lines = []
+        hosts_up = 0
+        for index, address in enumerate(addresses):
+            address_states = states[index * len(TOP_100_PORTS):(index + 1) * len(TOP_100_PORTS)]
+            if lines:
+                lines.append("")
+            lines.append(f"TCP connect scan report for {target} ({address})")
+            if all(state == "filtered" for state in address_states):
+                # Nothing accepted or refused a connection
+                lines.append("Note: Host seems down.")
+                continue
+            hosts_up += 1
+            open_ports = [port for port, state in zip(TOP_100_PORTS, address_states) if state == "open"]
+            lines.extend([
+                f"Not shown: {len(TOP_100_PORTS) - len(open_ports)} closed or filtered tcp ports",
+                "PORT      STATE SERVICE"
+            ])
+            for port in open_ports:
+                try:
+                    service = socket.getservbyport(port, 'tcp')
+                except OSError:
+                    service = "unknown"
+                lines.append(f"{f'{port}/tcp':<9} open  {service}")
+        
+        stdout = "\n".join(lines) + "\n"
+        if not hosts_up:
+            return self._command_failure(command, f"{target} seems down", stdout=stdout, return_code=1)
+        return {
+            "success": True,
+            "stdout": stdout,
+            "stderr": "",
+            "return_code": 0,
+            "command": command[0]
+        }
+
+    async def service_discovery(self, target: str, ports: Optional[str] = None,
+                                force: bool = False) -> List[Content]:
         """Discover network services on a target.
 
+        Successful scans are cached for SCAN_CACHE_TTL seconds and replayed
+        for identical (target, ports) requests.
+
         Args:
             target: Target host
             ports: Port range to scan
+            force: Bypass the result cache and always run a new scan
 
         Returns:
             List of Content objects with service discovery results
@@ -93,6 +270,14 @@ class DiscoveryTools(NetOpsTool):
             if not self._validate_host(target):
                 raise ValueError("Invalid target provided")
 
+            cache_key = ("service_discovery", target, ports)
+            if not force:
+                cached = self._scan_cache.get(cache_key)
+                if cached is not None:
+                    return await self._format_response_async(
+                        dict(cached, cached=True), "service_discovery", len(cached["stdout"])
+                    )
+
             # Use nmap for service discovery
             command = ['nmap', '-sV', '-sC', '--version-intensity', '5']
             
@@ -101,7 +286,7 @@ class DiscoveryTools(NetOpsTool):
             
             command.append(target)
             
-            result = self._execute_command(command, 180)
+            result = await self._execute_command_async(command, 180)
             
             response_data = {
                 "target": target,
@@ -112,7 +297,12 @@ class DiscoveryTools(NetOpsTool):
                 "return_code": result["return_code"]
             }
             
-            return self._format_response(response_data, "service_discovery")
+            if result["success"]:
+                self._scan_cache.set(cache_key, response_data)
+            
+            return await self._format_response_async(
+                response_data, "service_discovery", len(result["stdout"])
+            )
             
         except Exception as e:
             return self._handle_error("service discovery", e)
@@ -2,10 +2,29 @@
 DNS tools for NetOps MCP.
 """
 
-import re
+from functools import lru_cache
 from typing import Dict, List, Optional
 from mcp.types import TextContent as Content
-from ..base import NetOpsTool
+from ..base import NetOpsTool, IP_PATTERN, DOMAIN_PATTERN
+
+
+@lru_cache(maxsize=4096)
+def _validate_domain_cached(domain: str) -> bool:
+    """Validate domain name format (memoized)."""
+    return bool(DOMAIN_PATTERN.match(domain))
+
+
+@lru_cache(maxsize=4096)
+def _validate_record_type_cached(record_type: str) -> bool:
+    """Validate DNS record type (memoized)."""
+    valid_record_types = ['A', 'AAAA', 'MX', 'NS', 'TXT', 'CNAME', 'PTR', 'SOA', 'SRV', 'CAA']
+    return record_type.upper() in valid_record_types
+
+
+@lru_cache(maxsize=4096)
+def _validate_dns_server_cached(server: str) -> bool:
+    """Validate DNS server address as an IP address or domain name (memoized)."""
+    return bool(IP_PATTERN.match(server) or DOMAIN_PATTERN.match(server))
 
 
 class DNSTools(NetOpsTool):
@@ -23,12 +42,7 @@ class DNSTools(NetOpsTool):
         if not domain or not isinstance(domain, str):
             return False
         
-        # Basic domain validation regex
-        domain_pattern = re.compile(
-            r'^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)*[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?$'
-        )
-        
-        return bool(domain_pattern.match(domain))
+        return _validate_domain_cached(domain)
 
     def _validate_record_type(self, record_type: str) -> bool:
         """Validate DNS record type.
@@ -42,8 +56,7 @@ class DNSTools(NetOpsTool):
         if not record_type or not isinstance(record_type, str):
             return False
         
-        valid_record_types = ['A', 'AAAA', 'MX', 'NS', 'TXT', 'CNAME', 'PTR', 'SOA', 'SRV', 'CAA']
-        return record_type.upper() in valid_record_types
+        return _validate_record_type_cached(record_type)
 
     def _validate_dns_server(self, server: str) -> bool:
         """Validate DNS server address.
@@ -57,19 +70,9 @@ class DNSTools(NetOpsTool):
         if not server or not isinstance(server, str):
             return False
         
-        # Check if it's a valid IP address
-        ip_pattern = re.compile(
-            r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$'
-        )
-        
-        # Check if it's a valid domain name
-        domain_pattern = re.compile(
-            r'^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)*[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?$'
-        )
-        
-        return bool(ip_pattern.match(server) or domain_pattern.match(server))
+        return _validate_dns_server_cached(server)
 
-    def nslookup_query(self, domain: str, record_type: str = "A", server: Optional[str] = None) -> List[Content]:
+    async def nslookup_query(self, domain: str, record_type: str = "A", server: Optional[str] = None) -> List[Content]:
         """Perform DNS lookup using nslookup.
 
         Args:
@@ -94,7 +97,7 @@ class DNSTools(NetOpsTool):
             if server:
                 command.append(server)
             
-            result = self._execute_command(command, 30)
+            result = await self._execute_command_async(command, 30)
             
             response_data = {
                 "domain": domain,
@@ -111,7 +114,7 @@ class DNSTools(NetOpsTool):
         except Exception as e:
             return self._handle_error("nslookup query", e)
 
-    def dig_query(self, domain: str, record_type: str = "A", server: Optional[str] = None) -> List[Content]:
+    async def dig_query(self, domain: str, record_type: str = "A", server: Optional[str] = None) -> List[Content]:
         """Perform DNS lookup using dig.
 
         Args:
@@ -136,7 +139,7 @@ class DNSTools(NetOpsTool):
             if server:
                 command.extend(['@' + server])
             
-            result = self._execute_command(command, 30)
+            result = await self._execute_command_async(command, 30)
             
             response_data = {
                 "domain": domain,
@@ -153,7 +156,7 @@ class DNSTools(NetOpsTool):
         except Exception as e:
             return self._handle_error("dig query", e)
 
-    def host_lookup(self, domain: str, record_type: str = "A") -> List[Content]:
+    async def host_lookup(self, domain: str, record_type: str = "A") -> List[Content]:
         """Perform DNS lookup using host command.
 
         Args:
@@ -171,7 +174,7 @@ class DNSTools(NetOpsTool):
                 raise ValueError("Invalid record type provided")
 
             command = ['host', '-t', record_type, domain]
-            result = self._execute_command(command, 30)
+            result = await self._execute_command_async(command, 30)
             
             response_data = {
                 "domain": domain,
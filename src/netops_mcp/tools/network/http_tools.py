@@ -2,16 +2,90 @@
 HTTP/API testing tools for NetOps MCP.
 """
 
+import asyncio
+import ipaddress
 import json
+import math
 import re
-from typing import Dict, List, Optional, Any
+import socket
+import time
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
+from threading import Thread
+from typing import Dict, List, Optional, Any, Hashable, Tuple
+from urllib.parse import urlparse
+import httpx
 from mcp.types import TextContent as Content
 from ..base import NetOpsTool
+from ...utils import serialization
+from ...utils.cache import TTLCache
+
+# Basic URL validation regex
+URL_PATTERN = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
+VALID_METHODS = frozenset({'GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS'})
+
+# Connection pool limits of the persistent in-process HTTP client
+MAX_HTTP_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 32
+
+# How long ETag/Last-Modified validators are kept for conditional requests
+VALIDATOR_CACHE_TTL = 3600
+
+# Seconds a resolved address is pinned for curl with --resolve
+DNS_CACHE_TTL = 60
+
+# Seconds a failed lookup is remembered, so calls made while DNS is down
+# do not each wait out the resolver before curl retries it
+DNS_FAILURE_CACHE_TTL = 10
+
+# curl exit codes after which a pinned address is dropped
+# (6: could not resolve host, 7: could not connect)
+CURL_RESOLVE_FAILURE_CODES = (6, 7)
+
+# Concurrent transfers of a single 'curl --parallel' run in api_test_bulk
+CURL_PARALLEL_MAX = 32
+
+# Default cap on response body characters returned by curl_request/api_test;
+# larger bodies are truncated and not kept for revalidation
+MAX_BODY_SIZE = 1_048_576
+
+# Bytes of response headers read ahead of max_body when curl's output is capped
+CURL_HEADER_ALLOWANCE = 64 * 1024
+
+# curl prints the response headers and body to stdout, and this separator and
+# the write-out statistics to stderr, so capping stdout never cuts the stats
+CURL_STATS_SEPARATOR = "\n---CURL-STATS---\n"
+CURL_STATS_FORMAT = '%{json}'
+
+# Fixed leading arguments of the curl commands; method and URL follow '-X'
+CURL_COMMAND_PREFIX = ('curl', '-s', '-D', '-', '-w', '%{stderr}' + CURL_STATS_SEPARATOR + CURL_STATS_FORMAT, '-X')
+API_TEST_COMMAND_PREFIX = ('curl', '-s', '-D', '-', '-w', '%{stderr}' + CURL_STATS_SEPARATOR + '%{http_code}', '-X')
+
+# Write-out fields surfaced in the curl_request stats
+CURL_STATS_FIELDS = (
+    'http_code', 'time_namelookup', 'time_connect', 'time_appconnect',
+    'time_starttransfer', 'time_total', 'size_download', 'speed_download'
+)
 
 
 class HTTPTools(NetOpsTool):
     """Tools for HTTP/API testing and diagnostics."""
 
+    def __init__(self):
+        """Initialize HTTP tools."""
+        super().__init__()
+        self._response_cache = TTLCache(maxsize=256, ttl=VALIDATOR_CACHE_TTL)
+        self._dns_cache = TTLCache(maxsize=256, ttl=DNS_CACHE_TTL)
+        self._dns_failure_cache = TTLCache(maxsize=256, ttl=DNS_FAILURE_CACHE_TTL)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
     def _validate_url(self, url: str) -> bool:
         """Validate URL format.
 
@@ -24,16 +98,7 @@ class HTTPTools(NetOpsTool):
         if not url or not isinstance(url, str):
             return False
         
-        # Basic URL validation regex
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        
-        return bool(url_pattern.match(url))
+        return bool(URL_PATTERN.match(url))
 
     def _validate_method(self, method: str) -> bool:
         """Validate HTTP method.
@@ -47,8 +112,113 @@ class HTTPTools(NetOpsTool):
         if not method or not isinstance(method, str):
             return False
         
-        valid_methods = ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS']
-        return method.upper() in valid_methods
+        return method.upper() in VALID_METHODS
+
+    def _resolve_target(self, url: str) -> Optional[Tuple[str, int]]:
+        """Extract the host name and port curl will connect to.
+
+        Args:
+            url: Target URL
+
+        Returns:
+            Tuple of (host, port), or None for IP literals and unparsable URLs
+        """
+        try:
+            parsed = urlparse(url)
+            port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+        except ValueError:
+            return None
+        
+        host = parsed.hostname
+        if not host:
+            return None
+        try:
+            ipaddress.ip_address(host)
+            return None
+        except ValueError:
+            return host, port
+
+    def _resolve_args(self, url: str, timeout: int) -> Tuple[List[str], int]:
+        """Build curl '--resolve' arguments from the DNS cache.
+
+        Host names are resolved once and the address is pinned for
+        DNS_CACHE_TTL seconds, so repeated curl runs skip DNS resolution.
+        Failed lookups are not retried for DNS_FAILURE_CACHE_TTL seconds.
+        The lookup counts against the request timeout, and curl gets
+        whatever is left of it.
+
+        Args:
+            url: Target URL
+            timeout: Request timeout in seconds
+
+        Returns:
+            Tuple of ('--resolve' arguments, or an empty list if the host
+            cannot be resolved, and the whole seconds left for curl)
+        """
+        start = time.monotonic()
+        target = self._resolve_target(url)
+        if target is None:
+            return [], timeout
+        
+        addresses = self._dns_cache.get(target)
+        if addresses is None:
+            if self._dns_failure_cache.get(target) is not None:
+                return [], timeout
+            try:
+                infos = self._getaddrinfo(target[0], target[1], timeout)
+            except (OSError, FuturesTimeoutError):
+                self._dns_failure_cache.set(target, True)
+                return [], max(1, math.ceil(timeout - (time.monotonic() - start)))
+            # Keep every address so curl can still fall back between them
+            addresses = ','.join(dict.fromkeys(
+                f'[{info[4][0]}]' if info[0] == socket.AF_INET6 else info[4][0] for info in infos
+            ))
+            self._dns_cache.set(target, addresses)
+        
+        remaining = max(1, math.ceil(timeout - (time.monotonic() - start)))
+        return ['--resolve', f'{target[0]}:{target[1]}:{addresses}'], remaining
+
+    @staticmethod
+    def _getaddrinfo(host: str, port: int, timeout: float) -> list:
+        """Resolve a host, giving up after timeout seconds.
+
+        getaddrinfo has no timeout of its own, so it runs on a daemon thread
+        that is abandoned if the resolver does not answer in time.
+
+        Args:
+            host: Host name
+            port: Port number
+            timeout: Seconds to wait for the resolver
+
+        Returns:
+            socket.getaddrinfo results
+
+        Raises:
+            OSError: If the host cannot be resolved
+            concurrent.futures.TimeoutError: If the resolver does not answer in time
+        """
+        future: Future = Future()
+
+        def run() -> None:
+            try:
+                future.set_result(socket.getaddrinfo(host, port, type=socket.SOCK_STREAM))
+            except BaseException as e:
+                future.set_exception(e)
+
+        Thread(target=run, name=f"getaddrinfo {host}", daemon=True).start()
+        return future.result(timeout)
+
+    def _forget_resolution(self, url: str, return_code: int) -> None:
+        """Drop a pinned address after a resolve or connect failure.
+
+        Args:
+            url: Target URL
+            return_code: curl exit code
+        """
+        if return_code in CURL_RESOLVE_FAILURE_CODES:
+            target = self._resolve_target(url)
+            if target is not None:
+                self._dns_cache.delete(target)
 
     def _format_curl_command(self, url: str, method: str = "GET", 
                            headers: Optional[Dict[str, str]] = None,
@@ -65,19 +235,19 @@ class HTTPTools(NetOpsTool):
         Returns:
             List of command arguments
         """
-        command = ['curl', '-s', '-w', '@-', '-o', '/tmp/curl_output', '-X', method, url]
+        resolve_args, timeout = self._resolve_args(url, timeout)
+        command = [*CURL_COMMAND_PREFIX, method, url, *resolve_args]
         
         # Add headers
         if headers:
-            for key, value in headers.items():
-                command.extend(['-H', f'{key}: {value}'])
+            command += [arg for key, value in headers.items() for arg in ('-H', f'{key}: {value}')]
         
         # Add data
         if data:
-            command.extend(['-d', data])
+            command += ['-d', data]
         
         # Add timeout
-        command.extend(['--max-time', str(timeout)])
+        command += ['--max-time', str(timeout)]
         
         return command
 
@@ -101,13 +271,11 @@ class HTTPTools(NetOpsTool):
         
         # Add headers
         if headers:
-            for key, value in headers.items():
-                command.extend([f'{key}:{value}'])
+            command += [f'{key}:{value}' for key, value in headers.items()]
         
         # Add data
         if data:
-            for key, value in data.items():
-                command.extend([f'{key}={value}'])
+            command += [f'{key}={value}' for key, value in data.items()]
         
         return command
 
@@ -115,26 +283,398 @@ class HTTPTools(NetOpsTool):
         """Parse curl output statistics.
 
         Args:
-            output: Raw curl output
+            output: curl '%{json}' write-out
 
         Returns:
-            Dictionary with parsed statistics
+            Dictionary with the surfaced statistics
         """
         try:
-            return json.loads(output)
+            stats = serialization.loads(output)
+            return {field: stats[field] for field in CURL_STATS_FIELDS if field in stats}
         except json.JSONDecodeError:
             return {"error": "Could not parse curl output"}
 
+    def _split_response_headers(self, output: str) -> Tuple[int, Dict[str, str], str]:
+        """Split curl output written with '-D -' into status, headers and body.
+
+        Args:
+            output: Response headers followed by the response body
+
+        Returns:
+            Tuple of (status code, lower-cased headers, body)
+        """
+        status_code = 0
+        headers: Dict[str, str] = {}
+        body = output
+        
+        # Skip interim 1xx blocks (e.g. 100 Continue) to reach the final response
+        while body.startswith('HTTP/'):
+            crlf = body.find('\r\n\r\n')
+            lf = body.find('\n\n')
+            if crlf != -1 and (lf == -1 or crlf < lf):
+                head, body = body[:crlf], body[crlf + 4:]
+            elif lf != -1:
+                head, body = body[:lf], body[lf + 2:]
+            else:
+                head, body = body, ""
+            
+            lines = head.splitlines()
+            status_parts = lines[0].split()
+            status_code = int(status_parts[1]) if len(status_parts) > 1 and status_parts[1].isdigit() else 0
+            headers = {}
+            for line in lines[1:]:
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+            
+            if not 100 <= status_code < 200:
+                break
+        
+        return status_code, headers, body
+
+    def _validator_cache_key(self, url: str, method: str, headers: Optional[Dict[str, str]],
+                             data: Optional[Any] = None) -> Optional[Hashable]:
+        """Build the conditional request cache key for a request.
+
+        Args:
+            url: Target URL
+            method: HTTP method
+            headers: Optional HTTP headers
+            data: Optional request body
+
+        Returns:
+            Cache key, or None if the request is not cacheable
+        """
+        if method.upper() not in ('GET', 'HEAD') or data:
+            return None
+        return (method.upper(), url, tuple(sorted((headers or {}).items())))
+
+    def _conditional_headers(self, cached: Optional[Dict[str, Any]],
+                             headers: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        """Add If-None-Match/If-Modified-Since headers for a cached response.
+
+        Args:
+            cached: Cached response entry, if any
+            headers: Optional HTTP headers supplied by the caller
+
+        Returns:
+            Headers to send with the request
+        """
+        if not cached:
+            return headers
+        
+        request_headers = dict(headers or {})
+        if cached["etag"]:
+            request_headers['If-None-Match'] = cached["etag"]
+        if cached["last_modified"]:
+            request_headers['If-Modified-Since'] = cached["last_modified"]
+        return request_headers
+
+    def _store_validators(self, cache_key: Optional[Hashable], status_code: int,
+                          headers: Dict[str, str], body: str) -> None:
+        """Cache a response that carries ETag or Last-Modified validators.
+
+        Args:
+            cache_key: Key from _validator_cache_key
+            status_code: HTTP status code
+            headers: Lower-cased response headers
+            body: Response body
+        """
+        if cache_key is None or not 200 <= status_code < 300 or len(body) > MAX_BODY_SIZE:
+            return
+        
+        etag = headers.get('etag')
+        last_modified = headers.get('last-modified')
+        if etag or last_modified:
+            self._response_cache.set(cache_key, {
+                "status_code": status_code,
+                "etag": etag,
+                "last_modified": last_modified,
+                "body": body
+            })
+
+    def _quote_curl_config(self, value: str) -> str:
+        """Quote a value for a curl config file.
+
+        Args:
+            value: Option value
+
+        Returns:
+            Double-quoted, escaped value
+        """
+        if '\n' in value or '\r' in value:
+            raise ValueError("Line breaks are not allowed in URLs or headers")
+        return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+    def _format_curl_config(self, cases: List[Dict[str, Any]], timeout: int = 30) -> str:
+        """Format a curl config with one transfer block per API test case.
+
+        Each block discards the body and writes a '%{json}' line, so the
+        results of all transfers can be read from stdout.
+
+        Args:
+            cases: Validated test cases with url, method and optional headers
+            timeout: Per-transfer timeout in seconds
+
+        Returns:
+            curl config text for '-K -'
+        """
+        blocks = []
+        for case in cases:
+            lines = [
+                f'url = {self._quote_curl_config(case["url"])}',
+                f'request = {self._quote_curl_config(case["method"])}'
+            ]
+            for key, value in (case.get("headers") or {}).items():
+                lines.append(f'header = {self._quote_curl_config(f"{key}: {value}")}')
+            lines.extend([
+                'output = "/dev/null"',
+                'write-out = "%{json}\\n"',
+                f'max-time = {timeout}'
+            ])
+            blocks.append('\n'.join(lines))
+        return '\nnext\n'.join(blocks) + '\n'
+
+    async def _http_client(self) -> httpx.AsyncClient:
+        """Return the persistent async HTTP client, creating it on first use.
+
+        Connections are kept alive between calls, so repeated requests to
+        the same origin skip DNS resolution and TCP/TLS setup. A new client
+        is created if the previous one was closed or belongs to another
+        event loop; in the latter case the old client is closed first.
+
+        Returns:
+            Shared httpx.AsyncClient
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is not loop:
+            await self.close()
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=MAX_HTTP_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+                ),
+                follow_redirects=False
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def close(self) -> None:
+        """Close the persistent HTTP client and its pooled connections.
+
+        The client's connections belong to the event loop it was created
+        on, so they are closed there: directly when that is the current
+        loop, on the loop's own thread while it is still running, or by
+        running it briefly in a worker thread otherwise. A client whose
+        loop is already closed cannot be shut down cleanly and is dropped.
+        """
+        client, client_loop = self._client, self._client_loop
+        self._client = None
+        self._client_loop = None
+        if client is None or client.is_closed:
+            return
+        
+        try:
+            if client_loop is asyncio.get_running_loop():
+                await client.aclose()
+            elif client_loop is None or client_loop.is_closed():
+                self.logger.debug("Dropping HTTP client of a closed event loop")
+            elif client_loop.is_running():
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(client.aclose(), client_loop)
+                )
+            else:
+                await asyncio.to_thread(client_loop.run_until_complete, client.aclose())
+        except Exception as e:
+            self.logger.warning(f"Failed to close HTTP client: {e}")
+
+    async def _fetch(self, client: httpx.AsyncClient, url: str, method: str = "GET",
+                     headers: Optional[Dict[str, str]] = None,
+                     data: Optional[str] = None, timeout: int = 30) -> Dict[str, Any]:
+        """Execute a single HTTP request on an existing client.
+
+        Args:
+            client: Shared async HTTP client
+            url: Target URL
+            method: HTTP method
+            headers: Optional HTTP headers
+            data: Optional request body
+            timeout: Request timeout in seconds
+
+        Returns:
+            Dictionary with status, timing and size of the response
+        """
+        if not self._validate_url(url):
+            return {"url": url, "method": method, "success": False, "error": "Invalid URL provided"}
+
+        start = time.perf_counter()
+        try:
+            response = await client.request(method.upper(), url, headers=headers, content=data,
+                                            timeout=timeout)
+            return {
+                "url": url,
+                "method": method,
+                "success": True,
+                "status_code": response.status_code,
+                "time_total_ms": round((time.perf_counter() - start) * 1000, 2),
+                "size_download": len(response.content),
+                "content_type": response.headers.get("content-type")
+            }
+        except httpx.HTTPError as e:
+            return {
+                "url": url,
+                "method": method,
+                "success": False,
+                "error": str(e) or type(e).__name__,
+                "time_total_ms": round((time.perf_counter() - start) * 1000, 2)
+            }
+
+    async def bulk_request(self, urls: List[str], method: str = "GET",
+                           headers: Optional[Dict[str, str]] = None,
+                           timeout: int = 30) -> List[Content]:
+        """Execute HTTP requests against many URLs concurrently.
+
+        All requests go through the persistent connection pool in this
+        process, so no curl process is started per URL and connections
+        are reused across calls.
+
+        Args:
+            urls: Target URLs
+            method: HTTP method
+            headers: Optional HTTP headers sent with every request
+            timeout: Per-request timeout in seconds
+
+        Returns:
+            List of Content objects with one result per URL
+        """
+        try:
+            if not urls or not isinstance(urls, list):
+                raise ValueError("At least one URL must be provided")
+
+            if not self._validate_method(method):
+                raise ValueError("Invalid HTTP method provided")
+
+            client = await self._http_client()
+            results = await asyncio.gather(
+                *(self._fetch(client, url, method, headers, timeout=timeout) for url in urls)
+            )
+
+            response_data = {
+                "method": method,
+                "total": len(results),
+                "succeeded": sum(1 for r in results if r["success"]),
+                "results": list(results)
+            }
+
+            return self._format_response(response_data, "bulk_request")
+
+        except Exception as e:
+            return self._handle_error("bulk request", e)
+
+    def api_test_bulk(self, cases: List[Dict[str, Any]], timeout: int = 30) -> List[Content]:
+        """Test many API endpoints with a single parallel curl run.
+
+        Each case is a dictionary with 'url' and optional 'method'
+        (default GET), 'expected_status' (default 200) and 'headers'.
+        All transfers run from one 'curl --parallel' process, which falls
+        back to one api_test per case if parallel transfers are not
+        supported by the installed curl (older than 7.66).
+
+        Args:
+            cases: API test cases
+            timeout: Per-request timeout in seconds
+
+        Returns:
+            List of Content objects with one test result per case
+        """
+        try:
+            if not cases or not isinstance(cases, list):
+                raise ValueError("At least one test case must be provided")
+
+            results: List[Optional[Dict[str, Any]]] = [None] * len(cases)
+            valid_cases = []
+            for index, case in enumerate(cases):
+                if not isinstance(case, dict):
+                    results[index] = {"success": False, "error": "Test case must be an object",
+                                      "test_passed": False}
+                    continue
+                method = case.get("method", "GET")
+                url = case.get("url")
+                if not self._validate_url(url) or not self._validate_method(method):
+                    results[index] = {"url": url, "method": method, "success": False,
+                                      "error": "Invalid URL or HTTP method provided", "test_passed": False}
+                    continue
+                valid_cases.append((index, dict(case, method=method.upper())))
+
+            if valid_cases:
+                config = self._format_curl_config([case for _, case in valid_cases], timeout)
+                command = ['curl', '-sS', '-Z', '--parallel-max', str(CURL_PARALLEL_MAX), '-K', '-']
+                rounds = -(-len(valid_cases) // CURL_PARALLEL_MAX)
+                result = self._execute_command(command, timeout * rounds + 5, input_data=config)
+
+                # Transfers finish in any order; urlnum is the position in the config
+                transfers = {}
+                for line in result["stdout"].splitlines():
+                    try:
+                        transfer = serialization.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(transfer, dict) and "urlnum" in transfer:
+                        transfers[transfer["urlnum"]] = transfer
+
+                for position, (index, case) in enumerate(valid_cases):
+                    expected_status = case.get("expected_status", 200)
+                    transfer = transfers.get(position)
+                    if transfer is None and not transfers:
+                        # curl without --parallel support: run the case on its own
+                        results[index] = serialization.loads(self.api_test(
+                            case["url"], case["method"], expected_status, case.get("headers"), timeout
+                        )[0].text)
+                        continue
+                    if transfer is None:
+                        results[index] = {"url": case["url"], "method": case["method"], "success": False,
+                                          "error": "No result reported by curl", "test_passed": False}
+                        continue
+                    status_code = transfer.get("http_code", 0)
+                    results[index] = {
+                        "url": case["url"],
+                        "method": case["method"],
+                        "expected_status": expected_status,
+                        "actual_status": status_code,
+                        "success": status_code == expected_status,
+                        "time_total": transfer.get("time_total"),
+                        "error": transfer.get("errormsg") if transfer.get("exitcode") else None,
+                        "test_passed": status_code == expected_status
+                    }
+
+            response_data = {
+                "total": len(results),
+                "passed": sum(1 for r in results if r.get("test_passed")),
+                "results": results
+            }
+            
+            return self._format_response(response_data, "api_test_bulk")
+            
+        except Exception as e:
+            return self._handle_error("API bulk test", e)
+
     def curl_request(self, url: str, method: str = "GET", headers: Optional[Dict[str, str]] = None, 
-                    data: Optional[str] = None, timeout: int = 30) -> List[Content]:
+                    data: Optional[str] = None, timeout: int = 30,
+                    max_body: int = MAX_BODY_SIZE) -> List[Content]:
         """Execute HTTP request using curl.
 
+        Host names are resolved before curl runs and pinned with --resolve.
+        When dns_pinned is true in the result, curl did no DNS lookup, so
+        stats.time_namelookup excludes DNS time.
+
         Args:
             url: Target URL
             method: HTTP method (GET, POST, PUT, DELETE, etc.)
             headers: Optional HTTP headers
             data: Optional request body
             timeout: Request timeout in seconds
+            max_body: Maximum number of response body characters to return; curl's
+                output is only held up to this many bytes past the headers
 
         Returns:
             List of Content objects with curl response
@@ -145,37 +685,51 @@ class HTTPTools(NetOpsTool):
             
             if not self._validate_method(method):
                 raise ValueError("Invalid HTTP method provided")
+            
+            if max_body < 0:
+                raise ValueError("max_body must not be negative")
 
-            command = self._format_curl_command(url, method, headers, data, timeout)
+            # Revalidate previously seen responses instead of downloading them again
+            cache_key = self._validator_cache_key(url, method, headers, data)
+            cached = self._response_cache.get(cache_key) if cache_key else None
+            request_headers = self._conditional_headers(cached, headers)
+
+            command = self._format_curl_command(url, method, request_headers, data, timeout)
             
             # Execute curl with format
-            result = self._execute_command(command, timeout + 5)
+            result = self._execute_command(command, timeout + 5, max_stdout=CURL_HEADER_ALLOWANCE + max_body)
+            self._forget_resolution(url, result["return_code"])
+            curl_errors, _, stats_output = result["stderr"].partition(CURL_STATS_SEPARATOR)
             
             if result["success"]:
-                # Read output file
-                try:
-                    with open('/tmp/curl_output', 'r') as f:
-                        response_body = f.read()
-                except FileNotFoundError:
-                    response_body = ""
+                status_code, response_headers, response_body = self._split_response_headers(result["stdout"])
+                stats = self._parse_curl_output(stats_output)
+                cut_short = result.get("stdout_truncated", False)
                 
-                # Parse curl stats
-                stats = self._parse_curl_output(result["stdout"])
+                from_cache = status_code == 304 and cached is not None
+                if from_cache:
+                    response_body = cached["body"]
+                elif not cut_short:
+                    self._store_validators(cache_key, status_code, response_headers, response_body)
                 
                 response_data = {
                     "url": url,
                     "method": method,
                     "success": True,
                     "stats": stats,
-                    "response_body": response_body,
-                    "stderr": result["stderr"]
+                    "dns_pinned": '--resolve' in command,
+                    "response_headers": response_headers,
+                    "response_body": response_body[:max_body],
+                    "truncated": cut_short or len(response_body) > max_body,
+                    "from_cache": from_cache,
+                    "stderr": curl_errors
                 }
             else:
                 response_data = {
                     "url": url,
                     "method": method,
                     "success": False,
-                    "error": result["stderr"],
+                    "error": curl_errors,
                     "return_code": result["return_code"]
                 }
             
@@ -224,7 +778,8 @@ class HTTPTools(NetOpsTool):
             return self._handle_error("httpie request", e)
 
     def api_test(self, url: str, method: str = "GET", expected_status: int = 200,
-                headers: Optional[Dict[str, str]] = None, timeout: int = 30) -> List[Content]:
+                headers: Optional[Dict[str, str]] = None, timeout: int = 30,
+                max_body: int = MAX_BODY_SIZE) -> List[Content]:
         """Test API endpoint with validation.
 
         Args:
@@ -233,6 +788,8 @@ class HTTPTools(NetOpsTool):
             expected_status: Expected HTTP status code
             headers: Optional HTTP headers
             timeout: Request timeout
+            max_body: Maximum number of response body characters to return; curl's
+                output is only held up to this many bytes past the headers
 
         Returns:
             List of Content objects with API test results
@@ -243,41 +800,58 @@ class HTTPTools(NetOpsTool):
             
             if not self._validate_method(method):
                 raise ValueError("Invalid HTTP method provided")
+            
+            if max_body < 0:
+                raise ValueError("max_body must not be negative")
+
+            # Revalidate previously seen responses unless a 304 is what is being tested
+            cache_key = None
+            if expected_status != 304:
+                cache_key = self._validator_cache_key(url, method, headers)
+            cached = self._response_cache.get(cache_key) if cache_key else None
+            request_headers = self._conditional_headers(cached, headers)
 
             # Use curl for API testing with proper output handling
-            command = ['curl', '-s', '-w', '%{http_code}', '-o', '/tmp/api_response', '-X', method, url]
+            resolve_args, curl_timeout = self._resolve_args(url, timeout)
+            command = [*API_TEST_COMMAND_PREFIX, method, url, *resolve_args]
             
             # Add headers
-            if headers:
-                for key, value in headers.items():
-                    command.extend(['-H', f'{key}: {value}'])
+            if request_headers:
+                command += [arg for key, value in request_headers.items() for arg in ('-H', f'{key}: {value}')]
             
             # Add timeout
-            command.extend(['--max-time', str(timeout)])
+            command += ['--max-time', str(curl_timeout)]
             
-            result = self._execute_command(command, timeout + 5)
+            result = self._execute_command(command, curl_timeout + 5, max_stdout=CURL_HEADER_ALLOWANCE + max_body)
+            self._forget_resolution(url, result["return_code"])
+            curl_errors, _, status_output = result["stderr"].partition(CURL_STATS_SEPARATOR)
             
             if result["success"]:
-                # Read response body
-                try:
-                    with open('/tmp/api_response', 'r') as f:
-                        response_body = f.read()
-                except FileNotFoundError:
-                    response_body = ""
+                _, response_headers, response_body = self._split_response_headers(result["stdout"])
+                cut_short = result.get("stdout_truncated", False)
                 
                 # Parse status code
                 try:
-                    status_code = int(result["stdout"])
+                    status_code = int(status_output)
                 except ValueError:
                     status_code = 0
                 
+                from_cache = status_code == 304 and cached is not None
+                if from_cache:
+                    status_code = cached["status_code"]
+                    response_body = cached["body"]
+                elif not cut_short:
+                    self._store_validators(cache_key, status_code, response_headers, response_body)
+                
                 test_result = {
                     "url": url,
                     "method": method,
                     "expected_status": expected_status,
                     "actual_status": status_code,
                     "success": status_code == expected_status,
-                    "response_body": response_body,
+                    "response_body": response_body[:max_body],
+                    "truncated": cut_short or len(response_body) > max_body,
+                    "from_cache": from_cache,
                     "test_passed": status_code == expected_status
                 }
             else:
@@ -286,7 +860,7 @@ class HTTPTools(NetOpsTool):
                     "method": method,
                     "expected_status": expected_status,
                     "success": False,
-                    "error": result["stderr"],
+                    "error": curl_errors,
                     "test_passed": False
                 }
             
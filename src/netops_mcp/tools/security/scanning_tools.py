@@ -2,15 +2,50 @@
 Security scanning tools for NetOps MCP.
 """
 
+import ipaddress
 import re
-from typing import Dict, List, Optional
+import shutil
+from typing import Any, Dict, List, Optional
+from xml.etree import ElementTree
 from mcp.types import TextContent as Content
 from ..base import NetOpsTool
+from ...utils import serialization
+from ...utils.cache import TTLCache
+from ...utils.system_check import can_open_raw_socket
+
+# Let nmap probe ports in parallel at a sustained rate instead of its adaptive defaults
+NMAP_MIN_RATE = 1000
+NMAP_MIN_PARALLELISM = 32
+
+# Port counts above this are swept with masscan when it is installed
+MASSCAN_PORT_THRESHOLD = 1024
+MASSCAN_DEFAULT_RATE = 10000
+# Highest masscan packet rate a caller may request
+MASSCAN_MAX_RATE = 100000
+PORT_SCAN_BACKENDS = ('auto', 'nmap', 'masscan')
+
+# A single NSE script name; no wildcards, paths or boolean expressions
+SCRIPT_NAME_PATTERN = re.compile(r'^[A-Za-z0-9_-]+$')
+# NSE categories service_enumeration may run
+ALLOWED_SCRIPT_CATEGORIES = frozenset({'default', 'safe', 'discovery', 'version'})
+# Every other NSE category, plus 'all'; these include intrusive, brute-force and DoS scripts
+BLOCKED_SCRIPT_CATEGORIES = frozenset({
+    'all', 'auth', 'broadcast', 'brute', 'dos', 'exploit', 'external',
+    'fuzzer', 'intrusive', 'malware', 'vuln'
+})
+
+# Seconds a completed service enumeration is replayed for identical requests
+SERVICE_CACHE_TTL = 300
 
 
 class ScanningTools(NetOpsTool):
     """Tools for security scanning and enumeration."""
 
+    def __init__(self):
+        """Initialize the tool."""
+        super().__init__()
+        self._service_cache = TTLCache(maxsize=128, ttl=SERVICE_CACHE_TTL)
+
     def _validate_ports(self, ports: str) -> bool:
         """Validate port specification.
 
@@ -23,40 +58,175 @@ class ScanningTools(NetOpsTool):
         if not ports or not isinstance(ports, str):
             return False
         
-        # Check for common port patterns
-        port_pattern = re.compile(r'^(\d+(-\d+)?)(,\d+(-\d+)?)*$')
-        if not port_pattern.match(ports):
-            return False
-        
-        # Validate individual port numbers
-        parts = ports.split(',')
-        for part in parts:
-            if '-' in part:
-                start, end = part.split('-')
-                try:
-                    start_port = int(start)
-                    end_port = int(end)
-                    if start_port > end_port or start_port < 1 or end_port > 65535:
-                        return False
-                except ValueError:
+        # Single pass over the specification: accumulate digits into the
+        # current port and check bounds at each ',' and at the end
+        range_start = None
+        current = 0
+        digits = 0
+        for char in ports + ',':
+            if '0' <= char <= '9':
+                current = current * 10 + (ord(char) - 48)
+                digits += 1
+                if current > 65535:
                     return False
-            else:
-                try:
-                    port = int(part)
-                    if port < 1 or port > 65535:
-                        return False
-                except ValueError:
+            elif char == '-':
+                if digits == 0 or current < 1 or range_start is not None:
+                    return False
+                range_start = current
+                current = 0
+                digits = 0
+            elif char == ',':
+                if digits == 0 or current < 1:
                     return False
+                if range_start is not None and range_start > current:
+                    return False
+                range_start = None
+                current = 0
+                digits = 0
+            else:
+                return False
         
         return True
 
-    def port_scan(self, target: str, ports: str, timeout: int = 60) -> List[Content]:
+    def _count_ports(self, ports: str) -> int:
+        """Count the ports in a validated port specification.
+
+        Args:
+            ports: Port specification such as '22,80,8000-8100'
+
+        Returns:
+            Number of ports covered by the specification
+        """
+        count = 0
+        for part in ports.split(','):
+            start, _, end = part.partition('-')
+            count += int(end) - int(start) + 1 if end else 1
+        return count
+
+    def _select_port_scan_backend(self, target: str, ports: str, backend: str) -> str:
+        """Choose the scanner for a port scan.
+
+        masscan runs its own asynchronous TCP stack and is much faster for
+        wide sweeps, but only accepts IP addresses or networks, must be
+        installed separately and needs raw sockets. 'auto' only picks it
+        when all of that holds.
+
+        Args:
+            target: Target host
+            ports: Validated port specification
+            backend: Requested backend ('auto', 'nmap' or 'masscan')
+
+        Returns:
+            'nmap' or 'masscan'
+        """
+        if backend == 'nmap':
+            return 'nmap'
+        
+        masscan_usable = shutil.which('masscan') is not None
+        if masscan_usable:
+            try:
+                ipaddress.ip_network(target, strict=False)
+            except ValueError:
+                masscan_usable = False
+        
+        if backend == 'masscan':
+            if not masscan_usable:
+                raise ValueError("masscan backend requires masscan to be installed and an IP address target")
+            return 'masscan'
+        
+        if (masscan_usable and self._count_ports(ports) > MASSCAN_PORT_THRESHOLD
+                and can_open_raw_socket()):
+            return 'masscan'
+        return 'nmap'
+
+    def _parse_masscan_json(self, output: str) -> List[Dict[str, Any]]:
+        """Parse masscan '-oJ -' output into per-port results.
+
+        masscan writes one JSON object per line inside a bracketed list,
+        and some versions leave a trailing comma, so lines are parsed
+        individually.
+
+        Args:
+            output: masscan JSON output
+
+        Returns:
+            List of port dictionaries in the same shape as nmap results
+        """
+        results = []
+        for line in output.splitlines():
+            line = line.strip().rstrip(',')
+            if not line.startswith('{'):
+                continue
+            try:
+                entry = serialization.loads(line)
+            except ValueError:
+                continue
+            for port in entry.get('ports', []):
+                results.append({
+                    "port": port.get('port'),
+                    "protocol": port.get('proto'),
+                    "state": port.get('status'),
+                    "service": None
+                })
+        return results
+
+    def _format_port_scan_command(self, target: str, ports: str) -> List[str]:
+        """Format nmap TCP connect scan command with XML output on stdout.
+
+        Args:
+            target: Target host
+            ports: Port specification
+
+        Returns:
+            List of command arguments
+        """
+        return [
+            'nmap', '-sT', '-T4',
+            '--min-rate', str(NMAP_MIN_RATE),
+            '--min-parallelism', str(NMAP_MIN_PARALLELISM),
+            '-p', ports, '-oX', '-', target
+        ]
+
+    def _parse_nmap_xml(self, output: str) -> List[Dict[str, Any]]:
+        """Parse nmap XML output into per-port results.
+
+        Args:
+            output: nmap '-oX -' output
+
+        Returns:
+            List of port dictionaries, empty if output is not nmap XML
+        """
+        try:
+            root = ElementTree.fromstring(output)
+        except ElementTree.ParseError:
+            return []
+        
+        results = []
+        for port in root.iter('port'):
+            state = port.find('state')
+            service = port.find('service')
+            results.append({
+                "port": int(port.get('portid', 0)),
+                "protocol": port.get('protocol'),
+                "state": state.get('state') if state is not None else None,
+                "service": service.get('name') if service is not None else None
+            })
+        return results
+
+    def port_scan(self, target: str, ports: str, timeout: int = 60, backend: str = "auto",
+                  rate: int = MASSCAN_DEFAULT_RATE) -> List[Content]:
         """Scan ports on a target.
 
+        With backend 'auto', sweeps of more than MASSCAN_PORT_THRESHOLD ports
+        against an IP target use masscan when it is installed; everything
+        else uses nmap.
+
         Args:
             target: Target host
             ports: Port range (e.g., '1-1000' or '22,80,443')
             timeout: Timeout in seconds
+            backend: Scanner to use ('auto', 'nmap' or 'masscan')
+            rate: masscan packets per second, 1 to MASSCAN_MAX_RATE
 
         Returns:
             List of Content objects with port scan results
@@ -67,15 +237,34 @@ class ScanningTools(NetOpsTool):
             
             if not self._validate_ports(ports):
                 raise ValueError("Invalid ports specification provided")
+            
+            if backend not in PORT_SCAN_BACKENDS:
+                raise ValueError(f"Invalid backend, expected one of: {', '.join(PORT_SCAN_BACKENDS)}")
+            
+            if not isinstance(rate, int) or isinstance(rate, bool) or not 1 <= rate <= MASSCAN_MAX_RATE:
+                raise ValueError(f"Invalid rate, expected 1 to {MASSCAN_MAX_RATE} packets per second")
 
-            # Use nmap for port scanning
-            command = ['nmap', '-sT', '-T4', '-p', ports, target]
-            result = self._execute_command(command, timeout)
+            backend = self._select_port_scan_backend(target, ports, backend)
+            if backend == 'masscan':
+                command = ['masscan', '--rate', str(rate), '-p', ports, target, '-oJ', '-']
+                result = self._execute_command(command, timeout)
+                scan_results = self._parse_masscan_json(result["stdout"])
+                if not result["success"]:
+                    # masscan could not run (e.g. no raw socket access); nmap -sT still can
+                    self.logger.warning(f"masscan failed, falling back to nmap: {result['stderr']}")
+                    backend = 'nmap'
+            if backend == 'nmap':
+                # Use nmap for port scanning
+                command = self._format_port_scan_command(target, ports)
+                result = self._execute_command(command, timeout)
+                scan_results = self._parse_nmap_xml(result["stdout"])
             
             response_data = {
                 "target": target,
                 "ports": ports,
+                "backend": backend,
                 "success": result["success"],
+                "scan_results": scan_results,
                 "stdout": result["stdout"],
                 "stderr": result["stderr"],
                 "return_code": result["return_code"]
@@ -86,12 +275,96 @@ class ScanningTools(NetOpsTool):
         except Exception as e:
             return self._handle_error("port scan", e)
 
-    def service_enumeration(self, target: str, ports: Optional[str] = None) -> List[Content]:
+    async def parallel_scan(self, targets: List[str], ports: str, timeout: int = 60) -> List[Content]:
+        """Scan ports on several targets concurrently.
+
+        Args:
+            targets: Target hosts
+            ports: Port range (e.g., '1-1000' or '22,80,443')
+            timeout: Timeout in seconds for each target
+
+        Returns:
+            List of Content objects with one port scan result per target
+        """
+        try:
+            if not targets or not isinstance(targets, list):
+                raise ValueError("At least one target must be provided")
+            
+            if not self._validate_ports(ports):
+                raise ValueError("Invalid ports specification provided")
+
+            valid_targets = [target for target in targets if self._validate_host(target)]
+            outputs = iter(await self._execute_many(
+                [self._format_port_scan_command(target, ports) for target in valid_targets], timeout
+            ))
+            
+            results = []
+            for target in targets:
+                if not self._validate_host(target):
+                    results.append({"target": target, "success": False, "error": "Invalid target provided"})
+                    continue
+                result = next(outputs)
+                results.append({
+                    "target": target,
+                    "success": result["success"],
+                    "scan_results": self._parse_nmap_xml(result["stdout"]),
+                    "error": result["stderr"] if not result["success"] else None
+                })
+            
+            response_data = {
+                "ports": ports,
+                "total": len(results),
+                "succeeded": sum(1 for r in results if r["success"]),
+                "results": results
+            }
+            
+            return self._format_response(response_data, "parallel_scan")
+            
+        except Exception as e:
+            return self._handle_error("parallel scan", e)
+
+    def _validate_scripts(self, scripts: str) -> bool:
+        """Validate an NSE script selection.
+
+        Only the categories in ALLOWED_SCRIPT_CATEGORIES and individual
+        script names are accepted. Wildcards, paths and the other
+        categories are rejected, so a selection cannot run intrusive
+        script groups or point nmap at script files.
+
+        Args:
+            scripts: Comma-separated script names or categories
+
+        Returns:
+            True if the selection is valid
+        """
+        if not scripts or not isinstance(scripts, str):
+            return False
+        for script in scripts.split(','):
+            name = script.lower()
+            if name in ALLOWED_SCRIPT_CATEGORIES:
+                continue
+            if name in BLOCKED_SCRIPT_CATEGORIES or not SCRIPT_NAME_PATTERN.match(script):
+                return False
+        return True
+
+    def service_enumeration(self, target: str, ports: Optional[str] = None,
+                            scripts: Optional[str] = None, version_intensity: int = 2,
+                            cache_ttl: int = SERVICE_CACHE_TTL, force: bool = False) -> List[Content]:
         """Enumerate services on a target.
 
+        Runs version detection only; NSE scripts are opt-in because the
+        default script category dominates scan time.
+
+        Successful enumerations are cached and replayed for identical
+        requests made within cache_ttl seconds.
+
         Args:
             target: Target host
             ports: Optional port range
+            scripts: Optional NSE script names or allowed categories to run (e.g. 'default' or 'banner,ssl-cert')
+            version_intensity: nmap version detection intensity (0-9)
+            cache_ttl: Maximum age in seconds of a cached result to replay
+            force: Bypass the result cache and always run a new scan
 
         Returns:
             List of Content objects with service enumeration results
@@ -102,9 +375,24 @@ class ScanningTools(NetOpsTool):
             
             if ports and not self._validate_ports(ports):
                 raise ValueError("Invalid ports specification provided")
+            
+            if scripts is not None and not self._validate_scripts(scripts):
+                raise ValueError("Invalid scripts specification provided")
+            
+            if not isinstance(version_intensity, int) or not 0 <= version_intensity <= 9:
+                raise ValueError("Version intensity must be between 0 and 9")
+
+            cache_key = (target, ports, scripts, version_intensity)
+            if not force:
+                cached = self._service_cache.get(cache_key, ttl=cache_ttl)
+                if cached is not None:
+                    return self._format_response(dict(cached, cached=True), "service_enumeration")
 
             # Use nmap for service enumeration
-            command = ['nmap', '-sV', '-sC', '--version-intensity', '5']
+            command = ['nmap', '-sV', '--version-intensity', str(version_intensity)]
+            
+            if scripts:
+                command.extend(['--script', scripts])
             
             if ports:
                 command.extend(['-p', ports])
@@ -116,12 +404,16 @@ class ScanningTools(NetOpsTool):
             response_data = {
                 "target": target,
                 "ports": ports,
+                "scripts": scripts,
                 "success": result["success"],
                 "stdout": result["stdout"],
                 "stderr": result["stderr"],
                 "return_code": result["return_code"]
             }
             
+            if result["success"]:
+                self._service_cache.set(cache_key, response_data)
+            
             return self._format_response(response_data, "service_enumeration")
             
         except Exception as e:
@@ -2,15 +2,130 @@
 System monitoring tools for NetOps MCP.
 """
 
+import heapq
+import time
+from concurrent.futures import Future, wait
+from threading import Lock, Thread
 import psutil
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 from mcp.types import TextContent as Content
 from ..base import NetOpsTool
+from ...utils.cache import TTLCache
+from ...utils.metrics_cache import MemInfo, MetricsCache, Snapshot, SwapInfo
+from ...utils.system_check import CPU_COUNT, CPU_COUNT_LOGICAL
+
+# Minimum seconds between CPU samples; shorter windows give noisy percentages
+CPU_SAMPLE_INTERVAL = 0.2
+
+# Seconds each psutil reading is reused across tool calls
+PSUTIL_CACHE_TTLS = {
+    "virtual_memory": 1,
+    "swap_memory": 1,
+    "disk_usage": 1,
+    "net_io_counters": 1,
+    "cpu_freq": 1,
+    "cpu_stats": 1,
+    "disk_partitions": 60,
+    "boot_time": 3600
+}
+
+# Seconds to wait for mount points before skipping the unresponsive ones
+DISK_USAGE_TIMEOUT = 2
+# Filesystems backed by local storage; anything else (nfs, cifs, fuse...) may hang statvfs
+LOCAL_FSTYPES = frozenset({
+    "ext2", "ext3", "ext4", "xfs", "btrfs", "zfs", "f2fs", "overlay", "tmpfs",
+    "vfat", "exfat", "ntfs", "apfs", "hfs", "ufs"
+})
+
+# Seconds between background refreshes of the metrics snapshot in the servers
+METRICS_REFRESH_INTERVAL = 2.0
+# Seconds after which the shared metrics snapshot is re-collected on read
+SNAPSHOT_STALE_AFTER = 1.0
+
+# Per-interface counters reported by system_status, in psutil snetio field order
+NET_IO_FIELDS = ("bytes_sent", "bytes_recv", "packets_sent", "packets_recv")
+
+# Seconds a process listing is reused for identical requests
+PROCESS_LIST_CACHE_TTL = 1
 
 
 class MonitoringTools(NetOpsTool):
     """Tools for system monitoring and resource usage."""
 
+    def __init__(self, refresh_interval: Optional[float] = None):
+        """Initialize the tool.
+
+        Args:
+            refresh_interval: Seconds between background refreshes of the
+                metrics snapshot; None refreshes it on demand when stale
+        """
+        super().__init__()
+        # Prime psutil's per-CPU counters so later samples need no sleep
+        psutil.cpu_percent(interval=None, percpu=True)
+        self._cpu_sampled_at = time.monotonic()
+        self._cpu_lock = Lock()
+        self._psutil_cache = TTLCache(maxsize=128, ttl=1)
+        self._process_cache = TTLCache(maxsize=32, ttl=PROCESS_LIST_CACHE_TTL)
+        # Mount points whose statvfs is still outstanding from an earlier call
+        self._hung_mounts: Set[str] = set()
+        self._hung_mounts_lock = Lock()
+        # Readers fall back to an inline refresh only if the refresher stalls
+        stale_after = max(SNAPSHOT_STALE_AFTER, 2 * (refresh_interval or 0))
+        self._metrics = MetricsCache(self._collect_snapshot, stale_after, refresh_interval)
+
+    def _psutil(self, name: str, *args, **kwargs):
+        """Call a psutil accessor, reusing a recent result when available.
+
+        Polling clients hit these tools repeatedly; within the TTL from
+        PSUTIL_CACHE_TTLS concurrent calls share one reading instead of
+        re-reading /proc each time.
+
+        Args:
+            name: Name of the psutil function
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            Result of the psutil call
+        """
+        key = (name, args, tuple(sorted(kwargs.items())))
+        value = self._psutil_cache.get(key, ttl=PSUTIL_CACHE_TTLS[name])
+        if value is None:
+            value = getattr(psutil, name)(*args, **kwargs)
+            self._psutil_cache.set(key, value)
+        return value
+
+    def _sample_cpu(self) -> List[float]:
+        """Sample per-CPU utilization since the previous sample.
+
+        Only sleeps when the previous sample is younger than
+        CPU_SAMPLE_INTERVAL, instead of blocking a full second per call.
+
+        Returns:
+            Utilization percentage of each logical CPU
+        """
+        with self._cpu_lock:
+            elapsed = time.monotonic() - self._cpu_sampled_at
+            if elapsed < CPU_SAMPLE_INTERVAL:
+                time.sleep(CPU_SAMPLE_INTERVAL - elapsed)
+            per_cpu = psutil.cpu_percent(interval=None, percpu=True)
+            self._cpu_sampled_at = time.monotonic()
+        return per_cpu
+
+    def _collect_snapshot(self) -> Snapshot:
+        """Take a snapshot of the metrics shared by the status tools.
+
+        Returns:
+            New metrics snapshot
+        """
+        return Snapshot(
+            per_cpu_percent=self._sample_cpu(),
+            memory=self._psutil("virtual_memory"),
+            swap=self._psutil("swap_memory"),
+            disk=self._psutil("disk_usage", '/'),
+            net_io=self._psutil("net_io_counters", pernic=True)
+        )
+
     def system_status(self) -> List[Content]:
         """Get system status information.
 
@@ -19,26 +134,22 @@ class MonitoringTools(NetOpsTool):
         """
         try:
             # Get system information
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
-            boot_time = psutil.boot_time()
+            snapshot = self._metrics.get_snapshot()
+            memory = snapshot.memory
+            disk = snapshot.disk
+            boot_time = self._psutil("boot_time")
             
             # Get network interfaces
-            network_interfaces = {}
-            for interface, stats in psutil.net_io_counters(pernic=True).items():
-                network_interfaces[interface] = {
-                    "bytes_sent": stats.bytes_sent,
-                    "bytes_recv": stats.bytes_recv,
-                    "packets_sent": stats.packets_sent,
-                    "packets_recv": stats.packets_recv
-                }
+            network_interfaces = {
+                interface: dict(zip(NET_IO_FIELDS, stats[:len(NET_IO_FIELDS)]))
+                for interface, stats in snapshot.net_io.items()
+            }
             
             status_data = {
                 "cpu": {
-                    "percent": cpu_percent,
-                    "count": psutil.cpu_count(),
-                    "count_logical": psutil.cpu_count(logical=True)
+                    "percent": snapshot.cpu_percent,
+                    "count": CPU_COUNT,
+                    "count_logical": CPU_COUNT_LOGICAL
                 },
                 "memory": {
                     "total": memory.total,
@@ -50,7 +161,7 @@ class MonitoringTools(NetOpsTool):
                     "total": disk.total,
                     "used": disk.used,
                     "free": disk.free,
-                    "percent": (disk.used / disk.total) * 100
+                    "percent": disk.percent
                 },
                 "boot_time": boot_time,
                 "network_interfaces": network_interfaces
@@ -68,15 +179,15 @@ class MonitoringTools(NetOpsTool):
             List of Content objects with CPU usage
         """
         try:
-            cpu_percent = psutil.cpu_percent(interval=1, percpu=True)
-            cpu_freq = psutil.cpu_freq()
-            cpu_stats = psutil.cpu_stats()
+            snapshot = self._metrics.get_snapshot()
+            cpu_freq = self._psutil("cpu_freq")
+            cpu_stats = self._psutil("cpu_stats")
             
             cpu_data = {
-                "overall_percent": psutil.cpu_percent(interval=1),
-                "per_cpu_percent": cpu_percent,
-                "count": psutil.cpu_count(),
-                "count_logical": psutil.cpu_count(logical=True),
+                "overall_percent": snapshot.cpu_percent,
+                "per_cpu_percent": list(snapshot.per_cpu_percent),
+                "count": CPU_COUNT,
+                "count_logical": CPU_COUNT_LOGICAL,
                 "frequency": {
                     "current": cpu_freq.current if cpu_freq else None,
                     "min": cpu_freq.min if cpu_freq else None,
@@ -102,30 +213,10 @@ class MonitoringTools(NetOpsTool):
             List of Content objects with memory usage
         """
         try:
-            memory = psutil.virtual_memory()
-            swap = psutil.swap_memory()
-            
+            snapshot = self._metrics.get_snapshot()
             memory_data = {
-                "virtual_memory": {
-                    "total": memory.total,
-                    "available": memory.available,
-                    "used": memory.used,
-                    "free": memory.free,
-                    "percent": memory.percent,
-                    "active": memory.active,
-                    "inactive": memory.inactive,
-                    "buffers": memory.buffers,
-                    "cached": memory.cached,
-                    "shared": memory.shared
-                },
-                "swap_memory": {
-                    "total": swap.total,
-                    "used": swap.used,
-                    "free": swap.free,
-                    "percent": swap.percent,
-                    "sin": swap.sin,
-                    "sout": swap.sout
-                }
+                "virtual_memory": MemInfo.from_psutil(snapshot.memory),
+                "swap_memory": SwapInfo.from_psutil(snapshot.swap)
             }
             
             return self._format_response(memory_data, "memory_usage")
@@ -133,46 +224,118 @@ class MonitoringTools(NetOpsTool):
         except Exception as e:
             return self._handle_error("memory usage", e)
 
-    def disk_usage(self) -> List[Content]:
+    def disk_usage(self, local_only: bool = True) -> List[Content]:
         """Get disk usage information.
 
+        Args:
+            local_only: Only report filesystems in LOCAL_FSTYPES, skipping
+                network mounts
+
         Returns:
             List of Content objects with disk usage
         """
         try:
-            disk_partitions = psutil.disk_partitions()
+            disk_partitions = self._psutil("disk_partitions")
+            if local_only:
+                disk_partitions = [p for p in disk_partitions if p.fstype in LOCAL_FSTYPES]
             disk_usage_data = {}
+            if not disk_partitions:
+                return self._format_response(disk_usage_data, "disk_usage")
+            
+            # statvfs releases the GIL, so one slow mount (NFS, autofs) no
+            # longer delays the others
+            futures = [self._stat_mount(partition.mountpoint) for partition in disk_partitions]
+            wait([future for future in futures if future is not None], timeout=DISK_USAGE_TIMEOUT)
             
-            for partition in disk_partitions:
+            for partition, future in zip(disk_partitions, futures):
+                if future is None or not future.done():
+                    # Skip mounts that did not answer in time or are still hung from before
+                    self.logger.warning(f"Skipping unresponsive mount point: {partition.mountpoint}")
+                    if future is not None:
+                        self._mark_hung(partition.mountpoint, future)
+                    continue
                 try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    disk_usage_data[partition.device] = {
-                        "mountpoint": partition.mountpoint,
-                        "fstype": partition.fstype,
-                        "total": usage.total,
-                        "used": usage.used,
-                        "free": usage.free,
-                        "percent": (usage.used / usage.total) * 100
-                    }
+                    usage = future.result()
                 except PermissionError:
                     # Skip partitions we can't access
                     continue
+                disk_usage_data[partition.device] = {
+                    "mountpoint": partition.mountpoint,
+                    "fstype": partition.fstype,
+                    "total": usage.total,
+                    "used": usage.used,
+                    "free": usage.free,
+                    "percent": usage.percent
+                }
             
             return self._format_response(disk_usage_data, "disk_usage")
             
         except Exception as e:
             return self._handle_error("disk usage", e)
 
+    def _stat_mount(self, mountpoint: str) -> Optional[Future]:
+        """Read a mount point's usage on a daemon thread.
+
+        Daemon threads are not joined at interpreter exit, so a hung network
+        mount cannot block server shutdown.
+
+        Args:
+            mountpoint: Mount point to read
+
+        Returns:
+            Future with the psutil disk usage, or None if an earlier read of
+            the mount point has not returned yet
+        """
+        with self._hung_mounts_lock:
+            if mountpoint in self._hung_mounts:
+                return None
+        
+        future: Future = Future()
+
+        def run() -> None:
+            try:
+                future.set_result(self._psutil("disk_usage", mountpoint))
+            except BaseException as e:
+                future.set_exception(e)
+
+        Thread(target=run, name=f"statvfs {mountpoint}", daemon=True).start()
+        return future
+
+    def _mark_hung(self, mountpoint: str, future: Future) -> None:
+        """Skip a mount point in later calls until its pending read returns.
+
+        Args:
+            mountpoint: Mount point that did not answer in time
+            future: Future of the outstanding read
+        """
+        def release(_: Future) -> None:
+            with self._hung_mounts_lock:
+                self._hung_mounts.discard(mountpoint)
+
+        with self._hung_mounts_lock:
+            self._hung_mounts.add(mountpoint)
+        # Runs at once if the read completed in the meantime
+        future.add_done_callback(release)
+
     def process_list(self, limit: int = 20) -> List[Content]:
         """List running processes.
 
         Args:
-            limit: Number of processes to show
+            limit: Number of processes to show; must be at least 1
 
         Returns:
             List of Content objects with process list
         """
         try:
+            if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+                raise ValueError("Invalid limit provided; must be a positive integer")
+            
+            cached = self._process_cache.get(limit)
+            if cached is not None:
+                return self._format_response(cached, "process_list")
+            
+            # process_iter with attrs reads each process under oneshot(), so
+            # the /proc files are opened once per process, not per field
             processes = []
             for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'status']):
                 try:
@@ -187,9 +350,9 @@ class MonitoringTools(NetOpsTool):
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
             
-            # Sort by CPU usage and limit results
-            processes.sort(key=lambda x: x['cpu_percent'], reverse=True)
-            processes = processes[:limit]
+            # Select the top processes by CPU usage without sorting them all
+            processes = heapq.nlargest(limit, processes, key=lambda x: x['cpu_percent'] or 0)
+            self._process_cache.set(limit, processes)
             
             return self._format_response(processes, "process_list")
             
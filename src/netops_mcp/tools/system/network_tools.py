@@ -2,14 +2,195 @@
 System network tools for NetOps MCP.
 """
 
-from typing import Dict, List, Optional
+import os
+import socket
+import sys
+from typing import Any, Dict, List, Optional
 from mcp.types import TextContent as Content
 from ..base import NetOpsTool
 
+# Kernel socket and neighbour tables; read directly instead of running ss/netstat/arp
+PROC_NET_DIR = "/proc/net"
+
+# Hex socket states used in /proc/net/{tcp,udp}[6]
+TCP_STATES = {
+    "01": "ESTABLISHED",
+    "02": "SYN_SENT",
+    "03": "SYN_RECV",
+    "04": "FIN_WAIT1",
+    "05": "FIN_WAIT2",
+    "06": "TIME_WAIT",
+    "07": "CLOSE",
+    "08": "CLOSE_WAIT",
+    "09": "LAST_ACK",
+    "0A": "LISTEN",
+    "0B": "CLOSING",
+    "0C": "NEW_SYN_RECV"
+}
+# Unconnected UDP sockets are reported in the TCP CLOSE state; ss calls them UNCONN
+UDP_STATES = dict(TCP_STATES, **{"07": "UNCONN"})
+
+# Socket tables per protocol filter
+PROC_NET_SOCKET_TABLES = {
+    "tcp": (("tcp", socket.AF_INET), ("tcp6", socket.AF_INET6)),
+    "udp": (("udp", socket.AF_INET), ("udp6", socket.AF_INET6))
+}
+
+# States shown when no state filter is given, matching `ss -l` / `netstat -l`
+LISTENING_STATES = frozenset({"LISTEN", "UNCONN"})
+
+# Every state a /proc/net socket can be reported in
+ALL_STATES = frozenset(TCP_STATES.values()) | {"UNCONN"}
+_CONNECTED_STATES = ALL_STATES - LISTENING_STATES - {"CLOSE"}
+_BUCKET_STATES = frozenset({"SYN_RECV", "NEW_SYN_RECV", "TIME_WAIT"})
+
+# State filters accepted by ss and netstat, keyed by lower-case name with
+# '-' for '_', mapped to the /proc/net states they select
+STATE_FILTERS = {
+    "established": frozenset({"ESTABLISHED"}),
+    "syn-sent": frozenset({"SYN_SENT"}),
+    "syn-recv": frozenset({"SYN_RECV", "NEW_SYN_RECV"}),
+    "fin-wait-1": frozenset({"FIN_WAIT1"}),
+    "fin-wait1": frozenset({"FIN_WAIT1"}),
+    "fin-wait-2": frozenset({"FIN_WAIT2"}),
+    "fin-wait2": frozenset({"FIN_WAIT2"}),
+    "time-wait": frozenset({"TIME_WAIT"}),
+    "close": frozenset({"CLOSE", "UNCONN"}),
+    "closed": frozenset({"CLOSE", "UNCONN"}),
+    "close-wait": frozenset({"CLOSE_WAIT"}),
+    "last-ack": frozenset({"LAST_ACK"}),
+    "listen": LISTENING_STATES,
+    "listening": LISTENING_STATES,
+    "closing": frozenset({"CLOSING"}),
+    "all": ALL_STATES,
+    "connected": _CONNECTED_STATES,
+    "synchronized": _CONNECTED_STATES - {"SYN_SENT"},
+    "bucket": _BUCKET_STATES,
+    "big": ALL_STATES - _BUCKET_STATES
+}
+
+
+def _decode_proc_address(address: str, family: int) -> tuple:
+    """Decode a /proc/net socket address such as '0100007F:0050'.
+
+    The kernel prints each 32-bit word of the address in host byte order.
+
+    Args:
+        address: Hex address and port separated by a colon
+        family: socket.AF_INET or socket.AF_INET6
+
+    Returns:
+        Tuple of (IP address string, port number)
+    """
+    host, port = address.split(':')
+    raw = b''.join(
+        int(host[i:i + 8], 16).to_bytes(4, sys.byteorder) for i in range(0, len(host), 8)
+    )
+    return socket.inet_ntop(family, raw), int(port, 16)
+
 
 class NetworkTools(NetOpsTool):
     """Tools for system network analysis."""
 
+    def __init__(self):
+        """Initialize the tool."""
+        super().__init__()
+        # /proc/net only exists on Linux; other platforms use the CLI tools
+        self._proc_net_dir: Optional[str] = PROC_NET_DIR if sys.platform.startswith('linux') else None
+
+    def _read_proc_net_sockets(self, state: Optional[str] = None,
+                               protocol: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """Read sockets from the /proc/net socket tables.
+
+        Args:
+            state: Connection state filter (e.g. 'listen', 'established');
+                listening sockets only when not given
+            protocol: Protocol filter (tcp/udp)
+
+        Returns:
+            List of sockets, or None if /proc/net is unavailable or the
+            state filter is not one of STATE_FILTERS
+        """
+        if self._proc_net_dir is None:
+            return None
+        
+        if state:
+            wanted = STATE_FILTERS.get(state.lower().replace('_', '-'))
+            if wanted is None:
+                # Leave filters the table does not know to ss/netstat
+                return None
+        else:
+            wanted = LISTENING_STATES
+
+        if protocol and protocol.lower() in PROC_NET_SOCKET_TABLES:
+            protocols = [protocol.lower()]
+        else:
+            protocols = list(PROC_NET_SOCKET_TABLES)
+
+        sockets = []
+        found_table = False
+        for proto in protocols:
+            states = TCP_STATES if proto == "tcp" else UDP_STATES
+            for table, family in PROC_NET_SOCKET_TABLES[proto]:
+                try:
+                    with open(os.path.join(self._proc_net_dir, table)) as f:
+                        f.readline()
+                        lines = f.readlines()
+                except OSError:
+                    continue
+                found_table = True
+                for line in lines:
+                    fields = line.split()
+                    if len(fields) < 4:
+                        continue
+                    socket_state = states.get(fields[3], fields[3])
+                    if socket_state not in wanted:
+                        continue
+                    local_address, local_port = _decode_proc_address(fields[1], family)
+                    peer_address, peer_port = _decode_proc_address(fields[2], family)
+                    sockets.append({
+                        "protocol": table,
+                        "state": socket_state,
+                        "local_address": local_address,
+                        "local_port": local_port,
+                        "peer_address": peer_address,
+                        "peer_port": peer_port
+                    })
+
+        return sockets if found_table else None
+
+    def _read_proc_net_arp(self) -> Optional[List[Dict[str, str]]]:
+        """Read the kernel ARP table from /proc/net/arp.
+
+        Returns:
+            List of ARP entries, or None if /proc/net/arp is unavailable
+        """
+        if self._proc_net_dir is None:
+            return None
+
+        try:
+            with open(os.path.join(self._proc_net_dir, "arp")) as f:
+                f.readline()
+                lines = f.readlines()
+        except OSError:
+            return None
+
+        entries = []
+        for line in lines:
+            fields = line.split()
+            if len(fields) < 6:
+                continue
+            ip_address, hw_type, flags, hw_address, mask, device = fields[:6]
+            entries.append({
+                "ip_address": ip_address,
+                "hw_type": hw_type,
+                "flags": flags,
+                "hw_address": hw_address,
+                "mask": mask,
+                "device": device
+            })
+        return entries
+
     def ss_connections(self, state: Optional[str] = None, protocol: Optional[str] = None) -> List[Content]:
         """Show network connections using ss.
 
@@ -21,6 +202,16 @@ class NetworkTools(NetOpsTool):
             List of Content objects with ss results
         """
         try:
+            sockets = self._read_proc_net_sockets(state, protocol)
+            if sockets is not None:
+                return self._format_response({
+                    "state": state,
+                    "protocol": protocol,
+                    "success": True,
+                    "source": self._proc_net_dir,
+                    "connections": sockets
+                }, "ss_connections")
+            
             command = ['ss', '-tuln']
             
             if state:
@@ -67,6 +258,16 @@ class NetworkTools(NetOpsTool):
             List of Content objects with netstat results
         """
         try:
+            sockets = self._read_proc_net_sockets(state, protocol)
+            if sockets is not None:
+                return self._format_response({
+                    "state": state,
+                    "protocol": protocol,
+                    "success": True,
+                    "source": self._proc_net_dir,
+                    "connections": sockets
+                }, "netstat_connections")
+            
             command = ['netstat', '-tuln']
             
             if state:
@@ -101,6 +302,14 @@ class NetworkTools(NetOpsTool):
             List of Content objects with ARP table
         """
         try:
+            entries = self._read_proc_net_arp()
+            if entries is not None:
+                return self._format_response({
+                    "success": True,
+                    "source": os.path.join(self._proc_net_dir, "arp"),
+                    "entries": entries
+                }, "arp_table")
+            
             command = ['arp', '-a']
             result = self._execute_command(command, 30)
             
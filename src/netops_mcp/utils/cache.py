@@ -0,0 +1,87 @@
+"""
+Caching utilities for NetOps MCP tools.
+
+This module provides a small in-memory TTL cache used to replay the
+results of expensive, idempotent tool runs (e.g. nmap scans) within a
+short time window.
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Bounded in-memory cache whose entries expire after a fixed TTL.
+
+    When the cache is full the least recently stored entry is evicted.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept in the cache
+            ttl: Time-to-live of each entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, ttl: Optional[float] = None) -> Optional[Any]:
+        """
+        Return the cached value for key if it has not expired.
+
+        Args:
+            key: Cache key
+            ttl: Optional TTL override in seconds for this lookup
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        max_age = self.ttl if ttl is None else ttl
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at >= max_age:
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (time.monotonic(), value)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Remove an entry from the cache if present.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
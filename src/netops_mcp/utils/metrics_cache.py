@@ -0,0 +1,160 @@
+"""
+Periodically refreshed system metric snapshots for NetOps MCP.
+
+Monitoring tools are often polled at a fixed rate by several clients.
+Instead of sampling psutil on every request, a snapshot of the hot
+metrics is refreshed on a schedule (or on demand once it goes stale) and
+requests are served from it.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger("netops-mcp.metrics-cache")
+
+
+@dataclass(slots=True)
+class Snapshot:
+    """Point-in-time readings of frequently requested system metrics."""
+    per_cpu_percent: List[float]
+    memory: Any
+    swap: Any
+    disk: Any
+    net_io: Dict[str, Any]
+    taken_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def cpu_percent(self) -> float:
+        """Overall CPU utilization as the mean of the per-CPU readings."""
+        if not self.per_cpu_percent:
+            return 0.0
+        return round(sum(self.per_cpu_percent) / len(self.per_cpu_percent), 1)
+
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was taken."""
+        return time.monotonic() - self.taken_at
+
+
+@dataclass(slots=True)
+class MemInfo:
+    """Virtual memory figures reported by memory_usage."""
+    total: int
+    available: int
+    used: int
+    free: int
+    percent: float
+    active: int
+    inactive: int
+    buffers: int
+    cached: int
+    shared: int
+
+    @classmethod
+    def from_psutil(cls, memory: Any) -> "MemInfo":
+        """Build from a psutil.virtual_memory() result."""
+        return cls(memory.total, memory.available, memory.used, memory.free,
+                   memory.percent, memory.active, memory.inactive,
+                   memory.buffers, memory.cached, memory.shared)
+
+
+@dataclass(slots=True)
+class SwapInfo:
+    """Swap figures reported by memory_usage."""
+    total: int
+    used: int
+    free: int
+    percent: float
+    sin: int
+    sout: int
+
+    @classmethod
+    def from_psutil(cls, swap: Any) -> "SwapInfo":
+        """Build from a psutil.swap_memory() result."""
+        return cls(swap.total, swap.used, swap.free, swap.percent, swap.sin, swap.sout)
+
+
+class MetricsCache:
+    """
+    Holds the latest Snapshot and keeps it fresh.
+
+    With a refresh interval a daemon thread re-collects the snapshot in
+    the background; without one, get_snapshot() re-collects inline when
+    the current snapshot is older than stale_after.
+    """
+
+    def __init__(self, collect: Callable[[], Snapshot], stale_after: float = 1.0,
+                 refresh_interval: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            collect: Callable that takes a new snapshot
+            stale_after: Age in seconds after which a snapshot is re-collected on read
+            refresh_interval: Seconds between background refreshes, or None to
+                refresh only on read
+        """
+        self._collect = collect
+        self.stale_after = stale_after
+        self.refresh_interval = refresh_interval
+        self._snapshot: Optional[Snapshot] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def refresh(self) -> Snapshot:
+        """
+        Collect a new snapshot and make it current.
+
+        Returns:
+            The new snapshot
+        """
+        with self._lock:
+            snapshot = self._collect()
+            self._snapshot = snapshot
+            return snapshot
+
+    def get_snapshot(self) -> Snapshot:
+        """
+        Return the current snapshot, collecting one if missing or stale.
+
+        Starts the background refresher on first use when configured.
+
+        Returns:
+            Current snapshot
+        """
+        if self.refresh_interval and self._thread is None:
+            self.start()
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.age > self.stale_after:
+            snapshot = self.refresh()
+        return snapshot
+
+    def start(self) -> None:
+        """Start the background refresher thread."""
+        with self._lock:
+            if self._thread is not None or not self.refresh_interval:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="netops-mcp-metrics", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background refresher thread."""
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=self.refresh_interval)
+
+    def _run(self) -> None:
+        """Refresh the snapshot until stopped."""
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"Failed to refresh metrics snapshot: {e}")
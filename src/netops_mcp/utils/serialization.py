@@ -0,0 +1,66 @@
+"""
+JSON serialization helpers for NetOps MCP.
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise, so callers get the same output either way.
+"""
+
+import dataclasses
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data: JSON text
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _default(obj: Any) -> Any:
+    """Convert dataclasses to dicts and anything else to str()."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        # asdict() deep-copies; a shallow field read is enough for JSON output
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    return str(obj)
+
+
+def dumps(data: Any, indent: bool = False) -> str:
+    """
+    Serialize an object to JSON text.
+
+    Dataclass instances are serialized as objects; other values that are
+    not natively serializable are converted with str().
+
+    Args:
+        data: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_default, option=option).decode()
+    # Match orjson's output: raw UTF-8 and compact separators when not indented
+    if indent:
+        return json.dumps(data, indent=2, default=_default, ensure_ascii=False)
+    return json.dumps(data, separators=(',', ':'), default=_default, ensure_ascii=False)
@@ -5,11 +5,16 @@ This module provides utilities for checking system requirements and
 required tools availability.
 """
 
+import asyncio
+import os
+import socket
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 import platform
 import psutil
 from typing import Dict, List, Tuple, Any
+from .cache import TTLCache
 
 # Required tools for the MCP server
 REQUIRED_TOOLS = [
@@ -18,12 +23,56 @@ REQUIRED_TOOLS = [
     'arp', 'arping', 'httpie'
 ]
 
-
-def check_required_tools(tools: List[str] = None) -> Dict[str, Any]:
+# CPU counts are fixed for the lifetime of the process
+CPU_COUNT = psutil.cpu_count()
+CPU_COUNT_LOGICAL = psutil.cpu_count(logical=True)
+
+# Prime psutil's CPU counters so get_cpu_info can sample without sleeping
+psutil.cpu_percent(interval=None)
+
+# Printable names of the address families reported by psutil.net_if_addrs()
+AF_NAMES = {
+    socket.AF_INET: 'AF_INET',
+    socket.AF_INET6: 'AF_INET6',
+    psutil.AF_LINK: 'AF_LINK'
+}
+
+# Version flag for tools that do not understand --version
+VERSION_FLAGS = {
+    'ping': '-V',
+    'nc': '-h',
+    'nslookup': '-version',
+    'dig': '-v',
+    'host': '-V',
+    'arping': '-V'
+}
+
+# Seconds to wait for a tool to print its version
+VERSION_TIMEOUT = 5
+
+# Seconds tool lookups and versions are reused; tools installed or upgraded
+# while the server runs are picked up after this
+TOOL_CACHE_TTL = 300
+_tool_path_cache = TTLCache(maxsize=256, ttl=TOOL_CACHE_TTL)
+_tool_version_cache = TTLCache(maxsize=256, ttl=TOOL_CACHE_TTL)
+
+# Commands used to probe privileged access, keyed by check name
+PRIVILEGE_PROBES = {
+    'can_ping': ['ping', '-c', '1', '127.0.0.1'],
+    'can_traceroute': ['traceroute', '-m', '1', '127.0.0.1'],
+    'can_nmap': ['nmap', '-sn', '127.0.0.1'],
+    'can_arp': ['arp', '-a']
+}
+
+
+def check_required_tools(tools: List[str] = None, include_versions: bool = False) -> Dict[str, Any]:
     """Check if required system tools are available.
 
     Args:
         tools: List of tools to check. If None, uses REQUIRED_TOOLS.
+        include_versions: Also report the version of each available tool.
+            Runs an event loop, so async callers should await
+            get_tool_versions() instead.
 
     Returns:
         Dictionary with availability status and lists of available/missing tools
@@ -33,111 +82,198 @@ def check_required_tools(tools: List[str] = None) -> Dict[str, Any]:
     
     available_tools = []
     missing_tools = []
+    found = find_tools_on_path(tuple(tools))
     
     for tool in tools:
-        if is_tool_available(tool):
+        if tool in found:
             available_tools.append(tool)
         else:
             missing_tools.append(tool)
     
-    return {
+    result = {
         'all_available': len(missing_tools) == 0,
         'available_tools': available_tools,
         'missing_tools': missing_tools
     }
+    if include_versions:
+        result['versions'] = asyncio.run(get_tool_versions(available_tools))
+    
+    return result
+
+
+def clear_tool_caches() -> None:
+    """Forget cached tool lookups and versions."""
+    _tool_path_cache.clear()
+    _tool_version_cache.clear()
+
+
+def find_tools_on_path(tools: Tuple[str, ...]) -> frozenset:
+    """Find which of several tools are on PATH in a single pass.
+
+    Each PATH directory is listed once, instead of stat-ing every
+    directory separately for every tool as repeated shutil.which() calls
+    would. Results are cached for TOOL_CACHE_TTL seconds.
+
+    Args:
+        tools: Names of the tools to look for
+
+    Returns:
+        Names of the tools found as executable files on PATH
+    """
+    if not tools:
+        return frozenset()
+    cached = _tool_path_cache.get(tools)
+    if cached is not None:
+        return cached
+    found = _scan_path(tools)
+    _tool_path_cache.set(tools, found)
+    return found
+
+
+def _scan_path(tools: Tuple[str, ...]) -> frozenset:
+    """List PATH directories once and collect the executables among tools.
+
+    Args:
+        tools: Names of the tools to look for
+
+    Returns:
+        Names of the tools found as executable files on PATH
+    """
+    if os.name == 'nt':
+        # Executables are matched through PATHEXT there; let shutil handle it
+        return frozenset(tool for tool in tools if shutil.which(tool) is not None)
+    
+    wanted = set(tools)
+    found = set()
+    for directory in os.environ.get('PATH', os.defpath).split(os.pathsep):
+        try:
+            entries = os.scandir(directory or os.curdir)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name in wanted and entry.is_file() and os.access(entry.path, os.X_OK):
+                    found.add(entry.name)
+                    wanted.discard(entry.name)
+        if not wanted:
+            break
+    return frozenset(found)
 
 
 def is_tool_available(tool_name: str) -> bool:
     """Check if a specific tool is available.
 
+    Only searches PATH; no process is started. Tools that are found are
+    remembered for TOOL_CACHE_TTL seconds; missing ones are looked up
+    again on every call, so a newly installed tool is seen at once.
+
     Args:
         tool_name: Name of the tool to check
 
     Returns:
         True if tool is available, False otherwise
     """
-    try:
-        # Try to get version information to check availability
-        if tool_name == 'curl':
-            result = subprocess.run(['curl', '--version'], 
-                                  capture_output=True, text=True, timeout=5)
-        elif tool_name == 'nmap':
-            result = subprocess.run(['nmap', '--version'], 
-                                  capture_output=True, text=True, timeout=5)
-        elif tool_name == 'ping':
-            result = subprocess.run(['ping', '-V'], 
-                                  capture_output=True, text=True, timeout=5)
-        elif tool_name == 'nc':
-            result = subprocess.run(['nc', '-h'], 
-                                  capture_output=True, text=True, timeout=5)
-        elif tool_name == 'nslookup':
-            result = subprocess.run(['nslookup', '-version'], 
-                                  capture_output=True, text=True, timeout=5)
-        elif tool_name == 'dig':
-            result = subprocess.run(['dig', '-v'], 
-                                  capture_output=True, text=True, timeout=5)
-        elif tool_name == 'host':
-            result = subprocess.run(['host', '-V'], 
-                                  capture_output=True, text=True, timeout=5)
-        elif tool_name == 'arping':
-            result = subprocess.run(['arping', '-V'], 
-                                  capture_output=True, text=True, timeout=5)
-        else:
-            result = subprocess.run([tool_name, '--version'], 
-                                  capture_output=True, text=True, timeout=5)
-        
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError, subprocess.SubprocessError):
-        return False
+    if _tool_path_cache.get(tool_name) is not None:
+        return True
+    available = shutil.which(tool_name) is not None
+    if available:
+        _tool_path_cache.set(tool_name, True)
+    return available
+
+
+def _version_command(tool_name: str) -> List[str]:
+    """Build the command that prints a tool's version.
+
+    Args:
+        tool_name: Name of the tool
+
+    Returns:
+        Command as list
+    """
+    return [tool_name, VERSION_FLAGS.get(tool_name, '--version')]
 
 
 def get_tool_version(tool_name: str) -> str:
     """Get version information for a specific tool.
 
+    Versions are cached for TOOL_CACHE_TTL seconds; failed lookups are not
+    cached, so a transient timeout is retried on the next call.
+
     Args:
         tool_name: Name of the tool to get version for
 
     Returns:
         Version string or "Unknown" if not available
     """
+    cached = _tool_version_cache.get(tool_name)
+    if cached is not None:
+        return cached
     try:
-        if tool_name == 'curl':
-            result = subprocess.run(['curl', '--version'], 
-                                  capture_output=True, text=True, timeout=5)
-        elif tool_name == 'nmap':
-            result = subprocess.run(['nmap', '--version'], 
-                                  capture_output=True, text=True, timeout=5)
-        elif tool_name == 'ping':
-            result = subprocess.run(['ping', '-V'], 
-                                  capture_output=True, text=True, timeout=5)
-        elif tool_name == 'nc':
-            result = subprocess.run(['nc', '-h'], 
-                                  capture_output=True, text=True, timeout=5)
-        elif tool_name == 'nslookup':
-            result = subprocess.run(['nslookup', '-version'], 
-                                  capture_output=True, text=True, timeout=5)
-        elif tool_name == 'dig':
-            result = subprocess.run(['dig', '-v'], 
-                                  capture_output=True, text=True, timeout=5)
-        elif tool_name == 'host':
-            result = subprocess.run(['host', '-V'], 
-                                  capture_output=True, text=True, timeout=5)
-        elif tool_name == 'arping':
-            result = subprocess.run(['arping', '-V'], 
-                                  capture_output=True, text=True, timeout=5)
-        else:
-            result = subprocess.run([tool_name, '--version'], 
-                                  capture_output=True, text=True, timeout=5)
+        result = subprocess.run(_version_command(tool_name), stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, timeout=VERSION_TIMEOUT)
         
         if result.returncode == 0:
-            version_line = result.stdout.split('\n')[0]
-            return version_line
+            # Only the first line is decoded; the rest of the output is ignored
+            version = result.stdout.split(b'\n', 1)[0].decode('utf-8', 'replace')
+            _tool_version_cache.set(tool_name, version)
+            return version
         else:
             return "Unknown"
     except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError, subprocess.SubprocessError):
         return "Unknown"
 
 
+async def _read_tool_version(tool_name: str) -> str:
+    """Run a tool's version command without blocking the event loop.
+
+    Args:
+        tool_name: Name of the tool to get version for
+
+    Returns:
+        First line of the version output, or "Unknown" if not available
+    """
+    process = None
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *_version_command(tool_name),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        stdout, _ = await asyncio.wait_for(process.communicate(), VERSION_TIMEOUT)
+        if process.returncode == 0:
+            return stdout.split(b'\n', 1)[0].decode('utf-8', 'replace')
+        return "Unknown"
+    except asyncio.TimeoutError:
+        if process is not None and process.returncode is None:
+            process.kill()
+            await process.wait()
+        return "Unknown"
+    except OSError:
+        return "Unknown"
+
+
+async def get_tool_versions(tools: List[str]) -> Dict[str, str]:
+    """Get version information for several tools concurrently.
+
+    All version commands run at the same time, so the call takes about as
+    long as the slowest tool. Tools that are not on PATH are reported
+    without starting a process.
+
+    Args:
+        tools: Names of the tools to get versions for
+
+    Returns:
+        Dictionary mapping each tool to its version string
+    """
+    async def version(tool: str) -> str:
+        if not is_tool_available(tool):
+            return "Tool not found"
+        return await _read_tool_version(tool)
+
+    versions = await asyncio.gather(*(version(tool) for tool in tools))
+    return dict(zip(tools, versions))
+
+
 def check_tool_version(tool_name: str) -> Tuple[bool, str]:
     """Check if a specific tool is available and get its version.
 
@@ -158,11 +294,6 @@ def get_system_info() -> Dict[str, Any]:
     Returns:
         Dictionary containing system information
     """
-    try:
-        cpu_count = psutil.cpu_count()
-    except Exception:
-        cpu_count = "Unknown"
-    
     try:
         memory_total = psutil.virtual_memory().total
     except Exception:
@@ -170,10 +301,11 @@ def get_system_info() -> Dict[str, Any]:
     
     info = {
         'platform': platform.system(),
+        'platform_version': platform.release(),
         'python_version': platform.python_version(),
         'architecture': platform.machine(),
         'hostname': platform.node(),
-        'cpu_count': cpu_count,
+        'cpu_count': CPU_COUNT if CPU_COUNT is not None else "Unknown",
         'memory_total': memory_total
     }
     
@@ -203,17 +335,18 @@ def get_network_interfaces() -> Dict[str, List[Dict[str, str]]]:
         Dictionary mapping interface names to their addresses
     """
     try:
-        interfaces = {}
-        for interface, addrs in psutil.net_if_addrs().items():
-            interfaces[interface] = []
-            for addr in addrs:
-                interfaces[interface].append({
-                    'family': str(addr.family),
+        return {
+            interface: [
+                {
+                    'family': AF_NAMES.get(addr.family) or str(addr.family),
                     'address': addr.address,
                     'netmask': addr.netmask
-                })
-        return interfaces
-    except Exception:
+                }
+                for addr in addrs
+            ]
+            for interface, addrs in psutil.net_if_addrs().items()
+        }
+    except OSError:
         return {}
 
 
@@ -234,7 +367,7 @@ def get_disk_usage(path: str = '/') -> Dict[str, int]:
             'free': usage.free,
             'percent': usage.percent
         }
-    except Exception:
+    except OSError:
         return {
             'total': 0,
             'used': 0,
@@ -257,7 +390,7 @@ def get_memory_info() -> Dict[str, int]:
             'used': memory.used,
             'percent': memory.percent
         }
-    except Exception:
+    except OSError:
         return {
             'total': 0,
             'available': 0,
@@ -269,19 +402,16 @@ def get_memory_info() -> Dict[str, int]:
 def get_cpu_info() -> Dict[str, Any]:
     """Get CPU information.
 
+    Usage is measured since the previous call (or module import), so no
+    sampling sleep is needed.
+
     Returns:
         Dictionary with CPU information
     """
-    try:
-        return {
-            'count': psutil.cpu_count(),
-            'usage_percent': psutil.cpu_percent(interval=1)
-        }
-    except Exception:
-        return {
-            'count': 0,
-            'usage_percent': 0.0
-        }
+    return {
+        'count': CPU_COUNT,
+        'usage_percent': psutil.cpu_percent(interval=None)
+    }
 
 
 def validate_network_access(host: str = "8.8.8.8") -> bool:
@@ -294,56 +424,57 @@ def validate_network_access(host: str = "8.8.8.8") -> bool:
         True if network access is available
     """
     try:
-        result = subprocess.run(['ping', '-c', '1', '-W', '5', host], 
-                              capture_output=True, timeout=10)
+        result = subprocess.run(['ping', '-c', '1', '-W', '5', host],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
         return result.returncode == 0
     except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
         return False
 
 
+def _run_privilege_probe(command: List[str]) -> bool:
+    """Run a single privilege probe command.
+
+    Args:
+        command: Probe command to run
+
+    Returns:
+        True if the command exited successfully
+    """
+    try:
+        result = subprocess.run(command, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL, timeout=5)
+        return result.returncode == 0
+    except Exception:
+        return False
+
+
+def can_open_raw_socket() -> bool:
+    """Check whether this process may open raw sockets.
+
+    Scanners with their own TCP stack (masscan, nmap -sS) need raw sockets,
+    which require root or CAP_NET_RAW.
+
+    Returns:
+        True if a raw socket could be opened
+    """
+    try:
+        socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP).close()
+        return True
+    except (OSError, AttributeError):
+        return False
+
+
 def check_privileged_access() -> Dict[str, bool]:
     """Check if privileged access is available for certain tools.
 
+    The probes are independent, so they run concurrently and the check
+    takes as long as the slowest probe rather than their sum.
+
     Returns:
         Dictionary of privilege checks
     """
-    checks = {
-        'can_ping': False,
-        'can_traceroute': False,
-        'can_nmap': False,
-        'can_arp': False
-    }
-    
-    try:
-        # Test ping
-        result = subprocess.run(['ping', '-c', '1', '127.0.0.1'], 
-                              capture_output=True, timeout=5)
-        checks['can_ping'] = result.returncode == 0
-    except:
-        pass
-    
-    try:
-        # Test traceroute
-        result = subprocess.run(['traceroute', '-m', '1', '127.0.0.1'], 
-                              capture_output=True, timeout=5)
-        checks['can_traceroute'] = result.returncode == 0
-    except:
-        pass
-    
-    try:
-        # Test nmap
-        result = subprocess.run(['nmap', '-sn', '127.0.0.1'], 
-                              capture_output=True, timeout=5)
-        checks['can_nmap'] = result.returncode == 0
-    except:
-        pass
-    
-    try:
-        # Test arp
-        result = subprocess.run(['arp', '-a'], 
-                              capture_output=True, timeout=5)
-        checks['can_arp'] = result.returncode == 0
-    except:
-        pass
-    
+    with ThreadPoolExecutor(max_workers=len(PRIVILEGE_PROBES)) as executor:
+        results = executor.map(_run_privilege_probe, PRIVILEGE_PROBES.values())
+        checks = dict(zip(PRIVILEGE_PROBES, results))
+    checks['can_raw_socket'] = can_open_raw_socket()
     return checks
@@ -9,8 +9,10 @@ This package contains validators for:
 
 from .input_validator import (
     validate_hostname,
+    validate_hosts,
     validate_ip_address,
     validate_port,
+    validate_ports,
     validate_url,
     validate_domain,
     sanitize_command_arg,
@@ -19,8 +21,10 @@ from .input_validator import (
 
 __all__ = [
     "validate_hostname",
+    "validate_hosts",
     "validate_ip_address",
     "validate_port",
+    "validate_ports",
     "validate_url",
     "validate_domain",
     "sanitize_command_arg",
@@ -10,8 +10,49 @@ Provides comprehensive input validation and sanitization to prevent:
 
 import re
 import ipaddress
-from typing import Optional
-from urllib.parse import urlparse
+import socket
+import sys
+from functools import lru_cache
+from typing import AbstractSet, Iterable, List, Optional, Union
+
+try:
+    # RE2 matches in linear time, so no argument can trigger backtracking
+    import re2 as arg_re
+except ImportError:  # pragma: no cover - exercised only without google-re2
+    arg_re = re
+
+# Shell metacharacters rejected in hostnames and URLs
+DANGEROUS_CHARS = frozenset(';&|`$(){}<>\n\r')
+# Dot-separated labels of letters, digits and hyphens, not starting/ending with a hyphen
+HOSTNAME_PATTERN = re.compile(
+    r'^(?=.{1,253}$)(?!-)[A-Za-z0-9-]{1,63}(?<!-)(?:\.(?!-)[A-Za-z0-9-]{1,63}(?<!-))*$'
+)
+# Hostname labels followed by an alphabetic top-level domain
+DOMAIN_PATTERN = re.compile(
+    r'^(?!-)[a-zA-Z0-9-]{1,63}(?<!-)(?:\.(?!-)[a-zA-Z0-9-]{1,63}(?<!-))*\.[a-zA-Z]{2,}$'
+)
+# Single-label domains (for internal networks)
+SINGLE_LABEL_PATTERN = re.compile(r'^(?!-)[a-zA-Z0-9-]{1,63}(?<!-)$')
+# URL schemes accepted by validate_url unless the caller passes its own
+DEFAULT_URL_SCHEMES = frozenset({'http', 'https'})
+# The only characters allowed in a port range
+PORT_RANGE_CHARS = frozenset('0123456789,-')
+# Command injection patterns rejected by sanitize_command_arg
+DANGEROUS_ARG_PATTERNS = [
+    r';\s*\w+',  # Command chaining with semicolon
+    r'\|\s*\w+',  # Pipe to another command
+    r'&&\s*\w+',  # AND command chaining
+    r'\|\|\s*\w+',  # OR command chaining
+    r'`[^`]*`',  # Backtick command substitution
+    r'\$\([^\)]*\)',  # Command substitution
+    r'>\s*[/\w]',  # Output redirection
+    r'<\s*[/\w]',  # Input redirection
+]
+# All injection patterns as one alternation, one group per pattern, so an
+# argument is scanned once; lastindex identifies the pattern that matched
+DANGEROUS_ARG_PATTERN = arg_re.compile('|'.join(f'({p})' for p in DANGEROUS_ARG_PATTERNS))
+# Characters at least one of which appears in any match of DANGEROUS_ARG_PATTERN
+DANGEROUS_ARG_CHARS = frozenset(';|&`$<>')
 
 
 class ValidationError(Exception):
@@ -19,6 +60,58 @@ class ValidationError(Exception):
     pass
 
 
+def _has_empty_or_hyphen_edge(name: str) -> bool:
+    """
+    Cheap pre-check for the most common malformed names.
+    
+    Args:
+        name: Hostname or domain to check
+        
+    Returns:
+        True if name starts or ends with a dot or hyphen, or has an empty label
+    """
+    return name[:1] in ('-', '.') or name[-1:] in ('-', '.') or '..' in name
+
+
+def _is_ip_literal(address: str) -> bool:
+    """
+    Check for a plain IPv4/IPv6 address with a single C-level parse.
+    
+    inet_pton is used rather than inet_aton, which also accepts shorthand
+    forms such as "127.1" that ipaddress rejects.
+    
+    Args:
+        address: The address string to check
+        
+    Returns:
+        True if address is a valid IPv4 or IPv6 literal
+    """
+    for family in (socket.AF_INET, socket.AF_INET6):
+        try:
+            socket.inet_pton(family, address)
+            return True
+        except OSError:
+            pass
+    return False
+
+
+@lru_cache(maxsize=1024)
+def _parse_ip(address: str) -> Union[ipaddress.IPv4Address, ipaddress.IPv6Address]:
+    """
+    Parse an IP address; memoized since addresses are immutable.
+    
+    Args:
+        address: The address string to parse
+        
+    Returns:
+        IPv4Address or IPv6Address
+        
+    Raises:
+        ValueError: If address is not a valid IP address
+    """
+    return ipaddress.ip_address(address)
+
+
 def validate_hostname(hostname: str, allow_localhost: bool = True) -> str:
     """
     Validate a hostname.
@@ -28,7 +121,7 @@ def validate_hostname(hostname: str, allow_localhost: bool = True) -> str:
         allow_localhost: Whether to allow localhost/127.0.0.1
         
     Returns:
-        Validated hostname
+        Validated hostname, interned
         
     Raises:
         ValidationError: If hostname is invalid
@@ -36,6 +129,24 @@ def validate_hostname(hostname: str, allow_localhost: bool = True) -> str:
     if not hostname or not isinstance(hostname, str):
         raise ValidationError("Hostname must be a non-empty string")
     
+    return _validate_hostname_cached(hostname, allow_localhost)
+
+
+@lru_cache(maxsize=4096)
+def _validate_hostname_cached(hostname: str, allow_localhost: bool) -> str:
+    """
+    Validate a hostname string; memoized since clients reuse targets.
+    
+    Args:
+        hostname: The hostname to validate
+        allow_localhost: Whether to allow localhost/127.0.0.1
+        
+    Returns:
+        Validated hostname
+        
+    Raises:
+        ValidationError: If hostname is invalid
+    """
     # Remove whitespace
     hostname = hostname.strip()
     
@@ -44,27 +155,59 @@ def validate_hostname(hostname: str, allow_localhost: bool = True) -> str:
         raise ValidationError("Hostname too long (max 253 characters)")
     
     # Check for dangerous characters
-    if re.search(r'[;&|`$\(\)\{\}<>\n\r]', hostname):
+    if not DANGEROUS_CHARS.isdisjoint(hostname):
         raise ValidationError("Hostname contains invalid characters")
     
-    # Try to parse as IP address first
+    # Try to parse as IP address first; loopback only matters when disallowed
+    if allow_localhost and _is_ip_literal(hostname):
+        return sys.intern(hostname)
     try:
-        ip = ipaddress.ip_address(hostname)
+        ip = _parse_ip(hostname)
         if not allow_localhost and ip.is_loopback:
             raise ValidationError("Localhost addresses not allowed")
-        return hostname
+        return sys.intern(hostname)
     except ValueError:
         pass
     
-    # Validate as hostname
-    # Hostname labels can contain letters, digits, and hyphens
-    # Cannot start or end with hyphen
-    hostname_pattern = r'^(?!-)[a-zA-Z0-9-]{1,63}(?<!-)(\\.(?!-)[a-zA-Z0-9-]{1,63}(?<!-))*$'
-    
-    if not re.match(hostname_pattern, hostname):
+    # Validate as hostname; dotless names only need the single-label check
+    if _has_empty_or_hyphen_edge(hostname):
         raise ValidationError(f"Invalid hostname format: {hostname}")
+    pattern = HOSTNAME_PATTERN if '.' in hostname else SINGLE_LABEL_PATTERN
+    if not pattern.match(hostname):
+        raise ValidationError(f"Invalid hostname format: {hostname}")
+    
+    return sys.intern(hostname)
+
+
+def validate_hosts(hosts: Iterable[str], allow_localhost: bool = True) -> List[str]:
+    """
+    Validate a batch of hostnames or IP addresses in one pass.
     
-    return hostname
+    Args:
+        hosts: Hostnames or IP addresses to validate
+        allow_localhost: Whether to allow localhost/127.0.0.1
+        
+    Returns:
+        Validated hosts, in input order
+        
+    Raises:
+        ValidationError: If any host is invalid; lists up to ten offenders
+    """
+    validated = []
+    invalid = []
+    for host in hosts:
+        if not host or not isinstance(host, str):
+            invalid.append(host)
+            continue
+        try:
+            validated.append(_validate_hostname_cached(host, allow_localhost))
+        except ValidationError:
+            invalid.append(host)
+    
+    if invalid:
+        raise ValidationError(f"Invalid hosts: {invalid[:10]}")
+    
+    return validated
 
 
 def validate_ip_address(ip: str, allow_private: bool = True, allow_localhost: bool = True) -> str:
@@ -77,7 +220,7 @@ def validate_ip_address(ip: str, allow_private: bool = True, allow_localhost: bo
         allow_localhost: Whether to allow localhost/127.0.0.1
         
     Returns:
-        Validated IP address
+        Validated IP address, interned
         
     Raises:
         ValidationError: If IP address is invalid
@@ -87,8 +230,12 @@ def validate_ip_address(ip: str, allow_private: bool = True, allow_localhost: bo
     
     ip = ip.strip()
     
+    # Without restrictions there is no need for an address object
+    if allow_private and allow_localhost and _is_ip_literal(ip):
+        return sys.intern(ip)
+    
     try:
-        ip_obj = ipaddress.ip_address(ip)
+        ip_obj = _parse_ip(ip)
     except ValueError as e:
         raise ValidationError(f"Invalid IP address: {e}")
     
@@ -98,7 +245,7 @@ def validate_ip_address(ip: str, allow_private: bool = True, allow_localhost: bo
     if not allow_localhost and ip_obj.is_loopback:
         raise ValidationError("Localhost addresses not allowed")
     
-    return ip
+    return sys.intern(ip)
 
 
 def validate_port(port: int) -> int:
@@ -123,13 +270,34 @@ def validate_port(port: int) -> int:
     return port
 
 
-def validate_url(url: str, allowed_schemes: Optional[list] = None) -> str:
+def validate_ports(ports: Iterable[int]) -> List[int]:
+    """
+    Validate a batch of network port numbers in one pass.
+    
+    Args:
+        ports: Port numbers to validate
+        
+    Returns:
+        Validated ports, in input order
+        
+    Raises:
+        ValidationError: If any port is invalid; lists up to ten offenders
+    """
+    ports = list(ports)
+    invalid = [port for port in ports if not isinstance(port, int) or not 1 <= port <= 65535]
+    if invalid:
+        raise ValidationError(f"Invalid ports: {invalid[:10]}")
+    
+    return ports
+
+
+def validate_url(url: str, allowed_schemes: Optional[AbstractSet[str]] = None) -> str:
     """
     Validate a URL.
     
     Args:
         url: The URL to validate
-        allowed_schemes: List of allowed schemes (default: http, https)
+        allowed_schemes: Set of allowed schemes (default: DEFAULT_URL_SCHEMES)
         
     Returns:
         Validated URL
@@ -143,24 +311,26 @@ def validate_url(url: str, allowed_schemes: Optional[list] = None) -> str:
     url = url.strip()
     
     if allowed_schemes is None:
-        allowed_schemes = ['http', 'https']
-    
-    try:
-        parsed = urlparse(url)
-    except Exception as e:
-        raise ValidationError(f"Invalid URL format: {e}")
+        allowed_schemes = DEFAULT_URL_SCHEMES
     
-    if not parsed.scheme:
+    # Only the scheme and network location are checked, so split them out
+    # directly rather than building a full urlparse() result
+    scheme, sep, rest = url.partition(':')
+    if not sep or not scheme:
         raise ValidationError("URL must have a scheme (http:// or https://)")
     
-    if parsed.scheme not in allowed_schemes:
-        raise ValidationError(f"URL scheme must be one of {allowed_schemes}, got {parsed.scheme}")
+    scheme = scheme.lower()
+    if scheme not in allowed_schemes:
+        raise ValidationError(f"URL scheme must be one of {sorted(allowed_schemes)}, got {scheme}")
     
-    if not parsed.netloc:
+    netloc = rest[2:] if rest.startswith('//') else ''
+    for delimiter in '/?#':
+        netloc = netloc.partition(delimiter)[0]
+    if not netloc:
         raise ValidationError("URL must have a network location (domain/IP)")
     
     # Check for dangerous characters
-    if re.search(r'[;&|`$\(\)\{\}<>\n\r]', url):
+    if not DANGEROUS_CHARS.isdisjoint(url):
         raise ValidationError("URL contains invalid characters")
     
     return url
@@ -174,7 +344,7 @@ def validate_domain(domain: str) -> str:
         domain: The domain name to validate
         
     Returns:
-        Validated domain name
+        Validated domain name, interned
         
     Raises:
         ValidationError: If domain is invalid
@@ -182,27 +352,42 @@ def validate_domain(domain: str) -> str:
     if not domain or not isinstance(domain, str):
         raise ValidationError("Domain must be a non-empty string")
     
+    return _validate_domain_cached(domain)
+
+
+@lru_cache(maxsize=4096)
+def _validate_domain_cached(domain: str) -> str:
+    """
+    Validate a domain name string; memoized since clients reuse targets.
+    
+    Args:
+        domain: The domain name to validate
+        
+    Returns:
+        Validated domain name
+        
+    Raises:
+        ValidationError: If domain is invalid
+    """
     domain = domain.strip().lower()
     
     # Check length
     if len(domain) > 253:
         raise ValidationError("Domain too long (max 253 characters)")
     
-    # Check for dangerous characters
-    if re.search(r'[;&|`$\(\)\{\}<>\n\r\s]', domain):
+    # Check for dangerous characters; after strip() only interior whitespace remains
+    if not DANGEROUS_CHARS.isdisjoint(domain) or any(c.isspace() for c in domain):
         raise ValidationError("Domain contains invalid characters")
     
-    # Domain pattern: labels separated by dots
-    # Each label: 1-63 chars, alphanumeric and hyphens, cannot start/end with hyphen
-    domain_pattern = r'^(?!-)[a-zA-Z0-9-]{1,63}(?<!-)(\\.(?!-)[a-zA-Z0-9-]{1,63}(?<!-))*\\.[a-zA-Z]{2,}$'
-    
-    # Allow single-label domains (for internal networks)
-    single_label_pattern = r'^(?!-)[a-zA-Z0-9-]{1,63}(?<!-)$'
+    if _has_empty_or_hyphen_edge(domain):
+        raise ValidationError(f"Invalid domain format: {domain}")
     
-    if not (re.match(domain_pattern, domain) or re.match(single_label_pattern, domain)):
+    # Only dotted names can match DOMAIN_PATTERN, so try one pattern per name
+    pattern = DOMAIN_PATTERN if '.' in domain else SINGLE_LABEL_PATTERN
+    if not pattern.match(domain):
         raise ValidationError(f"Invalid domain format: {domain}")
     
-    return domain
+    return sys.intern(domain)
 
 
 def sanitize_command_arg(arg: str, max_length: int = 1000) -> str:
@@ -233,21 +418,16 @@ def sanitize_command_arg(arg: str, max_length: int = 1000) -> str:
     if '\x00' in arg:
         raise ValidationError("Argument contains null bytes")
     
+    # Every injection pattern needs one of these characters, so most
+    # arguments (and the empty string) skip the regex entirely
+    if DANGEROUS_ARG_CHARS.isdisjoint(arg):
+        return arg
+    
     # Check for command injection patterns
-    dangerous_patterns = [
-        r';\s*\w+',  # Command chaining with semicolon
-        r'\|\s*\w+',  # Pipe to another command
-        r'&&\s*\w+',  # AND command chaining
-        r'\|\|\s*\w+',  # OR command chaining
-        r'`[^`]*`',  # Backtick command substitution
-        r'\$\([^\)]*\)',  # Command substitution
-        r'>\s*[/\w]',  # Output redirection
-        r'<\s*[/\w]',  # Input redirection
-    ]
-    
-    for pattern in dangerous_patterns:
-        if re.search(pattern, arg):
-            raise ValidationError(f"Argument contains potentially dangerous pattern: {pattern}")
+    match = DANGEROUS_ARG_PATTERN.search(arg)
+    if match:
+        pattern = DANGEROUS_ARG_PATTERNS[match.lastindex - 1]
+        raise ValidationError(f"Argument contains potentially dangerous pattern: {pattern}")
     
     return arg
 
@@ -271,31 +451,30 @@ def validate_port_range(port_range: str) -> str:
     port_range = port_range.strip()
     
     # Check for dangerous characters
-    if re.search(r'[^0-9,\-]', port_range):
+    if not PORT_RANGE_CHARS.issuperset(port_range):
         raise ValidationError("Port range contains invalid characters")
     
-    # Validate individual ports and ranges
-    parts = port_range.split(',')
-    for part in parts:
+    # Validate individual ports and ranges; the character check above means
+    # isdigit() only sees ASCII, so int() below cannot fail
+    for part in port_range.split(','):
         part = part.strip()
         if '-' in part:
             # Range
-            try:
-                start, end = part.split('-')
-                start_port = int(start)
-                end_port = int(end)
-                validate_port(start_port)
-                validate_port(end_port)
-                if start_port > end_port:
-                    raise ValidationError(f"Invalid port range: {part} (start > end)")
-            except ValueError:
+            start, _, end = part.partition('-')
+            if not (start.isdigit() and end.isdigit()):
                 raise ValidationError(f"Invalid port range format: {part}")
+            start_port = int(start)
+            end_port = int(end)
+            if not (1 <= start_port <= 65535 and 1 <= end_port <= 65535):
+                raise ValidationError(f"Port must be between 1 and 65535, got {part}")
+            if start_port > end_port:
+                raise ValidationError(f"Invalid port range: {part} (start > end)")
         else:
             # Single port
-            try:
-                validate_port(int(part))
-            except ValueError:
+            if not part.isdigit():
                 raise ValidationError(f"Invalid port number: {part}")
+            if not 1 <= int(part) <= 65535:
+                raise ValidationError(f"Port must be between 1 and 65535, got {part}")
     
     return port_range
 
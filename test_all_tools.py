@@ -3,8 +3,11 @@
 Test all 26 NetOps MCP tools.
 """
 
+import asyncio
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 sys.path.insert(0, '/app/src')
 
 from netops_mcp.tools.network.http_tools import HTTPTools
@@ -16,252 +19,116 @@ from netops_mcp.tools.system.monitoring_tools import MonitoringTools
 from netops_mcp.tools.security.scanning_tools import ScanningTools
 from netops_mcp.utils.system_check import check_required_tools, get_system_info
 
+# Tool calls mostly wait on the network or a subprocess, so they run concurrently
+MAX_WORKERS = 16
+
+def _call(fn):
+    """Call a tool, running it to completion if it returns a coroutine."""
+    result = fn()
+    if asyncio.iscoroutine(result):
+        # Each worker thread gets its own event loop
+        result = asyncio.run(result)
+    return result
+
+def run_cases(cases, describe=lambda result: f"{len(result)} content items"):
+    """Run (name, callable) cases concurrently, printing results as they complete."""
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(cases))) as executor:
+        futures = {executor.submit(_call, fn): name for name, fn in cases}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                print(f"    ✅ {name}: {describe(future.result())}")
+            except Exception as e:
+                print(f"    ❌ {name} failed: {e}")
+
 def test_http_tools():
     """Test HTTP/API Testing Tools (3 tools)."""
     print("🔧 Testing HTTP/API Testing Tools...")
     tools = HTTPTools()
     
-    # Test curl_request
-    print("  📡 Testing curl_request...")
-    try:
-        result = tools.curl_request("https://httpbin.org/get", method="GET", timeout=10)
-        print(f"    ✅ curl_request: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ curl_request failed: {e}")
-    
-    # Test httpie_request
-    print("  📡 Testing httpie_request...")
-    try:
-        result = tools.httpie_request("https://httpbin.org/get", method="GET", timeout=10)
-        print(f"    ✅ httpie_request: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ httpie_request failed: {e}")
-    
-    # Test api_test
-    print("  📡 Testing api_test...")
-    try:
-        result = tools.api_test("https://httpbin.org/get", method="GET", expected_status=200, timeout=10)
-        print(f"    ✅ api_test: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ api_test failed: {e}")
+    run_cases([
+        ("curl_request", partial(tools.curl_request, "https://httpbin.org/get", method="GET", timeout=10)),
+        ("httpie_request", partial(tools.httpie_request, "https://httpbin.org/get", method="GET", timeout=10)),
+        ("api_test", partial(tools.api_test, "https://httpbin.org/get", method="GET", expected_status=200, timeout=10)),
+    ])
 
 def test_connectivity_tools():
     """Test Network Connectivity Tools (5 tools)."""
     print("🔧 Testing Network Connectivity Tools...")
     tools = ConnectivityTools()
     
-    # Test ping_host
-    print("  📡 Testing ping_host...")
-    try:
-        result = tools.ping_host("8.8.8.8", count=2, timeout=10)
-        print(f"    ✅ ping_host: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ ping_host failed: {e}")
-    
-    # Test traceroute_path
-    print("  📡 Testing traceroute_path...")
-    try:
-        result = tools.traceroute_path("8.8.8.8", max_hops=5, timeout=10)
-        print(f"    ✅ traceroute_path: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ traceroute_path failed: {e}")
-    
-    # Test mtr_monitor
-    print("  📡 Testing mtr_monitor...")
-    try:
-        result = tools.mtr_monitor("8.8.8.8", count=3, timeout=10)
-        print(f"    ✅ mtr_monitor: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ mtr_monitor failed: {e}")
-    
-    # Test telnet_connect
-    print("  📡 Testing telnet_connect...")
-    try:
-        result = tools.telnet_connect("8.8.8.8", port=53, timeout=5)
-        print(f"    ✅ telnet_connect: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ telnet_connect failed: {e}")
-    
-    # Test netcat_test
-    print("  📡 Testing netcat_test...")
-    try:
-        result = tools.netcat_test("8.8.8.8", port=53, timeout=5)
-        print(f"    ✅ netcat_test: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ netcat_test failed: {e}")
+    run_cases([
+        ("ping_host", partial(tools.ping_host, "8.8.8.8", count=2, timeout=10)),
+        ("traceroute_path", partial(tools.traceroute_path, "8.8.8.8", max_hops=5, timeout=10)),
+        ("mtr_monitor", partial(tools.mtr_monitor, "8.8.8.8", count=3, timeout=10)),
+        ("telnet_connect", partial(tools.telnet_connect, "8.8.8.8", port=53, timeout=5)),
+        ("netcat_test", partial(tools.netcat_test, "8.8.8.8", port=53, timeout=5)),
+    ])
 
 def test_dns_tools():
     """Test DNS Tools (3 tools)."""
     print("🔧 Testing DNS Tools...")
     tools = DNSTools()
     
-    # Test nslookup_query
-    print("  📡 Testing nslookup_query...")
-    try:
-        result = tools.nslookup_query("google.com", record_type="A")
-        print(f"    ✅ nslookup_query: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ nslookup_query failed: {e}")
-    
-    # Test dig_query
-    print("  📡 Testing dig_query...")
-    try:
-        result = tools.dig_query("google.com", record_type="A")
-        print(f"    ✅ dig_query: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ dig_query failed: {e}")
-    
-    # Test host_lookup
-    print("  📡 Testing host_lookup...")
-    try:
-        result = tools.host_lookup("google.com", record_type="A")
-        print(f"    ✅ host_lookup: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ host_lookup failed: {e}")
+    run_cases([
+        ("nslookup_query", partial(tools.nslookup_query, "google.com", record_type="A")),
+        ("dig_query", partial(tools.dig_query, "google.com", record_type="A")),
+        ("host_lookup", partial(tools.host_lookup, "google.com", record_type="A")),
+    ])
 
 def test_discovery_tools():
     """Test Network Discovery Tools (2 tools)."""
     print("🔧 Testing Network Discovery Tools...")
     tools = DiscoveryTools()
     
-    # Test nmap_scan
-    print("  📡 Testing nmap_scan...")
-    try:
-        result = tools.nmap_scan("127.0.0.1", ports="22,80,443", scan_type="basic", timeout=30)
-        print(f"    ✅ nmap_scan: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ nmap_scan failed: {e}")
-    
-    # Test service_discovery
-    print("  📡 Testing service_discovery...")
-    try:
-        result = tools.service_discovery("127.0.0.1", ports="22,80,443")
-        print(f"    ✅ service_discovery: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ service_discovery failed: {e}")
+    run_cases([
+        ("nmap_scan", partial(tools.nmap_scan, "127.0.0.1", ports="22,80,443", scan_type="basic", timeout=30)),
+        ("service_discovery", partial(tools.service_discovery, "127.0.0.1", ports="22,80,443")),
+    ])
 
 def test_network_tools():
     """Test System Network Tools (4 tools)."""
     print("🔧 Testing System Network Tools...")
     tools = NetworkTools()
     
-    # Test ss_connections
-    print("  📡 Testing ss_connections...")
-    try:
-        result = tools.ss_connections()
-        print(f"    ✅ ss_connections: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ ss_connections failed: {e}")
-    
-    # Test netstat_connections
-    print("  📡 Testing netstat_connections...")
-    try:
-        result = tools.netstat_connections()
-        print(f"    ✅ netstat_connections: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ netstat_connections failed: {e}")
-    
-    # Test arp_table
-    print("  📡 Testing arp_table...")
-    try:
-        result = tools.arp_table()
-        print(f"    ✅ arp_table: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ arp_table failed: {e}")
-    
-    # Test arping_host
-    print("  📡 Testing arping_host...")
-    try:
-        result = tools.arping_host("127.0.0.1", count=2)
-        print(f"    ✅ arping_host: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ arping_host failed: {e}")
+    run_cases([
+        ("ss_connections", tools.ss_connections),
+        ("netstat_connections", tools.netstat_connections),
+        ("arp_table", tools.arp_table),
+        ("arping_host", partial(tools.arping_host, "127.0.0.1", count=2)),
+    ])
 
 def test_monitoring_tools():
     """Test System Monitoring Tools (5 tools)."""
     print("🔧 Testing System Monitoring Tools...")
     tools = MonitoringTools()
     
-    # Test system_status
-    print("  📡 Testing system_status...")
-    try:
-        result = tools.system_status()
-        print(f"    ✅ system_status: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ system_status failed: {e}")
-    
-    # Test cpu_usage
-    print("  📡 Testing cpu_usage...")
-    try:
-        result = tools.cpu_usage()
-        print(f"    ✅ cpu_usage: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ cpu_usage failed: {e}")
-    
-    # Test memory_usage
-    print("  📡 Testing memory_usage...")
-    try:
-        result = tools.memory_usage()
-        print(f"    ✅ memory_usage: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ memory_usage failed: {e}")
-    
-    # Test disk_usage
-    print("  📡 Testing disk_usage...")
-    try:
-        result = tools.disk_usage()
-        print(f"    ✅ disk_usage: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ disk_usage failed: {e}")
-    
-    # Test process_list
-    print("  📡 Testing process_list...")
-    try:
-        result = tools.process_list(limit=5)
-        print(f"    ✅ process_list: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ process_list failed: {e}")
+    run_cases([
+        ("system_status", tools.system_status),
+        ("cpu_usage", tools.cpu_usage),
+        ("memory_usage", tools.memory_usage),
+        ("disk_usage", tools.disk_usage),
+        ("process_list", partial(tools.process_list, limit=5)),
+    ])
 
 def test_scanning_tools():
     """Test Security Tools (2 tools)."""
     print("🔧 Testing Security Tools...")
     tools = ScanningTools()
     
-    # Test port_scan
-    print("  📡 Testing port_scan...")
-    try:
-        result = tools.port_scan("127.0.0.1", ports="22,80,443", timeout=30)
-        print(f"    ✅ port_scan: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ port_scan failed: {e}")
-    
-    # Test service_enumeration
-    print("  📡 Testing service_enumeration...")
-    try:
-        result = tools.service_enumeration("127.0.0.1", ports="22,80,443")
-        print(f"    ✅ service_enumeration: {len(result)} content items")
-    except Exception as e:
-        print(f"    ❌ service_enumeration failed: {e}")
+    run_cases([
+        ("port_scan", partial(tools.port_scan, "127.0.0.1", ports="22,80,443", timeout=30)),
+        ("service_enumeration", partial(tools.service_enumeration, "127.0.0.1", ports="22,80,443")),
+    ])
 
 def test_system_tools():
     """Test System Tools (2 tools)."""
     print("🔧 Testing System Tools...")
     
-    # Test check_required_tools
-    print("  📡 Testing check_required_tools...")
-    try:
-        result = check_required_tools()
-        print(f"    ✅ check_required_tools: {result}")
-    except Exception as e:
-        print(f"    ❌ check_required_tools failed: {e}")
-    
-    # Test get_system_info
-    print("  📡 Testing get_system_info...")
-    try:
-        result = get_system_info()
-        print(f"    ✅ get_system_info: {result}")
-    except Exception as e:
-        print(f"    ❌ get_system_info failed: {e}")
+    run_cases([
+        ("check_required_tools", check_required_tools),
+        ("get_system_info", get_system_info),
+    ], describe=str)
 
 def main():
     """Main function to test all tools."""
@@ -7,16 +7,18 @@ import requests
 import json
 import time
 
+# One session for all requests so the connection to the server is kept alive
+_session = requests.Session()
+_session.headers.update({
+    "Content-Type": "application/json",
+    "Accept": "text/event-stream"
+})
+
 
 def test_mcp_http_request(method, params=None):
     """Test MCP HTTP request."""
     url = "http://localhost:8815/netops-mcp"
     
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "text/event-stream"
-    }
-    
     payload = {
         "jsonrpc": "2.0",
         "id": 1,
@@ -25,7 +27,7 @@ def test_mcp_http_request(method, params=None):
     }
     
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+        response = _session.post(url, json=payload, timeout=30)
         print(f"📡 Request: {method}")
         print(f"📊 Status: {response.status_code}")
         print(f"📄 Response: {response.text[:500]}...")
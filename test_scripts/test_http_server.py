@@ -8,13 +8,16 @@ import json
 import time
 import sys
 
+# One session for all requests so the connection to the server is kept alive
+_session = requests.Session()
+
 
 def test_health_endpoint(base_url):
     """Test health endpoint."""
     print("🔍 Testing health endpoint...")
     
     try:
-        response = requests.get(f"{base_url}/health", timeout=10)
+        response = _session.get(f"{base_url}/health", timeout=10)
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Health check passed: {data}")
@@ -32,7 +35,7 @@ def test_tools_endpoint(base_url):
     print("🔍 Testing tools endpoint...")
     
     try:
-        response = requests.get(f"{base_url}/tools", timeout=10)
+        response = _session.get(f"{base_url}/tools", timeout=10)
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Tools endpoint: {len(data.get('tools', []))} tools available")
@@ -63,7 +66,7 @@ def test_ping_tool(base_url):
             }
         }
         
-        response = requests.post(base_url, json=payload, timeout=30)
+        response = _session.post(base_url, json=payload, timeout=30)
         if response.status_code == 200:
             data = response.json()
             if "result" in data:
@@ -99,7 +102,7 @@ def test_curl_tool(base_url):
             }
         }
         
-        response = requests.post(base_url, json=payload, timeout=30)
+        response = _session.post(base_url, json=payload, timeout=30)
         if response.status_code == 200:
             data = response.json()
             if "result" in data:
@@ -131,7 +134,7 @@ def test_system_status_tool(base_url):
             }
         }
         
-        response = requests.post(base_url, json=payload, timeout=30)
+        response = _session.post(base_url, json=payload, timeout=30)
         if response.status_code == 200:
             data = response.json()
             if "result" in data:
@@ -4,82 +4,115 @@ MCP Client test script for NetOpsMCP.
 """
 
 import asyncio
-import json
+import sys
+from contextlib import asynccontextmanager
+import httpx
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+from netops_mcp.utils.serialization import dumps
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+else:
+    # libuv-backed loop: faster socket I/O and subprocess spawning
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
-async def test_netops_tools():
-    """Test NetOps tools via MCP."""
-    print("🚀 Testing NetOpsMCP Tools via MCP Client")
-    print("-" * 50)
-    
-    # Connect to the server
+HTTP_URL = "http://localhost:8815/netops-mcp"
+
+# Connection pool for the HTTP transport; the tool calls run concurrently
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=8, max_connections=8)
+
+
+def _pooled_http_client(headers=None, timeout=None, auth=None):
+    """Build the transport's httpx client with a keep-alive connection pool."""
+    if timeout is None:
+        # Long read timeout since the server may hold a response stream open
+        timeout = httpx.Timeout(30, read=300)
+    return httpx.AsyncClient(headers=headers, timeout=timeout, auth=auth, limits=HTTP_LIMITS)
+
+
+def _pp(content):
+    """Pretty-print tool result content, using orjson when it is installed."""
+    return dumps([item.model_dump(exclude_none=True) for item in content], indent=True)
+
+
+@asynccontextmanager
+async def mcp_http_session():
+    """Connect to the running HTTP server and yield an initialized session for all tests."""
+    async with streamablehttp_client(HTTP_URL, httpx_client_factory=_pooled_http_client) as (read, write, _):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            yield session
+
+
+@asynccontextmanager
+async def mcp_stdio_session():
+    """Spawn the stdio server once and yield an initialized session for all tests."""
+    # sys.executable avoids a PATH lookup and runs the server in this interpreter
     server_params = StdioServerParameters(
-        command="python",
+        command=sys.executable,
         args=["-m", "netops_mcp.server"]
     )
     
     async with stdio_client(server_params) as (read, write):
         async with ClientSession(read, write) as session:
-            # Initialize the session
             await session.initialize()
-            
-            # List available tools
-            print("📋 Available tools:")
-            tools = await session.list_tools()
-            for tool in tools:
-                print(f"  - {tool.name}: {tool.description}")
-            
-            print("\n" + "-" * 50)
-            
-            # Test ping tool
-            print("🔍 Testing ping tool...")
-            try:
-                result = await session.call_tool("ping_host", {
-                    "host": "8.8.8.8",
-                    "count": 3
-                })
-                print("✅ Ping tool result:")
-                print(json.dumps(result.content, indent=2))
-            except Exception as e:
-                print(f"❌ Ping tool failed: {e}")
-            
-            print("\n" + "-" * 50)
-            
-            # Test curl tool
-            print("🔍 Testing curl tool...")
-            try:
-                result = await session.call_tool("curl_request", {
-                    "url": "https://httpbin.org/get",
-                    "method": "GET",
-                    "timeout": 10
-                })
-                print("✅ Curl tool result:")
-                print(json.dumps(result.content, indent=2))
-            except Exception as e:
-                print(f"❌ Curl tool failed: {e}")
-            
-            print("\n" + "-" * 50)
-            
-            # Test system status
-            print("🔍 Testing system status...")
-            try:
-                result = await session.call_tool("system_status", {})
-                print("✅ System status result:")
-                print(json.dumps(result.content, indent=2))
-            except Exception as e:
-                print(f"❌ System status failed: {e}")
-
-
-async def test_http_server():
-    """Test HTTP server via MCP."""
-    print("🚀 Testing NetOpsMCP HTTP Server")
+            yield session
+
+
+async def test_list_tools(session):
+    """Test listing the available tools."""
+    print("📋 Available tools:")
+    tools = (await session.list_tools()).tools
+    if not tools:
+        return
+    # One write for the whole inventory rather than one print per tool
+    sys.stdout.write("".join(f"  - {tool.name}: {tool.description}\n" for tool in tools))
+
+
+async def test_netops_tools(session):
+    """Test NetOps tools via MCP."""
+    # The server handles requests concurrently, so issue all tool
+    # calls at once over the one session
+    calls = [
+        ("Ping tool", "ping_host", {"host": "8.8.8.8", "count": 3}),
+        ("Curl tool", "curl_request", {
+            "url": "https://httpbin.org/get",
+            "method": "GET",
+            "timeout": 10
+        }),
+        ("System status", "system_status", {})
+    ]
+    print(f"🔍 Testing {len(calls)} tools concurrently...")
+    results = await asyncio.gather(
+        *(session.call_tool(name, arguments) for _, name, arguments in calls),
+        return_exceptions=True
+    )
+    
+    for (label, _, _), result in zip(calls, results):
+        print("\n" + "-" * 50)
+        try:
+            if isinstance(result, Exception):
+                raise result
+            print(f"✅ {label} result:")
+            print(_pp(result.content))
+        except Exception as e:
+            print(f"❌ {label} failed: {e}")
+
+
+async def run_tests(transport):
+    """Run the tool tests over one session on the given transport."""
+    print(f"🚀 Testing NetOpsMCP Tools via MCP Client ({transport})")
     print("-" * 50)
     
-    # This would require a different approach for HTTP transport
-    print("⚠️  HTTP transport testing requires different client implementation")
-    print("   The server is running on http://localhost:8815/netops-mcp")
+    open_session = mcp_http_session if transport == "http" else mcp_stdio_session
+    async with open_session() as session:
+        for test in (test_list_tools, test_netops_tools):
+            await test(session)
+            print("\n" + "-" * 50)
 
 
 def main():
@@ -87,16 +120,15 @@ def main():
     print("🎯 NetOpsMCP Tool Testing")
     print("=" * 50)
     
-    # Test stdio transport
+    # The HTTP server is already running, so no process is spawned per run;
+    # pass --stdio to test the stdio transport instead
+    transport = "stdio" if "--stdio" in sys.argv[1:] else "http"
     try:
-        asyncio.run(test_netops_tools())
+        asyncio.run(run_tests(transport))
     except Exception as e:
-        print(f"❌ Stdio transport test failed: {e}")
+        print(f"❌ {transport} transport test failed: {e}")
     
     print("\n" + "=" * 50)
-    
-    # Test HTTP transport
-    test_http_server()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,43 @@
+"""
+Shared test data for NetOps MCP tests.
+
+Tuples so that session-scoped fixtures and parametrize lists can share
+one immutable object.
+"""
+
+# Valid hostnames/IPs for testing
+VALID_HOSTS = (
+    "google.com",
+    "192.168.1.1",
+    "10.0.0.1",
+    "localhost",
+    "127.0.0.1",
+    "::1",
+    "example.com"
+)
+
+# Invalid hostnames for testing
+INVALID_HOSTS = (
+    "",
+    None,
+    "invalid..host",
+    "256.256.256.256",
+    "192.168.1.256",
+    "host with spaces",
+    "host@invalid"
+)
+
+# Valid ports for testing
+VALID_PORTS = (80, 443, 8080, 22, 53, 3306, 5432, "80", "443")
+
+# Invalid ports for testing
+INVALID_PORTS = (0, 70000, -1, "invalid", "abc", 65536)
+
+# Test URLs for HTTP testing
+TEST_URLS = (
+    "https://httpbin.org/get",
+    "https://httpbin.org/post",
+    "https://httpbin.org/status/200",
+    "https://httpbin.org/status/404",
+    "https://httpbin.org/delay/1"
+)
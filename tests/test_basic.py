@@ -2,13 +2,18 @@
 Basic tests for NetOps MCP.
 """
 
+import asyncio
 import pytest
+import socket
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from netops_mcp.tools.base import NetOpsTool
+from netops_mcp.tools.base import NetOpsTool, _validate_host_cached, _resolve_executable
 from netops_mcp.utils.system_check import check_required_tools
+from netops_mcp.utils import serialization
+from netops_mcp.utils.metrics_cache import SwapInfo
+from unittest.mock import patch
 
 
 class TestNetOpsTool:
@@ -20,33 +25,203 @@ class TestNetOpsTool:
         assert tool is not None
         assert hasattr(tool, 'logger')
 
-    def test_validate_host(self):
+    @pytest.fixture(scope="class")
+    def tool(self):
+        """One NetOpsTool shared by the validation cases."""
+        return NetOpsTool()
+
+    @pytest.mark.parametrize("host,expected", [
+        ("google.com", True),
+        ("192.168.1.1", True),
+        ("localhost", True),
+        ("", False),
+        (None, False),
+    ])
+    def test_validate_host(self, tool, host, expected):
         """Test host validation."""
+        assert tool._validate_host(host) is expected
+
+    def test_validate_host_is_memoized(self):
+        """Test repeated host validation is served from the cache."""
         tool = NetOpsTool()
+        NetOpsTool.clear_host_cache()
         
-        # Valid hosts
-        assert tool._validate_host("google.com") == True
-        assert tool._validate_host("192.168.1.1") == True
-        assert tool._validate_host("localhost") == True
+        assert tool._validate_host("example.com") == True
+        assert tool._validate_host("example.com") == True
         
-        # Invalid hosts
-        assert tool._validate_host("") == False
-        assert tool._validate_host(None) == False
+        info = _validate_host_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+        
+        NetOpsTool.clear_host_cache()
+        assert _validate_host_cached.cache_info().currsize == 0
 
-    def test_validate_port(self):
-        """Test port validation."""
+    def test_execute_command_non_utf8_output(self):
+        """Test binary command output is decoded with replacement characters."""
+        tool = NetOpsTool()
+        
+        result = tool._execute_command(
+            [sys.executable, "-c", "import sys; sys.stdout.buffer.write(b'ok\\xff')"]
+        )
+        
+        assert result["success"] == True
+        assert result["stdout"] == "ok\ufffd"
+
+    def test_execute_command_uses_absolute_executable(self):
+        """Test commands are launched by absolute path so posix_spawn can be used."""
+        tool = NetOpsTool()
+        
+        with patch('netops_mcp.tools.base.subprocess.run') as mock_run:
+            mock_run.return_value.returncode = 0
+            tool._execute_command(["sh", "-c", "true"])
+        
+        kwargs = mock_run.call_args.kwargs
+        assert os.path.isabs(kwargs["executable"])
+        assert kwargs["close_fds"] == False
+        assert _resolve_executable("netops-mcp-no-such-command") == "netops-mcp-no-such-command"
+
+    @pytest.mark.asyncio
+    async def test_format_response_async(self):
+        """Test large payloads are serialized in a worker thread."""
+        tool = NetOpsTool()
+        data = {"stdout": "x" * 10}
+        
+        with patch('netops_mcp.tools.base.asyncio.to_thread') as mock_to_thread:
+            small = await tool._format_response_async(data, "test", size_hint=10)
+        mock_to_thread.assert_not_called()
+        
+        large = await tool._format_response_async(data, "test", size_hint=1024 * 1024)
+        assert small[0].text == large[0].text == tool._format_response(data)[0].text
+
+    @pytest.mark.asyncio
+    async def test_execute_command_async(self):
+        """Test asynchronous command execution."""
+        tool = NetOpsTool()
+        
+        result = await tool._execute_command_async([sys.executable, "-c", "print('hello')"])
+        
+        assert result["success"] == True
+        assert result["stdout"].strip() == "hello"
+        assert result["return_code"] == 0
+
+    @pytest.mark.asyncio
+    async def test_execute_command_async_errors(self):
+        """Test asynchronous command execution failure modes."""
+        tool = NetOpsTool()
+        
+        missing = await tool._execute_command_async(["netops-mcp-no-such-command"])
+        assert missing["success"] == False
+        assert "Command not found" in missing["stderr"]
+        
+        timed_out = await tool._execute_command_async(
+            [sys.executable, "-c", "import time; time.sleep(5)"], timeout=0.1
+        )
+        assert timed_out["success"] == False
+        assert timed_out["stderr"] == "Command timed out"
+
+    @pytest.mark.asyncio
+    async def test_execute_many(self):
+        """Test batched commands keep their order and respect the concurrency limit."""
+        tool = NetOpsTool()
+        running = peak = 0
+        
+        async def fake_execute(command, timeout):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"success": True, "stdout": command[-1]}
+        
+        with patch('netops_mcp.tools.base.MAX_CONCURRENT_COMMANDS', 2), \
+             patch.object(tool, '_execute_command_async', side_effect=fake_execute):
+            results = await tool._execute_many([["echo", str(i)] for i in range(5)])
+        
+        assert [r["stdout"] for r in results] == ["0", "1", "2", "3", "4"]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_tcp_probe(self):
+        """Test in-process TCP probe against open and closed ports."""
+        tool = NetOpsTool()
+        
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen(1)
+            port = server.getsockname()[1]
+            
+            result = await tool._tcp_probe("127.0.0.1", port, timeout=5)
+            assert result["success"] == True
+            assert result["return_code"] == 0
+        
+        result = await tool._tcp_probe("127.0.0.1", port, timeout=5)
+        assert result["success"] == False
+        assert str(port) in result["stderr"]
+
+    def test_execute_command_caps_stdout(self):
+        """Test max_stdout keeps only the start of stdout and still collects stderr."""
+        tool = NetOpsTool()
+        script = "import sys; sys.stdout.write('a' * 1_000_000); sys.stderr.write('done')"
+        
+        result = tool._execute_command([sys.executable, "-c", script], timeout=10, max_stdout=100)
+        
+        assert result["success"] == True
+        assert result["stdout"] == "a" * 100
+        assert result["stdout_truncated"] == True
+        assert result["stderr"] == "done"
+
+    def test_execute_command_capped_timeout(self):
+        """Test a capped command that overruns its timeout is killed."""
         tool = NetOpsTool()
         
-        # Valid ports
-        assert tool._validate_port(80) == True
-        assert tool._validate_port(443) == True
-        assert tool._validate_port(8080) == True
-        assert tool._validate_port("80") == True
+        result = tool._execute_command([sys.executable, "-c", "import time; time.sleep(10)"],
+                                       timeout=0.2, max_stdout=100)
         
-        # Invalid ports
-        assert tool._validate_port(0) == False
-        assert tool._validate_port(70000) == False
-        assert tool._validate_port("invalid") == False
+        assert result["success"] == False
+        assert "timed out" in result["stderr"]
+
+    @pytest.mark.asyncio
+    async def test_tcp_probe_reuses_resolution(self):
+        """Test repeat probes of a host resolve it once until a probe fails or times out."""
+        tool = NetOpsTool()
+        
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen(2)
+            port = server.getsockname()[1]
+            
+            with patch('socket.getaddrinfo', wraps=socket.getaddrinfo) as mock_getaddrinfo:
+                assert (await tool._tcp_probe("localhost", port, timeout=5))["success"] == True
+                assert (await tool._tcp_probe("localhost", port, timeout=5))["success"] == True
+                assert mock_getaddrinfo.call_count == 1
+        
+        with patch('socket.getaddrinfo', wraps=socket.getaddrinfo) as mock_getaddrinfo:
+            assert (await tool._tcp_probe("localhost", port, timeout=5))["success"] == False
+            await tool._tcp_probe("localhost", port, timeout=5)
+            assert mock_getaddrinfo.call_count == 1
+        
+        async def hang(loop, sock, address):
+            await asyncio.Event().wait()
+        
+        with patch('socket.getaddrinfo', wraps=socket.getaddrinfo) as mock_getaddrinfo, \
+             patch('asyncio.selector_events.BaseSelectorEventLoop.sock_connect', side_effect=hang, autospec=True):
+            assert (await tool._tcp_probe("localhost", port, timeout=0.1))["success"] == False
+            assert tool._addrinfo_cache.get(("localhost", port)) is None
+            await tool._tcp_probe("localhost", port, timeout=0.1)
+            assert mock_getaddrinfo.call_count == 2
+
+    @pytest.mark.parametrize("port,expected", [
+        (80, True),
+        (443, True),
+        (8080, True),
+        ("80", True),
+        (0, False),
+        (70000, False),
+        ("invalid", False),
+    ])
+    def test_validate_port(self, tool, port, expected):
+        """Test port validation."""
+        assert tool._validate_port(port) is expected
 
 
 class TestSystemCheck:
@@ -70,6 +245,57 @@ class TestSystemCheck:
         assert isinstance(result["all_available"], bool)
 
 
+class TestSerialization:
+    """Test JSON serialization helpers."""
+
+    def test_dumps_matches_stdlib_fallback(self):
+        """Test orjson and stdlib json produce the same indented output."""
+        data = {"host": "example.com", "success": False, "ports": [22, 80], "rtt": 1.5, "extra": None}
+        
+        fast = serialization.dumps(data, indent=True)
+        with patch.object(serialization, "orjson", None):
+            fallback = serialization.dumps(data, indent=True)
+        
+        assert fast == fallback
+        assert '"success": false' in fast
+
+    def test_dumps_compact_and_unicode_match_fallback(self):
+        """Test compact and non-ASCII output is identical with and without orjson."""
+        data = {"name": "café", "hops": [1, 2]}
+        
+        fast = serialization.dumps(data)
+        with patch.object(serialization, "orjson", None):
+            fallback = serialization.dumps(data)
+            fallback_indented = serialization.dumps(data, indent=True)
+        
+        assert fast == fallback == '{"name":"café","hops":[1,2]}'
+        assert fallback_indented == serialization.dumps(data, indent=True)
+
+    def test_dumps_slotted_dataclass(self):
+        """Test slotted dataclasses serialize as objects with and without orjson."""
+        swap = SwapInfo(total=100, used=25, free=75, percent=25.0, sin=0, sout=0)
+        
+        fast = serialization.dumps({"swap_memory": swap})
+        with patch.object(serialization, "orjson", None):
+            fallback = serialization.dumps({"swap_memory": swap})
+        
+        assert fast == fallback
+        assert serialization.loads(fast)["swap_memory"]["percent"] == 25.0
+
+    def test_dumps_non_serializable_values(self):
+        """Test values without a JSON form are converted with str()."""
+        result = serialization.loads(serialization.dumps({1: object}))
+        
+        assert result == {"1": str(object)}
+
+    def test_loads_invalid_json(self):
+        """Test invalid JSON raises JSONDecodeError."""
+        import json
+        
+        with pytest.raises(json.JSONDecodeError):
+            serialization.loads("not json")
+
+
 def test_imports():
     """Test that all modules can be imported."""
     try:
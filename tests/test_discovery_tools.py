@@ -2,17 +2,27 @@
 Tests for DiscoveryTools.
 """
 
+import asyncio
+import json
 import pytest
-from unittest.mock import patch, MagicMock
+import socket
+import time
+from unittest.mock import patch, MagicMock, AsyncMock
 from netops_mcp.tools.network.discovery_tools import DiscoveryTools
 
 
 class TestDiscoveryTools:
     """Test DiscoveryTools functionality."""
 
+    @classmethod
+    def setup_class(cls):
+        """Set up one tool instance shared by the tests."""
+        cls.discovery_tools = DiscoveryTools()
+
     def setup_method(self):
-        """Set up test fixtures."""
-        self.discovery_tools = DiscoveryTools()
+        """Reset the shared tool's cached state."""
+        self.discovery_tools._scan_cache.clear()
+        self.discovery_tools._addrinfo_cache.clear()
 
     def test_initialization(self):
         """Test DiscoveryTools initialization."""
@@ -21,14 +31,15 @@ class TestDiscoveryTools:
 
     @pytest.mark.parametrize("host,scan_type,expected_success", [
         ("google.com", "basic", True),
-        ("8.8.8.8", "quick", True),
+        ("8.8.8.8", "basic", True),
         ("192.168.1.1", "full", True),
         ("", "basic", False),
         (None, "basic", False),
     ])
-    def test_nmap_scan_valid_inputs(self, host, scan_type, expected_success):
+    @pytest.mark.asyncio
+    async def test_nmap_scan_valid_inputs(self, host, scan_type, expected_success):
         """Test nmap_scan with valid inputs."""
-        with patch.object(self.discovery_tools, '_execute_command') as mock_execute:
+        with patch.object(self.discovery_tools, '_execute_command_async', new_callable=AsyncMock) as mock_execute:
             mock_execute.return_value = {
                 "success": expected_success,
                 "stdout": "Nmap scan report for test-host",
@@ -36,7 +47,7 @@ class TestDiscoveryTools:
                 "return_code": 0 if expected_success else 1
             }
             
-            result = self.discovery_tools.nmap_scan(host, scan_type=scan_type)
+            result = await self.discovery_tools.nmap_scan(host, scan_type=scan_type)
             
             assert len(result) > 0
             assert result[0].type == "text"
@@ -51,9 +62,10 @@ class TestDiscoveryTools:
         ("google.com", ""),
         ("google.com", None),
     ])
-    def test_nmap_scan_invalid_scan_type(self, host, scan_type):
+    @pytest.mark.asyncio
+    async def test_nmap_scan_invalid_scan_type(self, host, scan_type):
         """Test nmap_scan with invalid scan types."""
-        result = self.discovery_tools.nmap_scan(host, scan_type=scan_type)
+        result = await self.discovery_tools.nmap_scan(host, scan_type=scan_type)
         
         assert len(result) > 0
         assert result[0].type == "text"
@@ -64,25 +76,191 @@ class TestDiscoveryTools:
         (None, "basic"),
         ("invalid..host", "basic"),
     ])
-    def test_nmap_scan_invalid_host(self, host, scan_type):
+    @pytest.mark.asyncio
+    async def test_nmap_scan_invalid_host(self, host, scan_type):
         """Test nmap_scan with invalid hosts."""
-        result = self.discovery_tools.nmap_scan(host, scan_type=scan_type)
+        result = await self.discovery_tools.nmap_scan(host, scan_type=scan_type)
         
         assert len(result) > 0
         assert result[0].type == "text"
         assert "error" in result[0].text.lower()
 
-    def test_nmap_scan_command_timeout(self):
+    @pytest.mark.asyncio
+    async def test_nmap_scan_command_timeout(self):
         """Test nmap_scan with command timeout."""
-        with patch.object(self.discovery_tools, '_execute_command') as mock_execute:
+        with patch.object(self.discovery_tools, '_execute_command_async', new_callable=AsyncMock) as mock_execute:
             mock_execute.side_effect = TimeoutError("Command timed out")
             
-            result = self.discovery_tools.nmap_scan("google.com", scan_type="basic")
+            result = await self.discovery_tools.nmap_scan("google.com", scan_type="basic")
             
             assert len(result) > 0
             assert result[0].type == "text"
             assert "error" in result[0].text.lower()
 
+    @pytest.mark.asyncio
+    async def test_nmap_scan_quick_sweeps_in_process(self):
+        """Test a quick scan without ports is a connect sweep that starts no nmap process."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen(1)
+            open_port = server.getsockname()[1]
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as unused:
+                unused.bind(("127.0.0.1", 0))
+                closed_port = unused.getsockname()[1]
+            
+            with patch('netops_mcp.tools.network.discovery_tools.TOP_100_PORTS', (open_port, closed_port)), \
+                 patch.object(self.discovery_tools, '_execute_command_async', new_callable=AsyncMock) as mock_execute:
+                result = await self.discovery_tools.nmap_scan("127.0.0.1", scan_type="quick")
+        
+        mock_execute.assert_not_called()
+        data = json.loads(result[0].text)
+        assert data["success"] == True
+        assert f"{open_port}/tcp" in data["stdout"]
+        assert f"{closed_port}/tcp" not in data["stdout"]
+        assert "Not shown: 1 closed or filtered tcp ports" in data["stdout"]
+
+    @pytest.mark.asyncio
+    async def test_nmap_scan_quick_range_target_uses_nmap(self):
+        """Test a quick scan of an nmap range target is left to nmap."""
+        with patch.object(self.discovery_tools, '_execute_command_async', new_callable=AsyncMock) as mock_execute, \
+             patch.object(self.discovery_tools, '_tcp_probe', new_callable=AsyncMock) as mock_probe:
+            mock_execute.return_value = {
+                "success": True,
+                "stdout": "Nmap done: 5 IP addresses",
+                "stderr": "",
+                "return_code": 0
+            }
+            
+            result = await self.discovery_tools.nmap_scan("10.0.0.1-5", scan_type="quick")
+        
+        mock_probe.assert_not_called()
+        assert mock_execute.call_args[0][0][-1] == "10.0.0.1-5"
+        assert "--top-ports" in mock_execute.call_args[0][0]
+        data = json.loads(result[0].text)
+        assert data["success"] == True
+
+    @pytest.mark.asyncio
+    async def test_nmap_scan_quick_unresolvable_target_fails(self):
+        """Test a quick scan of a name that does not resolve reports failure."""
+        with patch.object(self.discovery_tools, '_execute_command_async', new_callable=AsyncMock) as mock_execute, \
+             patch('socket.getaddrinfo', side_effect=socket.gaierror("Name or service not known")):
+            result = await self.discovery_tools.nmap_scan("test-host.example", scan_type="quick")
+        
+        mock_execute.assert_not_called()
+        data = json.loads(result[0].text)
+        assert data["success"] == False
+        assert "Failed to resolve test-host.example" in data["stderr"]
+
+    @pytest.mark.asyncio
+    async def test_nmap_scan_quick_probes_every_address(self):
+        """Test a quick scan of a dual-stack host connects to each of its addresses directly."""
+        infos = [
+            (socket.AF_INET6, socket.SOCK_STREAM, 6, '', ('2001:db8::1', 0, 0, 0)),
+            (socket.AF_INET, socket.SOCK_STREAM, 6, '', ('192.0.2.1', 0)),
+        ]
+        connected = []
+        
+        async def connect(loop, sock, address):
+            connected.append(address)
+            if address[0] != '192.0.2.1':
+                raise ConnectionRefusedError()
+        
+        with patch('netops_mcp.tools.network.discovery_tools.TOP_100_PORTS', (22,)), \
+             patch('socket.getaddrinfo', return_value=infos), \
+             patch('asyncio.selector_events.BaseSelectorEventLoop.sock_connect', side_effect=connect, autospec=True):
+            result = await self.discovery_tools.nmap_scan("dual.example", scan_type="quick")
+        
+        assert sorted(connected) == [('192.0.2.1', 22), ('2001:db8::1', 22, 0, 0)]
+        assert len(self.discovery_tools._addrinfo_cache) == 0
+        data = json.loads(result[0].text)
+        assert data["success"] == True
+        assert "(2001:db8::1)" in data["stdout"]
+        assert "(192.0.2.1)" in data["stdout"]
+        assert "22/tcp" in data["stdout"]
+
+    @pytest.mark.asyncio
+    async def test_nmap_scan_quick_host_down_within_timeout(self):
+        """Test a quick scan of a silent host stops at the timeout and reports failure."""
+        async def hang(loop, sock, address):
+            await asyncio.Event().wait()
+        
+        with patch('netops_mcp.tools.network.discovery_tools.QUICK_SCAN_CONNECT_TIMEOUT', 30), \
+             patch('asyncio.selector_events.BaseSelectorEventLoop.sock_connect', side_effect=hang, autospec=True):
+            start = time.monotonic()
+            result = await self.discovery_tools.nmap_scan("192.0.2.1", scan_type="quick", timeout=1)
+        
+        assert time.monotonic() - start < 5
+        data = json.loads(result[0].text)
+        assert data["success"] == False
+        assert "Host seems down" in data["stdout"]
+
+    @pytest.mark.asyncio
+    async def test_nmap_scan_quick_with_ports_uses_nmap(self):
+        """Test a quick scan of explicit ports still runs nmap."""
+        with patch.object(self.discovery_tools, '_execute_command_async', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = {
+                "success": True,
+                "stdout": "Nmap scan report for test-host",
+                "stderr": "",
+                "return_code": 0
+            }
+            
+            result = await self.discovery_tools.nmap_scan("8.8.8.8", ports="53", scan_type="quick")
+            
+            assert "--top-ports" in mock_execute.call_args[0][0]
+            assert "Nmap scan report" in result[0].text
+
+    @pytest.mark.asyncio
+    async def test_nmap_scan_cached_result(self):
+        """Test repeated nmap_scan calls replay the cached result."""
+        with patch.object(self.discovery_tools, '_execute_command_async', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = {
+                "success": True,
+                "stdout": "Nmap scan report for test-host",
+                "stderr": "",
+                "return_code": 0
+            }
+            
+            first = await self.discovery_tools.nmap_scan("google.com", ports="80")
+            second = await self.discovery_tools.nmap_scan("google.com", ports="80")
+            
+            assert mock_execute.call_count == 1
+            assert "Nmap scan report" in second[0].text
+            assert '"cached": true' in second[0].text
+            assert '"cached"' not in first[0].text
+
+    @pytest.mark.asyncio
+    async def test_nmap_scan_force_bypasses_cache(self):
+        """Test nmap_scan with force=True always runs a new scan."""
+        with patch.object(self.discovery_tools, '_execute_command_async', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = {
+                "success": True,
+                "stdout": "Nmap scan report for test-host",
+                "stderr": "",
+                "return_code": 0
+            }
+            
+            await self.discovery_tools.nmap_scan("google.com", ports="80")
+            await self.discovery_tools.nmap_scan("google.com", ports="80", force=True)
+            
+            assert mock_execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_nmap_scan_failure_not_cached(self):
+        """Test failed nmap scans are not cached."""
+        with patch.object(self.discovery_tools, '_execute_command_async', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = {
+                "success": False,
+                "stdout": "",
+                "stderr": "Failed to resolve",
+                "return_code": 1
+            }
+            
+            await self.discovery_tools.nmap_scan("google.com")
+            await self.discovery_tools.nmap_scan("google.com")
+            
+            assert mock_execute.call_count == 2
+
     @pytest.mark.parametrize("host,expected_success", [
         ("google.com", True),
         ("8.8.8.8", True),
@@ -90,9 +268,10 @@ class TestDiscoveryTools:
         ("", False),
         (None, False),
     ])
-    def test_service_discovery_valid_inputs(self, host, expected_success):
+    @pytest.mark.asyncio
+    async def test_service_discovery_valid_inputs(self, host, expected_success):
         """Test service_discovery with valid inputs."""
-        with patch.object(self.discovery_tools, '_execute_command') as mock_execute:
+        with patch.object(self.discovery_tools, '_execute_command_async', new_callable=AsyncMock) as mock_execute:
             mock_execute.return_value = {
                 "success": expected_success,
                 "stdout": "Service discovery results",
@@ -100,7 +279,7 @@ class TestDiscoveryTools:
                 "return_code": 0 if expected_success else 1
             }
             
-            result = self.discovery_tools.service_discovery(host)
+            result = await self.discovery_tools.service_discovery(host)
             
             assert len(result) > 0
             assert result[0].type == "text"
@@ -110,50 +289,71 @@ class TestDiscoveryTools:
             else:
                 assert "error" in result[0].text.lower()
 
+    @pytest.mark.asyncio
+    async def test_service_discovery_cached_result(self):
+        """Test repeated service_discovery calls replay the cached result."""
+        with patch.object(self.discovery_tools, '_execute_command_async', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = {
+                "success": True,
+                "stdout": "Service discovery results",
+                "stderr": "",
+                "return_code": 0
+            }
+            
+            await self.discovery_tools.service_discovery("google.com", ports="22")
+            result = await self.discovery_tools.service_discovery("google.com", ports="22")
+            
+            assert mock_execute.call_count == 1
+            assert "Service discovery" in result[0].text
+
     @pytest.mark.parametrize("host", [
         "",
         None,
         "invalid..host",
     ])
-    def test_service_discovery_invalid_host(self, host):
+    @pytest.mark.asyncio
+    async def test_service_discovery_invalid_host(self, host):
         """Test service_discovery with invalid hosts."""
-        result = self.discovery_tools.service_discovery(host)
+        result = await self.discovery_tools.service_discovery(host)
         
         assert len(result) > 0
         assert result[0].type == "text"
         assert "error" in result[0].text.lower()
 
-    def test_service_discovery_command_timeout(self):
+    @pytest.mark.asyncio
+    async def test_service_discovery_command_timeout(self):
         """Test service_discovery with command timeout."""
-        with patch.object(self.discovery_tools, '_execute_command') as mock_execute:
+        with patch.object(self.discovery_tools, '_execute_command_async', new_callable=AsyncMock) as mock_execute:
             mock_execute.side_effect = TimeoutError("Command timed out")
             
-            result = self.discovery_tools.service_discovery("google.com")
+            result = await self.discovery_tools.service_discovery("google.com")
             
             assert len(result) > 0
             assert result[0].type == "text"
             assert "error" in result[0].text.lower()
 
-    @pytest.mark.parametrize("valid_hosts,invalid_hosts", [
-        (["google.com", "8.8.8.8", "192.168.1.1"], 
-         ["", None, "invalid..host", "host with spaces"]),
+    @pytest.mark.parametrize("host,expected", [
+        ("google.com", True),
+        ("8.8.8.8", True),
+        ("192.168.1.1", True),
+        ("", False),
+        (None, False),
+        ("invalid..host", False),
+        ("host with spaces", False),
     ])
-    def test_validate_host(self, valid_hosts, invalid_hosts):
+    def test_validate_host(self, host, expected):
         """Test host validation."""
-        for host in valid_hosts:
-            assert self.discovery_tools._validate_host(host) == True
-        
-        for host in invalid_hosts:
-            assert self.discovery_tools._validate_host(host) == False
+        assert self.discovery_tools._validate_host(host) is expected
 
-    @pytest.mark.parametrize("valid_scan_types,invalid_scan_types", [
-        (["basic", "quick", "full"], 
-         ["", None, "invalid_type", "custom_scan"]),
+    @pytest.mark.parametrize("scan_type,expected", [
+        ("basic", True),
+        ("quick", True),
+        ("full", True),
+        ("", False),
+        (None, False),
+        ("invalid_type", False),
+        ("custom_scan", False),
     ])
-    def test_validate_scan_type(self, valid_scan_types, invalid_scan_types):
+    def test_validate_scan_type(self, scan_type, expected):
         """Test scan type validation."""
-        for scan_type in valid_scan_types:
-            assert self.discovery_tools._validate_scan_type(scan_type) == True
-        
-        for scan_type in invalid_scan_types:
-            assert self.discovery_tools._validate_scan_type(scan_type) == False
+        assert self.discovery_tools._validate_scan_type(scan_type) is expected
@@ -3,7 +3,6 @@ Comprehensive tests for DNS tools functionality.
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
 from netops_mcp.tools.network.dns_tools import DNSTools
 
 
@@ -18,7 +17,7 @@ class TestDNSTools:
         """Test DNSTools initialization."""
         assert self.dns_tools is not None
         assert hasattr(self.dns_tools, 'logger')
-        assert hasattr(self.dns_tools, '_execute_command')
+        assert hasattr(self.dns_tools, '_execute_command_async')
 
     @pytest.mark.parametrize("domain", [
         "google.com",
@@ -27,11 +26,12 @@ class TestDNSTools:
         "microsoft.com",
         "amazon.com"
     ])
-    def test_nslookup_query_valid_domains(self, domain, mock_execute_command, sample_nslookup_output):
+    @pytest.mark.asyncio
+    async def test_nslookup_query_valid_domains(self, domain, mock_execute_command_async, sample_nslookup_output):
         """Test nslookup with various valid domains."""
-        mock_execute_command.return_value = sample_nslookup_output
+        mock_execute_command_async.return_value = sample_nslookup_output
         
-        result = self.dns_tools.nslookup_query(domain)
+        result = await self.dns_tools.nslookup_query(domain)
         
         assert len(result) == 1
         assert result[0].type == "text"
@@ -39,35 +39,38 @@ class TestDNSTools:
         # Check for successful response instead of specific command name
         assert '"success": true' in result[0].text
 
-    def test_nslookup_query_with_record_type(self, mock_execute_command, sample_nslookup_output):
+    @pytest.mark.asyncio
+    async def test_nslookup_query_with_record_type(self, mock_execute_command_async, sample_nslookup_output):
         """Test nslookup with custom record type."""
-        mock_execute_command.return_value = sample_nslookup_output
+        mock_execute_command_async.return_value = sample_nslookup_output
         
-        result = self.dns_tools.nslookup_query("google.com", record_type="MX")
+        result = await self.dns_tools.nslookup_query("google.com", record_type="MX")
         
         assert len(result) == 1
         assert result[0].type == "text"
         # Verify record type was passed to command
-        mock_execute_command.assert_called_once()
-        call_args = mock_execute_command.call_args[0][0]
+        assert len(mock_execute_command_async.calls) == 1
+        call_args = mock_execute_command_async.calls[-1][0][0]
         assert "-type=MX" in " ".join(call_args)
 
-    def test_nslookup_query_with_server(self, mock_execute_command, sample_nslookup_output):
+    @pytest.mark.asyncio
+    async def test_nslookup_query_with_server(self, mock_execute_command_async, sample_nslookup_output):
         """Test nslookup with custom DNS server."""
-        mock_execute_command.return_value = sample_nslookup_output
+        mock_execute_command_async.return_value = sample_nslookup_output
         
-        result = self.dns_tools.nslookup_query("google.com", server="1.1.1.1")
+        result = await self.dns_tools.nslookup_query("google.com", server="1.1.1.1")
         
         assert len(result) == 1
         assert result[0].type == "text"
         # Verify server was passed to command
-        mock_execute_command.assert_called_once()
-        call_args = mock_execute_command.call_args[0][0]
+        assert len(mock_execute_command_async.calls) == 1
+        call_args = mock_execute_command_async.calls[-1][0][0]
         assert "1.1.1.1" in call_args
 
-    def test_nslookup_query_invalid_domain(self, mock_execute_command):
+    @pytest.mark.asyncio
+    async def test_nslookup_query_invalid_domain(self, mock_execute_command_async):
         """Test nslookup with invalid domain."""
-        mock_execute_command.return_value = {
+        mock_execute_command_async.return_value = {
             "success": False,
             "stdout": "",
             "stderr": "nslookup: invalid-domain: NXDOMAIN",
@@ -75,25 +78,27 @@ class TestDNSTools:
             "command": "nslookup -type=A invalid-domain"
         }
         
-        result = self.dns_tools.nslookup_query("invalid-domain")
+        result = await self.dns_tools.nslookup_query("invalid-domain")
         
         assert len(result) == 1
         assert result[0].type == "text"
         # Check for error response instead of specific error text
         assert '"success": false' in result[0].text
 
-    def test_nslookup_query_empty_domain(self):
+    @pytest.mark.asyncio
+    async def test_nslookup_query_empty_domain(self):
         """Test nslookup with empty domain."""
-        result = self.dns_tools.nslookup_query("")
+        result = await self.dns_tools.nslookup_query("")
         
         assert len(result) == 1
         assert result[0].type == "text"
         # Check for error response (different format for validation errors)
         assert '"error": true' in result[0].text
 
-    def test_nslookup_query_none_domain(self):
+    @pytest.mark.asyncio
+    async def test_nslookup_query_none_domain(self):
         """Test nslookup with None domain."""
-        result = self.dns_tools.nslookup_query(None)
+        result = await self.dns_tools.nslookup_query(None)
         
         assert len(result) == 1
         assert result[0].type == "text"
@@ -107,11 +112,12 @@ class TestDNSTools:
         "microsoft.com",
         "amazon.com"
     ])
-    def test_dig_query_valid_domains(self, domain, mock_execute_command, sample_dig_output):
+    @pytest.mark.asyncio
+    async def test_dig_query_valid_domains(self, domain, mock_execute_command_async, sample_dig_output):
         """Test dig with various valid domains."""
-        mock_execute_command.return_value = sample_dig_output
+        mock_execute_command_async.return_value = sample_dig_output
         
-        result = self.dns_tools.dig_query(domain)
+        result = await self.dns_tools.dig_query(domain)
         
         assert len(result) == 1
         assert result[0].type == "text"
@@ -119,35 +125,38 @@ class TestDNSTools:
         # Check for successful response instead of specific command name
         assert '"success": true' in result[0].text
 
-    def test_dig_query_with_record_type(self, mock_execute_command, sample_dig_output):
+    @pytest.mark.asyncio
+    async def test_dig_query_with_record_type(self, mock_execute_command_async, sample_dig_output):
         """Test dig with custom record type."""
-        mock_execute_command.return_value = sample_dig_output
+        mock_execute_command_async.return_value = sample_dig_output
         
-        result = self.dns_tools.dig_query("google.com", record_type="MX")
+        result = await self.dns_tools.dig_query("google.com", record_type="MX")
         
         assert len(result) == 1
         assert result[0].type == "text"
         # Verify record type was passed to command
-        mock_execute_command.assert_called_once()
-        call_args = mock_execute_command.call_args[0][0]
+        assert len(mock_execute_command_async.calls) == 1
+        call_args = mock_execute_command_async.calls[-1][0][0]
         assert "MX" in call_args
 
-    def test_dig_query_with_server(self, mock_execute_command, sample_dig_output):
+    @pytest.mark.asyncio
+    async def test_dig_query_with_server(self, mock_execute_command_async, sample_dig_output):
         """Test dig with custom DNS server."""
-        mock_execute_command.return_value = sample_dig_output
+        mock_execute_command_async.return_value = sample_dig_output
         
-        result = self.dns_tools.dig_query("google.com", server="1.1.1.1")
+        result = await self.dns_tools.dig_query("google.com", server="1.1.1.1")
         
         assert len(result) == 1
         assert result[0].type == "text"
         # Verify server was passed to command
-        mock_execute_command.assert_called_once()
-        call_args = mock_execute_command.call_args[0][0]
+        assert len(mock_execute_command_async.calls) == 1
+        call_args = mock_execute_command_async.calls[-1][0][0]
         assert "@1.1.1.1" in " ".join(call_args)
 
-    def test_dig_query_invalid_domain(self, mock_execute_command):
+    @pytest.mark.asyncio
+    async def test_dig_query_invalid_domain(self, mock_execute_command_async):
         """Test dig with invalid domain."""
-        mock_execute_command.return_value = {
+        mock_execute_command_async.return_value = {
             "success": False,
             "stdout": "",
             "stderr": "dig: invalid-domain: NXDOMAIN",
@@ -155,25 +164,27 @@ class TestDNSTools:
             "command": "dig invalid-domain A"
         }
         
-        result = self.dns_tools.dig_query("invalid-domain")
+        result = await self.dns_tools.dig_query("invalid-domain")
         
         assert len(result) == 1
         assert result[0].type == "text"
         # Check for error response instead of specific error text
         assert '"success": false' in result[0].text
 
-    def test_dig_query_empty_domain(self):
+    @pytest.mark.asyncio
+    async def test_dig_query_empty_domain(self):
         """Test dig with empty domain."""
-        result = self.dns_tools.dig_query("")
+        result = await self.dns_tools.dig_query("")
         
         assert len(result) == 1
         assert result[0].type == "text"
         # Check for error response (different format for validation errors)
         assert '"error": true' in result[0].text
 
-    def test_dig_query_none_domain(self):
+    @pytest.mark.asyncio
+    async def test_dig_query_none_domain(self):
         """Test dig with None domain."""
-        result = self.dns_tools.dig_query(None)
+        result = await self.dns_tools.dig_query(None)
         
         assert len(result) == 1
         assert result[0].type == "text"
@@ -187,11 +198,12 @@ class TestDNSTools:
         "microsoft.com",
         "amazon.com"
     ])
-    def test_host_lookup_valid_domains(self, domain, mock_execute_command, sample_nslookup_output):
+    @pytest.mark.asyncio
+    async def test_host_lookup_valid_domains(self, domain, mock_execute_command_async, sample_nslookup_output):
         """Test host lookup with various valid domains."""
-        mock_execute_command.return_value = sample_nslookup_output
+        mock_execute_command_async.return_value = sample_nslookup_output
         
-        result = self.dns_tools.host_lookup(domain)
+        result = await self.dns_tools.host_lookup(domain)
         
         assert len(result) == 1
         assert result[0].type == "text"
@@ -199,23 +211,25 @@ class TestDNSTools:
         # Check for successful response instead of specific command name
         assert '"success": true' in result[0].text
 
-    def test_host_lookup_with_record_type(self, mock_execute_command, sample_nslookup_output):
+    @pytest.mark.asyncio
+    async def test_host_lookup_with_record_type(self, mock_execute_command_async, sample_nslookup_output):
         """Test host lookup with custom record type."""
-        mock_execute_command.return_value = sample_nslookup_output
+        mock_execute_command_async.return_value = sample_nslookup_output
         
-        result = self.dns_tools.host_lookup("google.com", record_type="MX")
+        result = await self.dns_tools.host_lookup("google.com", record_type="MX")
         
         assert len(result) == 1
         assert result[0].type == "text"
         # Verify record type was passed to command
-        mock_execute_command.assert_called_once()
-        call_args = mock_execute_command.call_args[0][0]
+        assert len(mock_execute_command_async.calls) == 1
+        call_args = mock_execute_command_async.calls[-1][0][0]
         assert "-t" in call_args
         assert "MX" in call_args
 
-    def test_host_lookup_invalid_domain(self, mock_execute_command):
+    @pytest.mark.asyncio
+    async def test_host_lookup_invalid_domain(self, mock_execute_command_async):
         """Test host lookup with invalid domain."""
-        mock_execute_command.return_value = {
+        mock_execute_command_async.return_value = {
             "success": False,
             "stdout": "",
             "stderr": "host: invalid-domain: not found",
@@ -223,25 +237,27 @@ class TestDNSTools:
             "command": "host -t A invalid-domain"
         }
         
-        result = self.dns_tools.host_lookup("invalid-domain")
+        result = await self.dns_tools.host_lookup("invalid-domain")
         
         assert len(result) == 1
         assert result[0].type == "text"
         # Check for error response instead of specific error text
         assert '"success": false' in result[0].text
 
-    def test_host_lookup_empty_domain(self):
+    @pytest.mark.asyncio
+    async def test_host_lookup_empty_domain(self):
         """Test host lookup with empty domain."""
-        result = self.dns_tools.host_lookup("")
+        result = await self.dns_tools.host_lookup("")
         
         assert len(result) == 1
         assert result[0].type == "text"
         # Check for error response (different format for validation errors)
         assert '"error": true' in result[0].text
 
-    def test_host_lookup_none_domain(self):
+    @pytest.mark.asyncio
+    async def test_host_lookup_none_domain(self):
         """Test host lookup with None domain."""
-        result = self.dns_tools.host_lookup(None)
+        result = await self.dns_tools.host_lookup(None)
         
         assert len(result) == 1
         assert result[0].type == "text"
@@ -249,48 +265,52 @@ class TestDNSTools:
         assert '"error": true' in result[0].text
 
     @pytest.mark.parametrize("record_type", ["A", "AAAA", "MX", "NS", "TXT", "CNAME"])
-    def test_valid_record_types(self, record_type, mock_execute_command, sample_nslookup_output):
+    @pytest.mark.asyncio
+    async def test_valid_record_types(self, record_type, mock_execute_command_async, sample_nslookup_output):
         """Test DNS queries with various record types."""
-        mock_execute_command.return_value = sample_nslookup_output
+        mock_execute_command_async.return_value = sample_nslookup_output
         
-        result = self.dns_tools.nslookup_query("google.com", record_type=record_type)
+        result = await self.dns_tools.nslookup_query("google.com", record_type=record_type)
         
         assert len(result) == 1
         assert result[0].type == "text"
         # Verify record type was passed to command
-        mock_execute_command.assert_called_once()
-        call_args = mock_execute_command.call_args[0][0]
+        assert len(mock_execute_command_async.calls) == 1
+        call_args = mock_execute_command_async.calls[-1][0][0]
         assert record_type in " ".join(call_args)
 
-    def test_invalid_record_type(self, mock_execute_command, sample_nslookup_output):
+    @pytest.mark.asyncio
+    async def test_invalid_record_type(self, mock_execute_command_async, sample_nslookup_output):
         """Test DNS query with invalid record type."""
-        mock_execute_command.return_value = sample_nslookup_output
+        mock_execute_command_async.return_value = sample_nslookup_output
         
-        result = self.dns_tools.nslookup_query("google.com", record_type="INVALID")
+        result = await self.dns_tools.nslookup_query("google.com", record_type="INVALID")
         
         assert len(result) == 1
         assert result[0].type == "text"
         assert "error" in result[0].text.lower()
 
     @pytest.mark.parametrize("server", ["8.8.8.8", "1.1.1.1", "9.9.9.9", "208.67.222.222"])
-    def test_valid_dns_servers(self, server, mock_execute_command, sample_nslookup_output):
+    @pytest.mark.asyncio
+    async def test_valid_dns_servers(self, server, mock_execute_command_async, sample_nslookup_output):
         """Test DNS queries with various DNS servers."""
-        mock_execute_command.return_value = sample_nslookup_output
+        mock_execute_command_async.return_value = sample_nslookup_output
         
-        result = self.dns_tools.nslookup_query("google.com", server=server)
+        result = await self.dns_tools.nslookup_query("google.com", server=server)
         
         assert len(result) == 1
         assert result[0].type == "text"
         # Verify server was passed to command
-        mock_execute_command.assert_called_once()
-        call_args = mock_execute_command.call_args[0][0]
+        assert len(mock_execute_command_async.calls) == 1
+        call_args = mock_execute_command_async.calls[-1][0][0]
         assert server in call_args
 
-    def test_invalid_dns_server(self, mock_execute_command, sample_nslookup_output):
+    @pytest.mark.asyncio
+    async def test_invalid_dns_server(self, mock_execute_command_async, sample_nslookup_output):
         """Test DNS query with invalid DNS server."""
-        mock_execute_command.return_value = sample_nslookup_output
+        mock_execute_command_async.return_value = sample_nslookup_output
         
-        result = self.dns_tools.nslookup_query("google.com", server="invalid-server")
+        result = await self.dns_tools.nslookup_query("google.com", server="invalid-server")
         
         assert len(result) == 1
         assert result[0].type == "text"
@@ -354,19 +374,21 @@ class TestDNSTools:
         assert "error" in result[0].text.lower()
         assert "nslookup" in result[0].text
 
-    def test_command_execution_error_handling(self, mock_execute_command):
+    @pytest.mark.asyncio
+    async def test_command_execution_error_handling(self, mock_execute_command_async):
         """Test error handling when command execution fails."""
-        mock_execute_command.side_effect = Exception("Command execution failed")
+        mock_execute_command_async.side_effect = Exception("Command execution failed")
         
-        result = self.dns_tools.nslookup_query("google.com")
+        result = await self.dns_tools.nslookup_query("google.com")
         
         assert len(result) == 1
         assert result[0].type == "text"
         assert "error" in result[0].text.lower()
 
-    def test_timeout_handling(self, mock_execute_command):
+    @pytest.mark.asyncio
+    async def test_timeout_handling(self, mock_execute_command_async):
         """Test timeout handling in DNS tools."""
-        mock_execute_command.return_value = {
+        mock_execute_command_async.return_value = {
             "success": False,
             "stdout": "",
             "stderr": "Operation timed out",
@@ -375,7 +397,7 @@ class TestDNSTools:
         }
         
         # This test is simplified since timeout parameter is not supported
-        result = self.dns_tools.nslookup_query("google.com")
+        result = await self.dns_tools.nslookup_query("google.com")
         
         assert len(result) == 1
         assert result[0].type == "text"
@@ -393,11 +415,12 @@ class TestDNSTools:
         method = getattr(self.dns_tools, method_name)
         assert callable(method)
 
-    def test_format_response_structure(self, mock_execute_command, sample_nslookup_output):
+    @pytest.mark.asyncio
+    async def test_format_response_structure(self, mock_execute_command_async, sample_nslookup_output):
         """Test that format_response returns correct structure."""
-        mock_execute_command.return_value = sample_nslookup_output
+        mock_execute_command_async.return_value = sample_nslookup_output
         
-        result = self.dns_tools.nslookup_query("google.com")
+        result = await self.dns_tools.nslookup_query("google.com")
         
         assert len(result) == 1
         assert hasattr(result[0], 'type')
@@ -405,15 +428,16 @@ class TestDNSTools:
         assert result[0].type == "text"
         assert isinstance(result[0].text, str)
 
-    def test_dns_tools_comparison(self, mock_execute_command, sample_nslookup_output, sample_dig_output):
+    @pytest.mark.asyncio
+    async def test_dns_tools_comparison(self, mock_execute_command_async, sample_nslookup_output, sample_dig_output):
         """Test that different DNS tools return similar results."""
         # Test nslookup
-        mock_execute_command.return_value = sample_nslookup_output
-        nslookup_result = self.dns_tools.nslookup_query("google.com")
+        mock_execute_command_async.return_value = sample_nslookup_output
+        nslookup_result = await self.dns_tools.nslookup_query("google.com")
         
         # Test dig
-        mock_execute_command.return_value = sample_dig_output
-        dig_result = self.dns_tools.dig_query("google.com")
+        mock_execute_command_async.return_value = sample_dig_output
+        dig_result = await self.dns_tools.dig_query("google.com")
         
         # Both should return valid results
         assert len(nslookup_result) == 1
@@ -3,9 +3,14 @@ Comprehensive tests for HTTP tools functionality.
 """
 
 import pytest
+import asyncio
 import json
+import threading
+import socket
+import time
+import httpx
 from unittest.mock import patch, MagicMock
-from netops_mcp.tools.network.http_tools import HTTPTools
+from netops_mcp.tools.network.http_tools import HTTPTools, CURL_HEADER_ALLOWANCE, CURL_STATS_SEPARATOR
 
 
 class TestHTTPTools:
@@ -14,6 +19,15 @@ class TestHTTPTools:
     def setup_method(self):
         """Set up test fixtures."""
         self.http_tools = HTTPTools()
+        # Keep curl's --resolve lookup offline; tests that check it patch it again
+        self.getaddrinfo_patcher = patch(
+            'netops_mcp.tools.network.http_tools.socket.getaddrinfo', side_effect=socket.gaierror
+        )
+        self.getaddrinfo_patcher.start()
+
+    def teardown_method(self):
+        """Undo the resolver patch."""
+        self.getaddrinfo_patcher.stop()
 
     def test_initialization(self):
         """Test HTTPTools initialization."""
@@ -48,8 +62,8 @@ class TestHTTPTools:
         assert len(result) == 1
         assert result[0].type == "text"
         # Verify headers were passed to command
-        mock_execute_command.assert_called_once()
-        call_args = mock_execute_command.call_args[0][0]
+        assert len(mock_execute_command.calls) == 1
+        call_args = mock_execute_command.calls[-1][0][0]
         assert "-H" in call_args
         assert "User-Agent: TestBot" in " ".join(call_args)
 
@@ -63,8 +77,8 @@ class TestHTTPTools:
         assert len(result) == 1
         assert result[0].type == "text"
         # Verify data was passed to command
-        mock_execute_command.assert_called_once()
-        call_args = mock_execute_command.call_args[0][0]
+        assert len(mock_execute_command.calls) == 1
+        call_args = mock_execute_command.calls[-1][0][0]
         assert "-d" in call_args
 
     def test_curl_request_with_timeout(self, mock_execute_command, sample_curl_output):
@@ -76,8 +90,8 @@ class TestHTTPTools:
         assert len(result) == 1
         assert result[0].type == "text"
         # Verify timeout was passed to command
-        mock_execute_command.assert_called_once()
-        call_args = mock_execute_command.call_args[0][0]
+        assert len(mock_execute_command.calls) == 1
+        call_args = mock_execute_command.calls[-1][0][0]
         assert "--max-time" in call_args
         assert "30" in call_args
 
@@ -140,10 +154,102 @@ class TestHTTPTools:
         assert len(result) == 1
         assert result[0].type == "text"
         # Verify method was passed to command
-        mock_execute_command.assert_called_once()
-        call_args = mock_execute_command.call_args[0][0]
+        assert len(mock_execute_command.calls) == 1
+        call_args = mock_execute_command.calls[-1][0][0]
         assert f"-X {method}" in " ".join(call_args)
 
+    def test_curl_request_splits_body_and_stats(self, mock_execute_command, sample_curl_output):
+        """Test curl response body is read from stdout and stats from stderr, without a temp file."""
+        mock_execute_command.return_value = dict(
+            sample_curl_output,
+            stdout='{"hello": "world"}',
+            stderr=CURL_STATS_SEPARATOR + sample_curl_output["stdout"]
+        )
+        
+        result = self.http_tools.curl_request("https://example.com")
+        
+        data = json.loads(result[0].text)
+        assert data["response_body"] == '{"hello": "world"}'
+        assert data["stats"]["http_code"] == "200"
+        call_args = mock_execute_command.calls[-1][0][0]
+        assert "-o" not in call_args
+
+    def test_curl_request_truncates_large_body(self, mock_execute_command, sample_curl_output):
+        """Test response bodies longer than max_body are truncated and flagged."""
+        mock_execute_command.return_value = dict(
+            sample_curl_output,
+            stdout="x" * 100,
+            stderr=CURL_STATS_SEPARATOR + sample_curl_output["stdout"]
+        )
+        
+        truncated = json.loads(self.http_tools.curl_request("https://example.com", max_body=10)[0].text)
+        full = json.loads(self.http_tools.curl_request("https://example.com")[0].text)
+        
+        assert truncated["response_body"] == "x" * 10
+        assert truncated["truncated"] == True
+        assert full["response_body"] == "x" * 100
+        assert full["truncated"] == False
+
+    def test_curl_request_caps_curl_output(self, mock_execute_command, sample_curl_output):
+        """Test curl output is capped while it is read and a cut-short body is not cached."""
+        mock_execute_command.return_value = dict(
+            sample_curl_output,
+            stdout='HTTP/1.1 200 OK\nETag: "v1"\n\n' + "x" * 10,
+            stderr=CURL_STATS_SEPARATOR + sample_curl_output["stdout"],
+            stdout_truncated=True
+        )
+        
+        result = json.loads(self.http_tools.curl_request("https://example.com", max_body=10)[0].text)
+        
+        assert mock_execute_command.calls[-1][1]["max_stdout"] == CURL_HEADER_ALLOWANCE + 10
+        assert result["response_body"] == "x" * 10
+        assert result["truncated"] == True
+        assert result["stats"]["http_code"] == "200"
+        assert len(self.http_tools._response_cache) == 0
+
+    def test_curl_request_revalidates_with_etag(self, mock_execute_command, sample_curl_output):
+        """Test a cached ETag is sent back and a 304 returns the cached body."""
+        mock_execute_command.side_effect = [
+            dict(sample_curl_output, stdout='HTTP/1.1 200 OK\nETag: "v1"\n\n{"hello": "world"}',
+                 stderr=CURL_STATS_SEPARATOR + sample_curl_output["stdout"]),
+            dict(sample_curl_output, stdout='HTTP/1.1 304 Not Modified\nETag: "v1"\n\n',
+                 stderr=CURL_STATS_SEPARATOR + sample_curl_output["stdout"])
+        ]
+        
+        first = json.loads(self.http_tools.curl_request("https://example.com")[0].text)
+        second = json.loads(self.http_tools.curl_request("https://example.com")[0].text)
+        
+        assert first["from_cache"] == False
+        assert first["response_headers"]["etag"] == '"v1"'
+        assert second["from_cache"] == True
+        assert second["response_body"] == '{"hello": "world"}'
+        call_args = mock_execute_command.calls[1][0][0]
+        assert 'If-None-Match: "v1"' in call_args
+
+    def test_curl_request_post_not_revalidated(self, mock_execute_command, sample_curl_output):
+        """Test requests with a body are never sent as conditional requests."""
+        mock_execute_command.return_value = dict(
+            sample_curl_output,
+            stdout='HTTP/1.1 200 OK\nETag: "v1"\n\nok',
+            stderr=CURL_STATS_SEPARATOR + sample_curl_output["stdout"]
+        )
+        
+        self.http_tools.curl_request("https://example.com", method="POST", data="a=1")
+        self.http_tools.curl_request("https://example.com", method="POST", data="a=1")
+        
+        call_args = mock_execute_command.calls[1][0][0]
+        assert "If-None-Match" not in " ".join(call_args)
+
+    def test_split_response_headers_skips_interim_response(self):
+        """Test 100 Continue blocks are skipped when splitting headers."""
+        output = "HTTP/1.1 100 Continue\r\n\r\nHTTP/1.1 201 Created\r\nLast-Modified: today\r\n\r\nbody"
+        
+        status_code, headers, body = self.http_tools._split_response_headers(output)
+        
+        assert status_code == 201
+        assert headers == {"last-modified": "today"}
+        assert body == "body"
+
     def test_httpie_request_valid_url(self, mock_execute_command, sample_curl_output):
         """Test httpie request with valid URL."""
         mock_execute_command.return_value = sample_curl_output
@@ -164,8 +270,8 @@ class TestHTTPTools:
         assert len(result) == 1
         assert result[0].type == "text"
         # Verify headers were passed to command
-        mock_execute_command.assert_called_once()
-        call_args = mock_execute_command.call_args[0][0]
+        assert len(mock_execute_command.calls) == 1
+        call_args = mock_execute_command.calls[-1][0][0]
         assert "User-Agent:TestBot" in " ".join(call_args)
 
     def test_httpie_request_with_data(self, mock_execute_command, sample_curl_output):
@@ -178,8 +284,8 @@ class TestHTTPTools:
         assert len(result) == 1
         assert result[0].type == "text"
         # Verify data was passed to command
-        mock_execute_command.assert_called_once()
-        call_args = mock_execute_command.call_args[0][0]
+        assert len(mock_execute_command.calls) == 1
+        call_args = mock_execute_command.calls[-1][0][0]
         assert "key=value" in " ".join(call_args)
 
     def test_httpie_request_invalid_url(self, mock_execute_command):
@@ -218,6 +324,54 @@ class TestHTTPTools:
         assert result[0].type == "text"
         assert "expected" in result[0].text.lower()
 
+    def test_api_test_parses_status_from_stderr(self, mock_execute_command, sample_curl_output):
+        """Test API test reads the body from stdout and the status code from stderr."""
+        mock_execute_command.return_value = dict(
+            sample_curl_output,
+            stdout="not found",
+            stderr=CURL_STATS_SEPARATOR + "404"
+        )
+        
+        result = self.http_tools.api_test("https://httpbin.org/status/404", expected_status=404)
+        
+        data = json.loads(result[0].text)
+        assert data["actual_status"] == 404
+        assert data["response_body"] == "not found"
+        assert data["test_passed"] == True
+
+    def test_api_test_truncates_large_body(self, mock_execute_command, sample_curl_output):
+        """Test api_test caps the returned body at max_body characters."""
+        mock_execute_command.return_value = dict(
+            sample_curl_output,
+            stdout="y" * 50,
+            stderr=CURL_STATS_SEPARATOR + "200"
+        )
+        
+        result = json.loads(self.http_tools.api_test("https://example.com", max_body=5)[0].text)
+        
+        assert result["response_body"] == "yyyyy"
+        assert result["truncated"] == True
+        assert result["test_passed"] == True
+
+    def test_api_test_revalidates_with_last_modified(self, mock_execute_command, sample_curl_output):
+        """Test a 304 on revalidation reports the cached status and body."""
+        mock_execute_command.side_effect = [
+            dict(sample_curl_output, stdout="HTTP/1.1 200 OK\nLast-Modified: today\n\nok",
+                 stderr=CURL_STATS_SEPARATOR + "200"),
+            dict(sample_curl_output, stdout="HTTP/1.1 304 Not Modified\n\n",
+                 stderr=CURL_STATS_SEPARATOR + "304")
+        ]
+        
+        self.http_tools.api_test("https://example.com")
+        result = json.loads(self.http_tools.api_test("https://example.com")[0].text)
+        
+        assert result["actual_status"] == 200
+        assert result["test_passed"] == True
+        assert result["from_cache"] == True
+        assert result["response_body"] == "ok"
+        call_args = mock_execute_command.calls[1][0][0]
+        assert "If-Modified-Since: today" in call_args
+
     def test_api_test_with_headers(self, mock_execute_command, sample_curl_output):
         """Test API test with custom headers."""
         mock_execute_command.return_value = sample_curl_output
@@ -228,11 +382,214 @@ class TestHTTPTools:
         assert len(result) == 1
         assert result[0].type == "text"
         # Verify headers were passed to command
-        mock_execute_command.assert_called_once()
-        call_args = mock_execute_command.call_args[0][0]
+        assert len(mock_execute_command.calls) == 1
+        call_args = mock_execute_command.calls[-1][0][0]
         assert "-H" in call_args
         assert "Authorization: Bearer token123" in " ".join(call_args)
 
+    @pytest.mark.asyncio
+    async def test_bulk_request(self):
+        """Test concurrent requests share one client and report per-URL results."""
+        def handler(request):
+            if request.url.path == "/missing":
+                return httpx.Response(404, text="not found")
+            return httpx.Response(200, json={"ok": True})
+        
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        urls = ["https://example.com/", "https://example.com/missing", "invalid-url"]
+        
+        with patch.object(self.http_tools, '_http_client', return_value=client) as mock_client:
+            result = await self.http_tools.bulk_request(urls)
+        
+        mock_client.assert_called_once()
+        data = json.loads(result[0].text)
+        assert data["total"] == 3
+        assert data["succeeded"] == 2
+        assert [r["url"] for r in data["results"]] == urls
+        assert data["results"][0]["status_code"] == 200
+        assert data["results"][1]["status_code"] == 404
+        assert data["results"][2]["error"] == "Invalid URL provided"
+
+    @pytest.mark.asyncio
+    async def test_bulk_request_connection_error(self):
+        """Test transport errors are reported per URL."""
+        def handler(request):
+            raise httpx.ConnectError("Connection refused", request=request)
+        
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        
+        with patch.object(self.http_tools, '_http_client', return_value=client):
+            result = await self.http_tools.bulk_request(["https://example.com"])
+        
+        data = json.loads(result[0].text)
+        assert data["succeeded"] == 0
+        assert "Connection refused" in data["results"][0]["error"]
+
+    @pytest.mark.asyncio
+    async def test_http_client_is_reused(self):
+        """Test the in-process HTTP client persists across calls until closed."""
+        client = await self.http_tools._http_client()
+        
+        assert await self.http_tools._http_client() is client
+        
+        await self.http_tools.close()
+        assert client.is_closed
+        assert await self.http_tools._http_client() is not client
+        await self.http_tools.close()
+
+    @pytest.mark.asyncio
+    async def test_http_client_from_other_loop_is_closed(self):
+        """Test a client left behind by another event loop is closed when replaced."""
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            stale = asyncio.run_coroutine_threadsafe(self.http_tools._http_client(), other_loop).result(5)
+            
+            client = await self.http_tools._http_client()
+            
+            assert client is not stale
+            assert stale.is_closed
+            await self.http_tools.close()
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join(5)
+            other_loop.close()
+
+    @pytest.mark.asyncio
+    async def test_bulk_request_invalid_input(self):
+        """Test bulk request rejects empty URL lists and bad methods."""
+        result = await self.http_tools.bulk_request([])
+        assert "error" in result[0].text.lower()
+        
+        result = await self.http_tools.bulk_request(["https://example.com"], method="INVALID")
+        assert "error" in result[0].text.lower()
+
+    def test_api_test_bulk(self, mock_execute_command):
+        """Test bulk API tests run in one curl process and match results by urlnum."""
+        mock_execute_command.return_value = {
+            "success": True,
+            "stdout": "\n".join([
+                json.dumps({"urlnum": 1, "http_code": 500, "time_total": 0.2, "exitcode": 0}),
+                json.dumps({"urlnum": 0, "http_code": 200, "time_total": 0.1, "exitcode": 0})
+            ]),
+            "stderr": "",
+            "return_code": 0
+        }
+        cases = [
+            {"url": "https://example.com/ok", "headers": {"Authorization": "Bearer token123"}},
+            {"url": "https://example.com/broken", "method": "post", "expected_status": 201},
+            {"url": "invalid-url"}
+        ]
+        
+        result = json.loads(self.http_tools.api_test_bulk(cases)[0].text)
+        
+        assert len(mock_execute_command.calls) == 1
+        command = mock_execute_command.calls[-1][0][0]
+        config = mock_execute_command.calls[-1][1]["input_data"]
+        assert command[:3] == ['curl', '-sS', '-Z']
+        assert 'header = "Authorization: Bearer token123"' in config
+        assert 'request = "POST"' in config
+        assert config.count("next") == 1
+        assert result["total"] == 3
+        assert result["passed"] == 1
+        assert result["results"][0]["actual_status"] == 200
+        assert result["results"][1]["actual_status"] == 500
+        assert result["results"][1]["test_passed"] == False
+        assert "Invalid URL" in result["results"][2]["error"]
+
+    def test_api_test_bulk_falls_back_without_parallel_support(self, mock_execute_command):
+        """Test each case runs through api_test when curl rejects --parallel."""
+        mock_execute_command.side_effect = [
+            {"success": False, "stdout": "", "stderr": "curl: option -Z: is unknown", "return_code": 2},
+            {"success": True, "stdout": "ok", "stderr": CURL_STATS_SEPARATOR + "200", "return_code": 0}
+        ]
+        
+        result = json.loads(self.http_tools.api_test_bulk([{"url": "https://example.com"}])[0].text)
+        
+        assert len(mock_execute_command.calls) == 2
+        assert result["passed"] == 1
+        assert result["results"][0]["actual_status"] == 200
+
+    def test_format_curl_config_rejects_line_breaks(self):
+        """Test header values cannot inject extra curl config lines."""
+        with pytest.raises(ValueError):
+            self.http_tools._format_curl_config([
+                {"url": "https://example.com", "method": "GET", "headers": {"X-Test": "a\noutput = /etc/passwd"}}
+            ])
+
+    def test_curl_command_pins_resolved_address(self):
+        """Test host names are resolved once and passed to curl with --resolve."""
+        infos = [
+            (2, 1, 6, '', ('93.184.216.34', 443)),
+            (10, 1, 6, '', ('2606:2800:220:1::1', 443, 0, 0))
+        ]
+        with patch('netops_mcp.tools.network.http_tools.socket.getaddrinfo', return_value=infos) as mock_resolve:
+            first = self.http_tools._format_curl_command("https://example.com/api")
+            second = self.http_tools._format_curl_command("https://example.com/other")
+        
+        mock_resolve.assert_called_once()
+        assert first[first.index('--resolve') + 1] == "example.com:443:93.184.216.34,[2606:2800:220:1::1]"
+        assert '--resolve' in second
+
+    def test_curl_command_skips_resolve_for_ip_and_failures(self):
+        """Test IP literals and unresolvable hosts are passed to curl unchanged."""
+        with patch('netops_mcp.tools.network.http_tools.socket.getaddrinfo', side_effect=OSError) as mock_resolve:
+            assert '--resolve' not in self.http_tools._format_curl_command("http://10.0.0.1:8080/")
+            assert '--resolve' not in self.http_tools._format_curl_command("https://unknown.example")
+        
+        mock_resolve.assert_called_once()
+
+    def test_curl_command_remembers_failed_resolution(self):
+        """Test a failed lookup is not repeated while it is cached."""
+        with patch('netops_mcp.tools.network.http_tools.socket.getaddrinfo', side_effect=OSError) as mock_resolve:
+            self.http_tools._format_curl_command("https://unknown.example/a")
+            self.http_tools._format_curl_command("https://unknown.example/b")
+        
+        mock_resolve.assert_called_once()
+
+    def test_curl_command_lookup_bounded_by_timeout(self):
+        """Test a slow resolver is abandoned and its time is taken off curl's --max-time."""
+        def slow_lookup(*args, **kwargs):
+            time.sleep(5)
+        
+        with patch('netops_mcp.tools.network.http_tools.socket.getaddrinfo', side_effect=slow_lookup):
+            start = time.monotonic()
+            command = self.http_tools._format_curl_command("https://slow.example", timeout=1)
+        
+        assert time.monotonic() - start < 2
+        assert '--resolve' not in command
+        assert command[command.index('--max-time') + 1] == "1"
+
+    def test_curl_request_reports_pinned_dns(self, mock_execute_command, sample_curl_output):
+        """Test curl_request says when DNS was resolved before curl ran."""
+        mock_execute_command.return_value = dict(
+            sample_curl_output, stdout="ok", stderr=CURL_STATS_SEPARATOR + sample_curl_output["stdout"]
+        )
+        infos = [(2, 1, 6, '', ('93.184.216.34', 443))]
+        
+        with patch('netops_mcp.tools.network.http_tools.socket.getaddrinfo', return_value=infos):
+            pinned = json.loads(self.http_tools.curl_request("https://example.com")[0].text)
+        unpinned = json.loads(self.http_tools.curl_request("https://10.0.0.1")[0].text)
+        
+        assert pinned["dns_pinned"] == True
+        assert unpinned["dns_pinned"] == False
+
+    def test_curl_request_drops_pinned_address_on_connect_failure(self, mock_execute_command):
+        """Test a failed connection forces the host to be resolved again."""
+        mock_execute_command.return_value = {
+            "success": False,
+            "stdout": "",
+            "stderr": "curl: (7) Failed to connect",
+            "return_code": 7
+        }
+        infos = [(2, 1, 6, '', ('93.184.216.34', 443))]
+        with patch('netops_mcp.tools.network.http_tools.socket.getaddrinfo', return_value=infos) as mock_resolve:
+            self.http_tools.curl_request("https://example.com")
+            self.http_tools.curl_request("https://example.com")
+        
+        assert mock_resolve.call_count == 2
+
     def test_validate_url(self):
         """Test URL validation."""
         # Valid URLs
@@ -319,6 +676,20 @@ class TestHTTPTools:
         assert parsed["time_total"] == "0.123"
         assert parsed["size_download"] == "1234"
 
+    def test_parse_curl_output_json_write_out(self):
+        """Test curl '%{json}' output keeps native types and only surfaced fields."""
+        curl_output = json.dumps({
+            "http_code": 200,
+            "time_total": 0.123,
+            "size_download": 1234,
+            "url_effective": "https://example.com/",
+            "num_headers": 9
+        })
+        
+        parsed = self.http_tools._parse_curl_output(curl_output)
+        
+        assert parsed == {"http_code": 200, "time_total": 0.123, "size_download": 1234}
+
     def test_parse_curl_output_invalid_json(self):
         """Test curl output parsing with invalid JSON."""
         curl_output = "Invalid JSON output"
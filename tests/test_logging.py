@@ -3,7 +3,6 @@ Tests for logging module.
 """
 
 import pytest
-import tempfile
 import os
 import logging
 from unittest.mock import patch, mock_open
@@ -14,17 +13,12 @@ from netops_mcp.config.models import LoggingConfig
 class TestLoggingSetup:
     """Test logging setup functionality."""
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _log_paths(self, tmp_path):
         """Set up test fixtures."""
-        self.temp_log_dir = tempfile.mkdtemp()
+        self.temp_log_dir = str(tmp_path)
         self.temp_log_file = os.path.join(self.temp_log_dir, "test.log")
 
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        if os.path.exists(self.temp_log_dir):
-            import shutil
-            shutil.rmtree(self.temp_log_dir)
-
     def test_setup_logging_with_default_config(self):
         """Test logging setup with default configuration."""
         config = LoggingConfig()
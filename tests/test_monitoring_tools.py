@@ -2,9 +2,18 @@
 Tests for MonitoringTools.
 """
 
+import json
 import pytest
+import threading
+import time
+from collections import namedtuple
 from unittest.mock import patch, MagicMock
 from netops_mcp.tools.system.monitoring_tools import MonitoringTools
+from netops_mcp.utils.metrics_cache import MetricsCache, Snapshot
+
+# Same layout as psutil.net_io_counters() entries
+SNETIO = namedtuple('snetio', ['bytes_sent', 'bytes_recv', 'packets_sent', 'packets_recv',
+                               'errin', 'errout', 'dropin', 'dropout'])
 
 
 class TestMonitoringTools:
@@ -24,7 +33,7 @@ class TestMonitoringTools:
     @patch('psutil.cpu_freq')
     def test_cpu_usage_valid_inputs(self, mock_cpu_freq, mock_cpu_count, mock_cpu_percent):
         """Test cpu_usage with valid inputs."""
-        mock_cpu_percent.return_value = 25.5
+        mock_cpu_percent.return_value = [25.5, 25.5]
         mock_cpu_count.return_value = 8
         mock_cpu_freq.return_value = MagicMock(current=2400.0, min=800.0, max=3200.0)
         
@@ -35,6 +44,16 @@ class TestMonitoringTools:
         # Check for CPU data in JSON response
         assert "overall_percent" in result[0].text or "percent" in result[0].text
 
+    @patch('psutil.cpu_percent')
+    def test_cpu_usage_single_sample(self, mock_cpu_percent):
+        """Test cpu_usage derives overall usage from one per-CPU sample."""
+        mock_cpu_percent.return_value = [10.0, 30.0]
+        
+        result = self.monitoring_tools.cpu_usage()
+        
+        mock_cpu_percent.assert_called_once_with(interval=None, percpu=True)
+        assert '"overall_percent": 20.0' in result[0].text
+
     @patch('psutil.cpu_percent')
     def test_cpu_usage_exception_handling(self, mock_cpu_percent):
         """Test cpu_usage with exception handling."""
@@ -62,6 +81,16 @@ class TestMonitoringTools:
         # Check for memory data in JSON response
         assert "virtual_memory" in result[0].text or "total" in result[0].text
 
+    @patch('psutil.swap_memory')
+    @patch('psutil.virtual_memory')
+    def test_memory_usage_reuses_recent_reading(self, mock_virtual_memory, mock_swap_memory):
+        """Test repeated calls within the TTL share one psutil reading."""
+        self.monitoring_tools.memory_usage()
+        self.monitoring_tools.memory_usage()
+        
+        mock_virtual_memory.assert_called_once()
+        mock_swap_memory.assert_called_once()
+
     @patch('psutil.virtual_memory')
     def test_memory_usage_exception_handling(self, mock_virtual_memory):
         """Test memory_usage with exception handling."""
@@ -90,6 +119,89 @@ class TestMonitoringTools:
         # Check for disk data in JSON response
         assert "mountpoint" in result[0].text or "total" in result[0].text
 
+    @patch('netops_mcp.tools.system.monitoring_tools.DISK_USAGE_TIMEOUT', 0.2)
+    @patch('psutil.disk_partitions')
+    @patch('psutil.disk_usage')
+    def test_disk_usage_skips_slow_mounts(self, mock_disk_usage, mock_disk_partitions):
+        """Test mounts that do not answer in time are skipped."""
+        mock_disk_partitions.return_value = [
+            MagicMock(device="/dev/sda1", mountpoint="/", fstype="ext4"),
+            MagicMock(device="nfs:/share", mountpoint="/mnt/share", fstype="nfs")
+        ]
+        
+        def usage(mountpoint):
+            if mountpoint == "/mnt/share":
+                time.sleep(1)
+            return MagicMock(total=100, used=25, free=75, percent=25.0)
+        mock_disk_usage.side_effect = usage
+        
+        start = time.monotonic()
+        result = self.monitoring_tools.disk_usage(local_only=False)
+        
+        assert time.monotonic() - start < 1
+        assert "/dev/sda1" in result[0].text
+        assert "nfs:/share" not in result[0].text
+
+    @patch('netops_mcp.tools.system.monitoring_tools.DISK_USAGE_TIMEOUT', 0.2)
+    @patch('psutil.disk_partitions')
+    @patch('psutil.disk_usage')
+    def test_disk_usage_skips_hung_mounts_until_they_answer(self, mock_disk_usage, mock_disk_partitions):
+        """Test a hung mount is not read again while its earlier read is outstanding."""
+        mock_disk_partitions.return_value = [
+            MagicMock(device="nfs:/share", mountpoint="/mnt/share", fstype="nfs")
+        ]
+        released = threading.Event()
+        reads = []
+        
+        def usage(mountpoint):
+            reads.append(threading.current_thread())
+            released.wait(5)
+            return MagicMock(total=100, used=25, free=75, percent=25.0)
+        mock_disk_usage.side_effect = usage
+        
+        self.monitoring_tools.disk_usage(local_only=False)
+        self.monitoring_tools.disk_usage(local_only=False)
+        
+        assert len(reads) == 1
+        assert reads[0].daemon
+        
+        released.set()
+        reads[0].join(5)
+        self.monitoring_tools._psutil_cache.clear()
+        result = self.monitoring_tools.disk_usage(local_only=False)
+        
+        assert len(reads) == 2
+        assert "nfs:/share" in result[0].text
+
+    @patch('psutil.disk_partitions')
+    @patch('psutil.disk_usage')
+    def test_disk_usage_local_only(self, mock_disk_usage, mock_disk_partitions):
+        """Test network filesystems are only queried when local_only is off."""
+        mock_disk_partitions.return_value = [
+            MagicMock(device="/dev/sda1", mountpoint="/", fstype="ext4"),
+            MagicMock(device="nfs:/share", mountpoint="/mnt/share", fstype="nfs")
+        ]
+        mock_disk_usage.return_value = MagicMock(total=100, used=25, free=75, percent=25.0)
+        
+        data = json.loads(self.monitoring_tools.disk_usage()[0].text)
+        assert list(data) == ["/dev/sda1"]
+        mock_disk_usage.assert_called_once_with("/")
+        
+        self.monitoring_tools._psutil_cache.clear()
+        data = json.loads(self.monitoring_tools.disk_usage(local_only=False)[0].text)
+        assert sorted(data) == ["/dev/sda1", "nfs:/share"]
+
+    @patch('psutil.disk_partitions')
+    @patch('psutil.disk_usage')
+    def test_disk_usage_empty_filesystem(self, mock_disk_usage, mock_disk_partitions):
+        """Test zero-sized mounts report psutil's percent instead of failing."""
+        mock_disk_partitions.return_value = [MagicMock(device="none", mountpoint="/run/empty", fstype="tmpfs")]
+        mock_disk_usage.return_value = MagicMock(total=0, used=0, free=0, percent=0.0)
+        
+        result = self.monitoring_tools.disk_usage()
+        
+        assert json.loads(result[0].text)["none"]["percent"] == 0.0
+
     @patch('psutil.disk_usage')
     def test_disk_usage_exception_handling(self, mock_disk_usage):
         """Test disk_usage with exception handling."""
@@ -129,6 +241,41 @@ class TestMonitoringTools:
         # Check for process data in JSON response or error
         assert "pid" in result[0].text or "error" in result[0].text.lower()
 
+    @patch('psutil.process_iter')
+    def test_process_list_top_processes_cached(self, mock_process_iter):
+        """Test process_list returns the busiest processes and reuses the listing."""
+        processes = []
+        for pid, cpu in [(1, 5.0), (2, 50.0), (3, None), (4, 20.0)]:
+            proc = MagicMock()
+            proc.info = {
+                'pid': pid,
+                'name': f'proc{pid}',
+                'cpu_percent': cpu,
+                'memory_percent': 1.0,
+                'status': 'running'
+            }
+            processes.append(proc)
+        mock_process_iter.return_value = processes
+        
+        result = self.monitoring_tools.process_list(limit=2)
+        self.monitoring_tools.process_list(limit=2)
+        
+        text = result[0].text
+        assert '"pid": 2' in text and '"pid": 4' in text
+        assert '"pid": 1' not in text
+        mock_process_iter.assert_called_once()
+
+    @pytest.mark.parametrize("limit", [0, -1, "5", True])
+    @patch('psutil.process_iter')
+    def test_process_list_invalid_limit(self, mock_process_iter, limit):
+        """Test process_list rejects limits that are not positive integers."""
+        result = self.monitoring_tools.process_list(limit=limit)
+        
+        assert '"error": true' in result[0].text
+        assert "Invalid limit" in result[0].text
+        mock_process_iter.assert_not_called()
+        assert self.monitoring_tools._process_cache.get(limit) is None
+
     @patch('psutil.process_iter')
     def test_process_list_exception_handling(self, mock_process_iter):
         """Test process_list with exception handling."""
@@ -147,7 +294,7 @@ class TestMonitoringTools:
     def test_system_status_valid_inputs(self, mock_boot_time, mock_disk_usage, 
                                        mock_virtual_memory, mock_cpu_percent):
         """Test system_status with valid inputs."""
-        mock_cpu_percent.return_value = 25.5
+        mock_cpu_percent.return_value = [25.5, 25.5]
         
         mock_memory = MagicMock()
         mock_memory.total = 8589934592
@@ -171,6 +318,20 @@ class TestMonitoringTools:
         # Check for system status data in JSON response
         assert "cpu" in result[0].text and "memory" in result[0].text
 
+    @patch('psutil.net_io_counters')
+    def test_system_status_network_interfaces(self, mock_net_io_counters):
+        """Test per-interface counters keep their keyed layout."""
+        mock_net_io_counters.return_value = {
+            "eth0": SNETIO(100, 200, 3, 4, 0, 0, 0, 0)
+        }
+        
+        result = self.monitoring_tools.system_status()
+        
+        data = json.loads(result[0].text)
+        assert data["network_interfaces"] == {
+            "eth0": {"bytes_sent": 100, "bytes_recv": 200, "packets_sent": 3, "packets_recv": 4}
+        }
+
     @patch('psutil.cpu_percent')
     def test_system_status_exception_handling(self, mock_cpu_percent):
         """Test system_status with exception handling."""
@@ -181,3 +342,37 @@ class TestMonitoringTools:
         assert len(result) > 0
         assert result[0].type == "text"
         assert "error" in result[0].text.lower()
+
+
+class TestMetricsCache:
+    """Test MetricsCache snapshot refreshing."""
+
+    @staticmethod
+    def _snapshot():
+        return Snapshot(per_cpu_percent=[10.0, 20.0], memory=None, swap=None, disk=None, net_io={})
+
+    def test_snapshot_reused_until_stale(self):
+        """Test reads reuse the snapshot until it is older than stale_after."""
+        collect = MagicMock(side_effect=lambda: self._snapshot())
+        cache = MetricsCache(collect, stale_after=0.05)
+        
+        first = cache.get_snapshot()
+        assert cache.get_snapshot() is first
+        assert first.cpu_percent == 15.0
+        
+        time.sleep(0.1)
+        assert cache.get_snapshot() is not first
+        assert collect.call_count == 2
+
+    def test_background_refresh(self):
+        """Test the refresher thread keeps collecting snapshots."""
+        collect = MagicMock(side_effect=lambda: self._snapshot())
+        cache = MetricsCache(collect, stale_after=10, refresh_interval=0.02)
+        
+        try:
+            cache.get_snapshot()
+            time.sleep(0.2)
+        finally:
+            cache.stop()
+        
+        assert collect.call_count > 2
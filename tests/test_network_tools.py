@@ -2,6 +2,8 @@
 Tests for NetworkTools.
 """
 
+import json
+import sys
 import pytest
 from unittest.mock import patch, MagicMock
 from netops_mcp.tools.system.network_tools import NetworkTools
@@ -13,6 +15,8 @@ class TestNetworkTools:
     def setup_method(self):
         """Set up test fixtures."""
         self.network_tools = NetworkTools()
+        # Exercise the CLI tool path; /proc/net parsing is tested separately
+        self.network_tools._proc_net_dir = None
 
     def test_initialization(self):
         """Test NetworkTools initialization."""
@@ -167,14 +171,124 @@ class TestNetworkTools:
             assert result[0].type == "text"
             assert "error" in result[0].text.lower()
 
-    @pytest.mark.parametrize("valid_hosts,invalid_hosts", [
-        (["google.com", "8.8.8.8", "192.168.1.1"], 
-         ["", None, "invalid..host", "host with spaces"]),
+    @pytest.mark.parametrize("host,expected", [
+        ("google.com", True),
+        ("8.8.8.8", True),
+        ("192.168.1.1", True),
+        ("", False),
+        (None, False),
+        ("invalid..host", False),
+        ("host with spaces", False),
     ])
-    def test_validate_host(self, valid_hosts, invalid_hosts):
+    def test_validate_host(self, host, expected):
         """Test host validation."""
-        for host in valid_hosts:
-            assert self.network_tools._validate_host(host) == True
+        assert self.network_tools._validate_host(host) is expected
+
+
+PROC_NET_TCP = """  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode
+   0: 00000000:0016 00000000:0000 0A 00000000:00000000 00:00000000 00000000     0        0 1001 1
+   1: 0100007F:AE22 0100007F:0016 01 00000000:00000000 00:00000000 00000000     0        0 1002 1
+   2: 0100007F:AE24 0100007F:0050 04 00000000:00000000 00:00000000 00000000     0        0 1005 1
+"""
+
+PROC_NET_TCP6 = """  sl  local_address                         remote_address                        st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode
+   0: 00000000000000000000000001000000:0050 00000000000000000000000000000000:0000 0A 00000000:00000000 00:00000000 00000000     0        0 1003 1
+"""
+
+PROC_NET_UDP = """   sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode ref pointer drops
+  10: 3500007F:0035 00000000:0000 07 00000000:00000000 00:00000000 00000000   101        0 1004 2 0000000000000000 0
+"""
+
+PROC_NET_ARP = """IP address       HW type     Flags       HW address            Mask     Device
+192.168.1.1      0x1         0x2         aa:bb:cc:dd:ee:ff     *        eth0
+"""
+
+
+@pytest.mark.skipif(sys.byteorder != "little", reason="fixtures use little-endian /proc/net encoding")
+class TestProcNetParsing:
+    """Test reading socket and ARP tables from /proc/net."""
+
+    @pytest.fixture(autouse=True)
+    def proc_net(self, tmp_path):
+        """Create a fake /proc/net directory."""
+        (tmp_path / "tcp").write_text(PROC_NET_TCP)
+        (tmp_path / "tcp6").write_text(PROC_NET_TCP6)
+        (tmp_path / "udp").write_text(PROC_NET_UDP)
+        (tmp_path / "arp").write_text(PROC_NET_ARP)
+        self.network_tools = NetworkTools()
+        self.network_tools._proc_net_dir = str(tmp_path)
+
+    def test_ss_connections_listening_by_default(self):
+        """Test only listening TCP and unconnected UDP sockets are listed by default."""
+        with patch.object(self.network_tools, '_execute_command') as mock_execute:
+            result = self.network_tools.ss_connections()
+        
+        mock_execute.assert_not_called()
+        connections = json.loads(result[0].text)["connections"]
+        assert [(c["protocol"], c["local_address"], c["local_port"], c["state"]) for c in connections] == [
+            ("tcp", "0.0.0.0", 22, "LISTEN"),
+            ("tcp6", "::1", 80, "LISTEN"),
+            ("udp", "127.0.0.53", 53, "UNCONN")
+        ]
+
+    def test_netstat_connections_state_and_protocol_filter(self):
+        """Test state and protocol filters are applied to the socket tables."""
+        result = self.network_tools.netstat_connections(state="established", protocol="tcp")
+        
+        connections = json.loads(result[0].text)["connections"]
+        assert connections == [{
+            "protocol": "tcp",
+            "state": "ESTABLISHED",
+            "local_address": "127.0.0.1",
+            "local_port": 44578,
+            "peer_address": "127.0.0.1",
+            "peer_port": 22
+        }]
+
+    @pytest.mark.parametrize("state,expected", [
+        ("fin-wait-1", ["FIN_WAIT1"]),
+        ("FIN_WAIT1", ["FIN_WAIT1"]),
+        ("listening", ["LISTEN", "LISTEN", "UNCONN"]),
+        ("all", ["LISTEN", "ESTABLISHED", "FIN_WAIT1", "LISTEN", "UNCONN"]),
+        ("connected", ["ESTABLISHED", "FIN_WAIT1"]),
+        ("synchronized", ["ESTABLISHED", "FIN_WAIT1"]),
+    ])
+    def test_ss_connections_state_filters(self, state, expected):
+        """Test ss and netstat state names and ss state groups select the matching sockets."""
+        with patch.object(self.network_tools, '_execute_command') as mock_execute:
+            result = self.network_tools.ss_connections(state=state)
+        
+        mock_execute.assert_not_called()
+        connections = json.loads(result[0].text)["connections"]
+        assert [c["state"] for c in connections] == expected
+
+    def test_unknown_state_falls_back_to_command(self):
+        """Test a state filter the tables do not know is left to the CLI tool."""
+        with patch.object(self.network_tools, '_execute_command') as mock_execute:
+            mock_execute.return_value = {"success": True, "stdout": "Netid State", "stderr": "", "return_code": 0}
+            result = self.network_tools.ss_connections(state="bogus")
+        
+        mock_execute.assert_called_once()
+        assert "Netid State" in result[0].text
+
+    def test_arp_table(self):
+        """Test ARP entries are parsed from /proc/net/arp."""
+        with patch.object(self.network_tools, '_execute_command') as mock_execute:
+            result = self.network_tools.arp_table()
+        
+        mock_execute.assert_not_called()
+        entries = json.loads(result[0].text)["entries"]
+        assert entries[0]["ip_address"] == "192.168.1.1"
+        assert entries[0]["hw_address"] == "aa:bb:cc:dd:ee:ff"
+        assert entries[0]["device"] == "eth0"
+
+    def test_missing_proc_net_falls_back_to_command(self, tmp_path):
+        """Test the CLI tool is used when the tables cannot be read."""
+        self.network_tools._proc_net_dir = str(tmp_path / "missing")
+        
+        with patch.object(self.network_tools, '_execute_command') as mock_execute:
+            mock_execute.return_value = {"success": True, "stdout": "ARP table", "stderr": "", "return_code": 0}
+            result = self.network_tools.arp_table()
         
-        for host in invalid_hosts:
-            assert self.network_tools._validate_host(host) == False
+        mock_execute.assert_called_once()
+        assert "ARP table" in result[0].text
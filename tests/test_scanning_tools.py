@@ -3,10 +3,31 @@ Tests for ScanningTools.
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
+import json
+from unittest.mock import patch, MagicMock, AsyncMock
 from netops_mcp.tools.security.scanning_tools import ScanningTools
 
 
+NMAP_XML_OUTPUT = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE nmaprun>
+<nmaprun scanner="nmap" args="nmap -sT -p 22,80 -oX - 127.0.0.1">
+<host><status state="up"/><address addr="127.0.0.1" addrtype="ipv4"/>
+<ports>
+<port protocol="tcp" portid="22"><state state="open"/><service name="ssh"/></port>
+<port protocol="tcp" portid="80"><state state="closed"/></port>
+</ports>
+</host>
+</nmaprun>"""
+
+
+MASSCAN_JSON_OUTPUT = """[
+{   "ip": "10.0.0.1",   "timestamp": "1700000000", "ports": [ {"port": 443, "proto": "tcp", "status": "open", "reason": "syn-ack", "ttl": 64} ] }
+,
+{   "ip": "10.0.0.1",   "timestamp": "1700000001", "ports": [ {"port": 22, "proto": "tcp", "status": "open", "reason": "syn-ack", "ttl": 64} ] }
+,
+]"""
+
+
 class TestScanningTools:
     """Test ScanningTools functionality."""
 
@@ -80,6 +101,140 @@ class TestScanningTools:
         assert result[0].type == "text"
         assert "error" in result[0].text.lower()
 
+    def test_port_scan_parses_xml_output(self):
+        """Test port_scan requests XML output and parses it into per-port results."""
+        with patch.object(self.scanning_tools, '_execute_command') as mock_execute:
+            mock_execute.return_value = {
+                "success": True,
+                "stdout": NMAP_XML_OUTPUT,
+                "stderr": "",
+                "return_code": 0
+            }
+            
+            result = self.scanning_tools.port_scan("127.0.0.1", "22,80")
+            
+            command = mock_execute.call_args[0][0]
+            assert command[-3:] == ['-oX', '-', '127.0.0.1']
+            assert '--min-rate' in command
+            data = json.loads(result[0].text)
+            assert data["scan_results"] == [
+                {"port": 22, "protocol": "tcp", "state": "open", "service": "ssh"},
+                {"port": 80, "protocol": "tcp", "state": "closed", "service": None}
+            ]
+
+    def test_count_ports(self):
+        """Test port specifications are counted including ranges."""
+        assert self.scanning_tools._count_ports("80") == 1
+        assert self.scanning_tools._count_ports("22,80,443") == 3
+        assert self.scanning_tools._count_ports("1-1024,8080") == 1025
+
+    @pytest.mark.parametrize("target,ports,backend,installed,raw_socket,expected", [
+        ("10.0.0.1", "1-65535", "auto", True, True, "masscan"),
+        ("10.0.0.0/24", "1-2000", "auto", True, True, "masscan"),
+        ("10.0.0.1", "1-1024", "auto", True, True, "nmap"),
+        ("10.0.0.1", "1-65535", "auto", False, True, "nmap"),
+        ("10.0.0.1", "1-65535", "auto", True, False, "nmap"),
+        ("example.com", "1-65535", "auto", True, True, "nmap"),
+        ("10.0.0.1", "1-65535", "nmap", True, True, "nmap"),
+        ("10.0.0.1", "80", "masscan", True, True, "masscan"),
+    ])
+    def test_select_port_scan_backend(self, target, ports, backend, installed, raw_socket, expected):
+        """Test masscan is only auto-selected for wide sweeps of IP targets when it can run."""
+        with patch('netops_mcp.tools.security.scanning_tools.shutil.which',
+                   return_value='/usr/bin/masscan' if installed else None), \
+             patch('netops_mcp.tools.security.scanning_tools.can_open_raw_socket', return_value=raw_socket):
+            assert self.scanning_tools._select_port_scan_backend(target, ports, backend) == expected
+
+    def test_port_scan_falls_back_when_masscan_fails(self):
+        """Test a failed masscan run is retried with nmap."""
+        with patch('netops_mcp.tools.security.scanning_tools.shutil.which', return_value='/usr/bin/masscan'), \
+             patch('netops_mcp.tools.security.scanning_tools.can_open_raw_socket', return_value=True), \
+             patch.object(self.scanning_tools, '_execute_command') as mock_execute:
+            mock_execute.side_effect = [
+                {"success": False, "stdout": "", "stderr": "FAIL: permission denied", "return_code": 1},
+                {"success": True, "stdout": NMAP_XML_OUTPUT, "stderr": "", "return_code": 0}
+            ]
+            
+            result = self.scanning_tools.port_scan("10.0.0.1", "1-65535")
+        
+        assert mock_execute.call_args_list[0][0][0][0] == "masscan"
+        assert mock_execute.call_args_list[1][0][0][0] == "nmap"
+        data = json.loads(result[0].text)
+        assert data["backend"] == "nmap"
+        assert data["success"] == True
+        assert data["scan_results"][0]["port"] == 22
+
+    def test_port_scan_masscan_backend(self):
+        """Test port_scan dispatches to masscan and parses its JSON output."""
+        with patch('netops_mcp.tools.security.scanning_tools.shutil.which', return_value='/usr/bin/masscan'), \
+             patch('netops_mcp.tools.security.scanning_tools.can_open_raw_socket', return_value=True), \
+             patch.object(self.scanning_tools, '_execute_command') as mock_execute:
+            mock_execute.return_value = {
+                "success": True,
+                "stdout": MASSCAN_JSON_OUTPUT,
+                "stderr": "",
+                "return_code": 0
+            }
+            
+            result = self.scanning_tools.port_scan("10.0.0.1", "1-65535", rate=5000)
+            
+            command = mock_execute.call_args[0][0]
+            assert command == ['masscan', '--rate', '5000', '-p', '1-65535', '10.0.0.1', '-oJ', '-']
+            data = json.loads(result[0].text)
+            assert data["backend"] == "masscan"
+            assert data["scan_results"] == [
+                {"port": 443, "protocol": "tcp", "state": "open", "service": None},
+                {"port": 22, "protocol": "tcp", "state": "open", "service": None}
+            ]
+
+    @pytest.mark.parametrize("rate", [0, -1, 100001, 10_000_000])
+    def test_port_scan_rejects_out_of_range_rate(self, rate):
+        """Test port_scan rejects masscan rates outside 1..MASSCAN_MAX_RATE."""
+        with patch('netops_mcp.tools.security.scanning_tools.shutil.which', return_value='/usr/bin/masscan'), \
+             patch.object(self.scanning_tools, '_execute_command') as mock_execute:
+            result = self.scanning_tools.port_scan("10.0.0.1", "1-65535", rate=rate)
+        
+        mock_execute.assert_not_called()
+        assert "Invalid rate" in result[0].text
+
+    def test_port_scan_invalid_backend(self):
+        """Test port_scan rejects unknown or unusable backends."""
+        result = self.scanning_tools.port_scan("10.0.0.1", "80", backend="zmap")
+        assert "error" in result[0].text.lower()
+        
+        with patch('netops_mcp.tools.security.scanning_tools.shutil.which', return_value=None):
+            result = self.scanning_tools.port_scan("10.0.0.1", "80", backend="masscan")
+        assert "masscan" in result[0].text
+
+    @pytest.mark.asyncio
+    async def test_parallel_scan(self):
+        """Test parallel_scan runs one scan per target and reports each."""
+        with patch.object(self.scanning_tools, '_execute_command_async', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = {
+                "success": True,
+                "stdout": NMAP_XML_OUTPUT,
+                "stderr": "",
+                "return_code": 0
+            }
+            
+            result = await self.scanning_tools.parallel_scan(["127.0.0.1", "10.0.0.1", "invalid..host"], "22,80")
+            
+            assert mock_execute.call_count == 2
+            data = json.loads(result[0].text)
+            assert data["total"] == 3
+            assert data["succeeded"] == 2
+            assert data["results"][0]["scan_results"][0]["port"] == 22
+            assert data["results"][2]["error"] == "Invalid target provided"
+
+    @pytest.mark.asyncio
+    async def test_parallel_scan_invalid_input(self):
+        """Test parallel_scan rejects empty targets and bad port specifications."""
+        result = await self.scanning_tools.parallel_scan([], "80")
+        assert "error" in result[0].text.lower()
+        
+        result = await self.scanning_tools.parallel_scan(["127.0.0.1"], "invalid")
+        assert "error" in result[0].text.lower()
+
     def test_port_scan_command_timeout(self):
         """Test port_scan with command timeout."""
         with patch.object(self.scanning_tools, '_execute_command') as mock_execute:
@@ -142,26 +297,147 @@ class TestScanningTools:
             assert result[0].type == "text"
             assert "error" in result[0].text.lower()
 
-    @pytest.mark.parametrize("valid_hosts,invalid_hosts", [
-        (["google.com", "8.8.8.8", "192.168.1.1"], 
-         ["", None, "invalid..host", "host with spaces"]),
+    def test_service_enumeration_scripts_opt_in(self):
+        """Test NSE scripts only run when requested and intensity is configurable."""
+        with patch.object(self.scanning_tools, '_execute_command') as mock_execute:
+            mock_execute.return_value = {
+                "success": True,
+                "stdout": "22/tcp open ssh",
+                "stderr": "",
+                "return_code": 0
+            }
+            
+            self.scanning_tools.service_enumeration("google.com", ports="22")
+            command = mock_execute.call_args[0][0]
+            assert command == ['nmap', '-sV', '--version-intensity', '2', '-p', '22', 'google.com']
+            
+            self.scanning_tools.service_enumeration("google.com", ports="22", scripts="default,ssl-cert",
+                                                    version_intensity=7)
+            command = mock_execute.call_args[0][0]
+            assert command == ['nmap', '-sV', '--version-intensity', '7', '--script', 'default,ssl-cert',
+                               '-p', '22', 'google.com']
+
+    @pytest.mark.parametrize("kwargs", [
+        {"scripts": "../evil.nse"},
+        {"scripts": "/tmp/evil"},
+        {"scripts": ""},
+        {"scripts": "*"},
+        {"scripts": "http-*"},
+        {"scripts": "all"},
+        {"scripts": "default,exploit"},
+        {"scripts": "DOS"},
+        {"scripts": "brute"},
+        {"scripts": "intrusive"},
+        {"scripts": "not intrusive"},
+        {"scripts": "default,"},
+        {"version_intensity": 10},
+        {"version_intensity": -1},
     ])
-    def test_validate_host(self, valid_hosts, invalid_hosts):
-        """Test host validation."""
-        for host in valid_hosts:
-            assert self.scanning_tools._validate_host(host) == True
+    def test_service_enumeration_invalid_options(self, kwargs):
+        """Test path, wildcard and intrusive script selections and bad intensities are rejected."""
+        result = self.scanning_tools.service_enumeration("google.com", **kwargs)
         
-        for host in invalid_hosts:
-            assert self.scanning_tools._validate_host(host) == False
+        assert "error" in result[0].text.lower()
+
+    def test_service_enumeration_cached_result(self):
+        """Test repeated service_enumeration calls replay the cached result."""
+        with patch.object(self.scanning_tools, '_execute_command') as mock_execute:
+            mock_execute.return_value = {
+                "success": True,
+                "stdout": "22/tcp open ssh OpenSSH 8.9",
+                "stderr": "",
+                "return_code": 0
+            }
+            
+            first = self.scanning_tools.service_enumeration("google.com", ports="22")
+            second = self.scanning_tools.service_enumeration("google.com", ports="22")
+            
+            assert mock_execute.call_count == 1
+            assert "OpenSSH" in second[0].text
+            assert '"cached": true' in second[0].text
+            assert '"cached"' not in first[0].text
+            
+            # Different ports are a different cache entry
+            self.scanning_tools.service_enumeration("google.com", ports="80")
+            assert mock_execute.call_count == 2
+
+    def test_service_enumeration_cache_bypass(self):
+        """Test force=True and an expired cache_ttl both run a new scan."""
+        with patch.object(self.scanning_tools, '_execute_command') as mock_execute:
+            mock_execute.return_value = {
+                "success": True,
+                "stdout": "22/tcp open ssh",
+                "stderr": "",
+                "return_code": 0
+            }
+            
+            self.scanning_tools.service_enumeration("google.com")
+            self.scanning_tools.service_enumeration("google.com", force=True)
+            self.scanning_tools.service_enumeration("google.com", cache_ttl=0)
+            
+            assert mock_execute.call_count == 3
+
+    def test_service_enumeration_failure_not_cached(self):
+        """Test failed enumerations are not replayed."""
+        with patch.object(self.scanning_tools, '_execute_command') as mock_execute:
+            mock_execute.return_value = {
+                "success": False,
+                "stdout": "",
+                "stderr": "Host seems down",
+                "return_code": 1
+            }
+            
+            self.scanning_tools.service_enumeration("google.com")
+            self.scanning_tools.service_enumeration("google.com")
+            
+            assert mock_execute.call_count == 2
 
-    @pytest.mark.parametrize("valid_ports,invalid_ports", [
-        (["80", "443", "22,80,443", "1-100", "80-443"], 
-         ["", None, "invalid_ports", "abc", "999999", "0", "65536"]),
+    @pytest.mark.parametrize("host,expected", [
+        ("google.com", True),
+        ("8.8.8.8", True),
+        ("192.168.1.1", True),
+        ("", False),
+        (None, False),
+        ("invalid..host", False),
+        ("host with spaces", False),
+    ])
+    def test_validate_host(self, host, expected):
+        """Test host validation."""
+        assert self.scanning_tools._validate_host(host) is expected
+
+    @pytest.mark.parametrize("ports,expected", [
+        ("80", True),
+        ("443", True),
+        ("22,80,443", True),
+        ("1-100", True),
+        ("80-443", True),
+        ("", False),
+        (None, False),
+        ("invalid_ports", False),
+        ("abc", False),
+        ("999999", False),
+        ("0", False),
+        ("65536", False),
     ])
-    def test_validate_ports(self, valid_ports, invalid_ports):
+    def test_validate_ports(self, ports, expected):
         """Test ports validation."""
-        for ports in valid_ports:
-            assert self.scanning_tools._validate_ports(ports) == True
-        
-        for ports in invalid_ports:
-            assert self.scanning_tools._validate_ports(ports) == False
+        assert self.scanning_tools._validate_ports(ports) is expected
+
+    @pytest.mark.parametrize("ports,expected", [
+        ("1-65535", True),
+        ("22,80-90,443", True),
+        ("0080", True),
+        ("100-10", False),
+        ("0-10", False),
+        ("1-2-3", False),
+        ("80,", False),
+        (",80", False),
+        ("80,,443", False),
+        ("-80", False),
+        ("80-", False),
+        ("80 ,443", False),
+        ("65535-65536", False)
+    ])
+    def test_validate_ports_specifications(self, ports, expected):
+        """Test ports validation with ranges and malformed separators."""
+        assert self.scanning_tools._validate_ports(ports) == expected
@@ -141,3 +141,13 @@ class TestNetOpsMCPServer:
         assert server.network_tools is not None
         assert server.monitoring_tools is not None
         assert server.scanning_tools is not None
+
+    @pytest.mark.asyncio
+    async def test_lifespan_closes_http_client(self):
+        """Test the persistent HTTP client is closed when the server shuts down."""
+        server = NetOpsMCPServer(self.temp_config.name)
+        
+        async with server._lifespan(server.mcp):
+            client = await server.http_tools._http_client()
+        
+        assert client.is_closed
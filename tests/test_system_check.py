@@ -1,13 +1,17 @@
 """
 Tests for the system check module.
 """
+import os
 import pytest
 import subprocess
 import platform
+import time
 import psutil
 from unittest.mock import Mock, patch, MagicMock
 from netops_mcp.utils.system_check import (
     check_required_tools,
+    clear_tool_caches,
+    find_tools_on_path,
     get_system_info,
     is_tool_available,
     get_tool_version,
@@ -15,19 +19,34 @@ from netops_mcp.utils.system_check import (
     get_network_interfaces,
     get_disk_usage,
     get_memory_info,
-    get_cpu_info
+    get_cpu_info,
+    get_tool_versions,
+    check_privileged_access,
+    TOOL_CACHE_TTL
 )
 
 
 class TestSystemCheck:
     """Test cases for system check utilities."""
 
-    @patch('netops_mcp.utils.system_check.subprocess.run')
-    def test_check_required_tools_all_available(self, mock_run):
+    def setup_method(self):
+        """Reset the cached tool lookups between tests."""
+        clear_tool_caches()
+
+    @staticmethod
+    def _use_path(monkeypatch, tmp_path, tools):
+        """Point PATH at a directory holding executable stubs for the given tools."""
+        for tool in tools:
+            stub = tmp_path / tool
+            stub.write_text("#!/bin/sh\n")
+            stub.chmod(0o755)
+        monkeypatch.setenv('PATH', str(tmp_path))
+
+    def test_check_required_tools_all_available(self, monkeypatch, tmp_path):
         """Test checking required tools when all are available."""
-        mock_run.return_value = Mock(returncode=0)
-        
         tools = ['ping', 'curl', 'nslookup']
+        self._use_path(monkeypatch, tmp_path, tools)
+        
         result = check_required_tools(tools)
         
         assert result['all_available'] is True
@@ -37,16 +56,9 @@ class TestSystemCheck:
         assert 'curl' in result['available_tools']
         assert 'nslookup' in result['available_tools']
 
-    @patch('netops_mcp.utils.system_check.subprocess.run')
-    def test_check_required_tools_some_missing(self, mock_run):
+    def test_check_required_tools_some_missing(self, monkeypatch, tmp_path):
         """Test checking required tools when some are missing."""
-        def mock_run_side_effect(cmd, **kwargs):
-            if 'ping' in cmd:
-                return Mock(returncode=0)
-            else:
-                return Mock(returncode=1)
-        
-        mock_run.side_effect = mock_run_side_effect
+        self._use_path(monkeypatch, tmp_path, ['ping'])
         
         tools = ['ping', 'nonexistent_tool', 'another_missing']
         result = check_required_tools(tools)
@@ -58,10 +70,9 @@ class TestSystemCheck:
         assert 'nonexistent_tool' in result['missing_tools']
         assert 'another_missing' in result['missing_tools']
 
-    @patch('netops_mcp.utils.system_check.subprocess.run')
-    def test_check_required_tools_all_missing(self, mock_run):
+    def test_check_required_tools_all_missing(self, monkeypatch, tmp_path):
         """Test checking required tools when all are missing."""
-        mock_run.return_value = Mock(returncode=1)
+        self._use_path(monkeypatch, tmp_path, [])
         
         tools = ['missing1', 'missing2', 'missing3']
         result = check_required_tools(tools)
@@ -70,28 +81,41 @@ class TestSystemCheck:
         assert len(result['available_tools']) == 0
         assert len(result['missing_tools']) == 3
 
-    @patch('netops_mcp.utils.system_check.subprocess.run')
-    def test_check_required_tools_empty_list(self, mock_run):
+    @patch('netops_mcp.utils.system_check.os.scandir')
+    def test_check_required_tools_empty_list(self, mock_scandir):
         """Test checking required tools with empty list."""
         result = check_required_tools([])
         
         assert result['all_available'] is True
         assert len(result['available_tools']) == 0
         assert len(result['missing_tools']) == 0
-        mock_run.assert_not_called()
+        mock_scandir.assert_not_called()
 
     @patch('netops_mcp.utils.system_check.subprocess.run')
-    def test_check_required_tools_subprocess_error(self, mock_run):
-        """Test checking required tools when subprocess fails."""
-        mock_run.side_effect = subprocess.SubprocessError("Command not found")
+    def test_check_required_tools_spawns_no_processes(self, mock_run, monkeypatch, tmp_path):
+        """Test availability checks only search PATH."""
+        self._use_path(monkeypatch, tmp_path, ['ping'])
         
-        tools = ['ping']
-        result = check_required_tools(tools)
+        result = check_required_tools(['ping'])
         
-        assert result['all_available'] is False
-        assert len(result['available_tools']) == 0
-        assert len(result['missing_tools']) == 1
-        assert 'ping' in result['missing_tools']
+        assert result['available_tools'] == ['ping']
+        mock_run.assert_not_called()
+
+    def test_find_tools_on_path_lists_each_directory_once(self, monkeypatch, tmp_path):
+        """Test every PATH directory is scanned once for all tools, and only executables count."""
+        first, second = tmp_path / "first", tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        self._use_path(monkeypatch, first, ['ping'])
+        self._use_path(monkeypatch, second, ['curl'])
+        (second / 'dig').write_text("not executable")
+        monkeypatch.setenv('PATH', f"{first}:{tmp_path / 'missing'}:{second}")
+        
+        with patch('netops_mcp.utils.system_check.os.scandir', wraps=os.scandir) as mock_scandir:
+            found = find_tools_on_path(('ping', 'curl', 'dig'))
+        
+        assert found == {'ping', 'curl'}
+        assert mock_scandir.call_count == 3
 
     def test_get_system_info(self):
         """Test getting system information."""
@@ -111,41 +135,75 @@ class TestSystemCheck:
         assert info['hostname'] == platform.node()
         assert info['cpu_count'] == psutil.cpu_count()
 
-    @patch('netops_mcp.utils.system_check.subprocess.run')
-    def test_is_tool_available_true(self, mock_run):
+    @patch('netops_mcp.utils.system_check.shutil.which')
+    def test_is_tool_available_true(self, mock_which):
         """Test checking if a tool is available (returns True)."""
-        mock_run.return_value = Mock(returncode=0)
+        mock_which.return_value = "/bin/ping"
         
         result = is_tool_available('ping')
         
         assert result is True
-        mock_run.assert_called_once()
+        mock_which.assert_called_once_with('ping')
 
-    @patch('netops_mcp.utils.system_check.subprocess.run')
-    def test_is_tool_available_false(self, mock_run):
+    @patch('netops_mcp.utils.system_check.shutil.which')
+    def test_is_tool_available_false(self, mock_which):
         """Test checking if a tool is available (returns False)."""
-        mock_run.return_value = Mock(returncode=1)
+        mock_which.return_value = None
         
         result = is_tool_available('nonexistent_tool')
         
         assert result is False
-        mock_run.assert_called_once()
+        mock_which.assert_called_once()
 
-    @patch('netops_mcp.utils.system_check.subprocess.run')
-    def test_is_tool_available_subprocess_error(self, mock_run):
-        """Test checking if a tool is available when subprocess fails."""
-        mock_run.side_effect = subprocess.SubprocessError("Command not found")
+    @patch('netops_mcp.utils.system_check.shutil.which')
+    def test_is_tool_available_cached(self, mock_which):
+        """Test repeated availability checks reuse the first lookup."""
+        mock_which.return_value = "/bin/ping"
         
-        result = is_tool_available('ping')
+        assert is_tool_available('ping') is True
+        assert is_tool_available('ping') is True
         
-        assert result is False
+        mock_which.assert_called_once()
+
+    @patch('netops_mcp.utils.system_check.shutil.which')
+    def test_is_tool_available_rechecks_missing_tools(self, mock_which):
+        """Test a tool installed after a failed lookup is found on the next call."""
+        mock_which.side_effect = [None, "/usr/bin/mtr"]
+        
+        assert is_tool_available('mtr') is False
+        assert is_tool_available('mtr') is True
+
+    def test_tool_lookups_expire(self, monkeypatch, tmp_path):
+        """Test cached PATH scans are redone once TOOL_CACHE_TTL has passed."""
+        self._use_path(monkeypatch, tmp_path, ['ping'])
+        assert find_tools_on_path(('ping', 'curl')) == {'ping'}
+        
+        self._use_path(monkeypatch, tmp_path, ['ping', 'curl'])
+        assert find_tools_on_path(('ping', 'curl')) == {'ping'}
+        
+        now = time.monotonic()
+        with patch('netops_mcp.utils.cache.time.monotonic', return_value=now + TOOL_CACHE_TTL):
+            assert find_tools_on_path(('ping', 'curl')) == {'ping', 'curl'}
+
+    @patch('netops_mcp.utils.system_check.subprocess.run')
+    def test_get_tool_version_failure_not_cached(self, mock_run):
+        """Test a failed version lookup is retried while a successful one is reused."""
+        mock_run.side_effect = [
+            subprocess.TimeoutExpired(['curl', '--version'], 5),
+            Mock(returncode=0, stdout=b"curl 8.0.0\n")
+        ]
+        
+        assert get_tool_version('curl') == "Unknown"
+        assert get_tool_version('curl') == "curl 8.0.0"
+        assert get_tool_version('curl') == "curl 8.0.0"
+        assert mock_run.call_count == 2
 
     @patch('netops_mcp.utils.system_check.subprocess.run')
     def test_get_tool_version_success(self, mock_run):
         """Test getting tool version successfully."""
         mock_run.return_value = Mock(
             returncode=0,
-            stdout="curl 7.68.0 (x86_64-pc-linux-gnu)\n"
+            stdout=b"curl 7.68.0 (x86_64-pc-linux-gnu)\nRelease-Date: 2020-01-08\n"
         )
         
         version = get_tool_version('curl')
@@ -172,6 +230,23 @@ class TestSystemCheck:
         
         assert version == "Unknown"
 
+    @pytest.mark.asyncio
+    async def test_get_tool_versions(self):
+        """Test versions are collected concurrently and missing tools are skipped."""
+        versions = await get_tool_versions(['python3', 'netops-mcp-no-such-tool'])
+        
+        assert versions['python3'].startswith('Python 3')
+        assert versions['netops-mcp-no-such-tool'] == "Tool not found"
+
+    def test_check_required_tools_include_versions(self, monkeypatch, tmp_path):
+        """Test versions are only reported when requested."""
+        self._use_path(monkeypatch, tmp_path, [])
+        
+        assert 'versions' not in check_required_tools(['missing1'])
+        result = check_required_tools(['missing1'], include_versions=True)
+        
+        assert result['versions'] == {}
+
     def test_validate_system_requirements(self):
         """Test system requirements validation."""
         # Mock the required tools check
@@ -224,6 +299,8 @@ class TestSystemCheck:
         assert 'eth0' in interfaces
         assert len(interfaces['lo']) == 2
         assert len(interfaces['eth0']) == 1
+        assert interfaces['lo'][0]['family'] == 'AF_INET'
+        assert interfaces['lo'][1]['family'] == 'AF_INET6'
 
     @patch('netops_mcp.utils.system_check.psutil.disk_usage')
     def test_get_disk_usage(self, mock_disk_usage):
@@ -247,6 +324,12 @@ class TestSystemCheck:
         assert usage['free'] == 500000000
         assert usage['percent'] == 50.0
 
+    def test_get_disk_usage_missing_path(self):
+        """Test disk usage for a missing path reports zeros."""
+        usage = get_disk_usage('/netops-mcp/no/such/path')
+        
+        assert usage == {'total': 0, 'used': 0, 'free': 0, 'percent': 0.0}
+
     @patch('netops_mcp.utils.system_check.psutil.virtual_memory')
     def test_get_memory_info(self, mock_virtual_memory):
         """Test getting memory information."""
@@ -270,10 +353,9 @@ class TestSystemCheck:
         assert memory['percent'] == 50.0
 
     @patch('netops_mcp.utils.system_check.psutil.cpu_percent')
-    @patch('netops_mcp.utils.system_check.psutil.cpu_count')
-    def test_get_cpu_info(self, mock_cpu_count, mock_cpu_percent):
+    @patch('netops_mcp.utils.system_check.CPU_COUNT', 8)
+    def test_get_cpu_info(self, mock_cpu_percent):
         """Test getting CPU information."""
-        mock_cpu_count.return_value = 8
         mock_cpu_percent.return_value = 25.5
         
         cpu = get_cpu_info()
@@ -297,18 +379,49 @@ class TestSystemCheck:
         for tool in expected_tools:
             assert tool in REQUIRED_TOOLS
 
+    @patch('netops_mcp.utils.system_check.subprocess.run')
+    def test_check_privileged_access(self, mock_run):
+        """Test privilege probes report each command's result."""
+        mock_run.side_effect = lambda command, **kwargs: Mock(returncode=0 if command[0] in ('ping', 'arp') else 1)
+        
+        with patch('netops_mcp.utils.system_check.can_open_raw_socket', return_value=False):
+            checks = check_privileged_access()
+        
+        assert checks == {
+            'can_ping': True,
+            'can_traceroute': False,
+            'can_nmap': False,
+            'can_arp': True,
+            'can_raw_socket': False
+        }
+        assert mock_run.call_count == 4
+        # Probes only need the exit status, so output is discarded
+        assert mock_run.call_args.kwargs['stdout'] == subprocess.DEVNULL
+        assert mock_run.call_args.kwargs['stderr'] == subprocess.DEVNULL
+
     @patch('netops_mcp.utils.system_check.subprocess.run')
     def test_tool_check_with_version_flag(self, mock_run):
-        """Test that tool checking uses appropriate version flags."""
+        """Test that version checks use appropriate version flags."""
         mock_run.return_value = Mock(returncode=0, stdout=b"version info")
         
-        is_tool_available('curl')
+        get_tool_version('curl')
         
         # Check that the command includes --version or -V
         call_args = mock_run.call_args
         command = ' '.join(call_args[0][0])
         assert '--version' in command or '-V' in command
 
+    @patch('netops_mcp.utils.system_check.subprocess.run')
+    def test_get_tool_version_flag_table(self, mock_run):
+        """Test tools with non-standard version flags are looked up in the table."""
+        mock_run.return_value = Mock(returncode=0, stdout=b"ping from iputils\n")
+        
+        assert get_tool_version('ping') == "ping from iputils"
+        assert mock_run.call_args[0][0] == ['ping', '-V']
+        
+        get_tool_version('traceroute')
+        assert mock_run.call_args[0][0] == ['traceroute', '--version']
+
     def test_system_info_structure(self):
         """Test that system info has the correct structure."""
         info = get_system_info()
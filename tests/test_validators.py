@@ -0,0 +1,161 @@
+"""
+Tests for the input validators.
+"""
+
+import pytest
+import sys
+from netops_mcp.validators import (
+    validate_hostname,
+    validate_hosts,
+    validate_ip_address,
+    validate_ports,
+    validate_domain,
+    validate_url,
+    sanitize_command_arg,
+    ValidationError
+)
+from netops_mcp.validators.input_validator import validate_port_range, _parse_ip
+
+
+class TestInputValidator:
+    """Test input validation helpers."""
+
+    def test_validate_hostname_valid(self):
+        """Test multi-label hostnames and IP addresses are accepted."""
+        assert validate_hostname("example.com") == "example.com"
+        assert validate_hostname("  db-01.internal.example.com ") == "db-01.internal.example.com"
+        assert validate_hostname("192.168.1.1") == "192.168.1.1"
+        assert validate_hostname("::1") == "::1"
+        assert validate_hostname("db-01") == "db-01"
+
+    def test_validated_names_are_interned(self):
+        """Test validated names are interned so repeat lookups share one string."""
+        suffix = "internal.example.com"
+        assert validate_hostname("db." + suffix) is sys.intern("db.internal.example.com")
+        assert validate_domain("mail." + suffix) is sys.intern("mail.internal.example.com")
+        assert validate_ip_address(" 198.51.100.7 ") is sys.intern("198.51.100.7")
+
+    def test_validate_hostname_invalid(self):
+        """Test malformed hostnames are rejected."""
+        for hostname in ["-bad.example.com", "bad-.example.com", "a..b", ".example.com", "example.com.",
+                         "host;rm -rf /", "a" * 254, "a" * 64, "-db", "db-"]:
+            with pytest.raises(ValidationError):
+                validate_hostname(hostname)
+
+        with pytest.raises(ValidationError):
+            validate_hostname(None)
+
+        with pytest.raises(ValidationError):
+            validate_hostname("127.0.0.1", allow_localhost=False)
+
+    def test_validate_hosts(self):
+        """Test batch host validation reports every invalid entry at once."""
+        assert validate_hosts(["example.com", " 10.0.0.1 ", "db-01"]) == ["example.com", "10.0.0.1", "db-01"]
+
+        with pytest.raises(ValidationError, match=r"Invalid hosts: \['-bad', None\]"):
+            validate_hosts(["example.com", "-bad", None])
+
+        with pytest.raises(ValidationError):
+            validate_hosts(["127.0.0.1"], allow_localhost=False)
+
+    def test_validate_ports(self):
+        """Test batch port validation."""
+        assert validate_ports(iter([22, 80, 443])) == [22, 80, 443]
+
+        with pytest.raises(ValidationError, match=r"Invalid ports: \[0, 70000, '80'\]"):
+            validate_ports([22, 0, 70000, "80"])
+
+    def test_validate_ip_address(self):
+        """Test IP address validation."""
+        assert validate_ip_address("10.0.0.1") == "10.0.0.1"
+
+        assert validate_ip_address("2001:db8::1") == "2001:db8::1"
+        assert validate_ip_address("fe80::1%eth0") == "fe80::1%eth0"
+
+        for ip in ["999.1.1.1", "127.1", "010.0.0.1", "1"]:
+            with pytest.raises(ValidationError):
+                validate_ip_address(ip)
+
+        with pytest.raises(ValidationError):
+            validate_ip_address("10.0.0.1", allow_private=False)
+
+    def test_validate_ip_address_reuses_parse(self):
+        """Test restricted checks parse each address once and unrestricted ones not at all."""
+        _parse_ip.cache_clear()
+        
+        validate_ip_address("8.8.4.4")
+        assert _parse_ip.cache_info().misses == 0
+        
+        validate_ip_address(" 8.8.4.4 ", allow_private=False)
+        validate_hostname("8.8.4.4", allow_localhost=False)
+        
+        assert _parse_ip.cache_info().misses == 1
+        assert _parse_ip.cache_info().hits == 1
+
+    def test_validate_url(self):
+        """Test URL scheme and network location checks."""
+        assert validate_url("https://example.com/path?q=1") == "https://example.com/path?q=1"
+        assert validate_url("HTTP://[::1]:8080") == "HTTP://[::1]:8080"
+        assert validate_url("ftp://example.com", allowed_schemes={"ftp"}) == "ftp://example.com"
+
+        for url, message in [
+            ("example.com", "must have a scheme"),
+            ("ftp://example.com", r"scheme must be one of \['http', 'https'\]"),
+            ("http:example.com", "network location"),
+            ("https:///path", "network location"),
+            ("https://?q=1", "network location"),
+            ("https://example.com/$(id)", "invalid characters"),
+        ]:
+            with pytest.raises(ValidationError, match=message):
+                validate_url(url)
+
+    def test_validate_domain(self):
+        """Test domain validation accepts multi-label and single-label names."""
+        assert validate_domain("Example.COM") == "example.com"
+        assert validate_domain("intranet") == "intranet"
+
+        for domain in ["example .com", "example\t.com", "example\u00a0.com", "example$(id).com"]:
+            with pytest.raises(ValidationError, match="invalid characters"):
+                validate_domain(domain)
+
+        for domain in ["example.c0m", "example\\.com", "-intranet", "a.b.", ".example.com", "example..com"]:
+            with pytest.raises(ValidationError):
+                validate_domain(domain)
+
+    def test_sanitize_command_arg(self):
+        """Test command injection patterns are rejected."""
+        assert sanitize_command_arg("-p 80") == "-p 80"
+        assert sanitize_command_arg("") == ""
+        assert sanitize_command_arg("a&b") == "a&b"
+
+        with pytest.raises(ValidationError, match="null bytes"):
+            sanitize_command_arg("a\x00b")
+
+        with pytest.raises(ValidationError, match="dangerous pattern"):
+            sanitize_command_arg("x; rm -rf /")
+
+        for arg in ["a | grep x", "a && b", "`id`", "$(id)", "> /tmp/out", "< /etc/passwd"]:
+            with pytest.raises(ValidationError, match="dangerous pattern"):
+                sanitize_command_arg(arg)
+
+        with pytest.raises(ValidationError, match=r"pattern: `\[\^`\]\*`"):
+            sanitize_command_arg("echo `id`")
+
+    def test_validate_port_range(self):
+        """Test port range validation."""
+        assert validate_port_range("22,80-443") == "22,80-443"
+
+        with pytest.raises(ValidationError, match="start > end"):
+            validate_port_range("443-80")
+
+        for port_range in ["0", "80-70000", "80,,443"]:
+            with pytest.raises(ValidationError):
+                validate_port_range(port_range)
+
+        for port_range in ["80-90-100", "-80", "80-"]:
+            with pytest.raises(ValidationError, match="Invalid port range format"):
+                validate_port_range(port_range)
+
+        for port_range in ["80;443", "80 443", "80\n443"]:
+            with pytest.raises(ValidationError, match="invalid characters"):
+                validate_port_range(port_range)